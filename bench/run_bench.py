@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark der gesamten Pipeline auf synthetischen Ligen.
+
+  python bench/run_bench.py                       # Standard-Skalen, Ergebnis nach bench/results.json
+  python bench/run_bench.py --scales tiny,small --out /tmp/new.json --compare bench/results.json
+
+Je Skala wird bench/synth_league.py in ein Temp-Verzeichnis generiert und pro Liga
+parse_weeks.run_all -> draft_value.run_all -> build_json.run -> compute_elo.main -> aggregate_standings -> aggregate_playoffs
+ausgeführt. Zeit = Summe über alle Ligen; Speicher = tracemalloc-Peak je Stufe (an Liga 0 gemessen).
+Mit --compare wird gegen eine frühere Ergebnisdatei verglichen; Regressionen -> Exit-Code 1.
+"""
+import argparse, contextlib, io, json, os, platform, runpy, shutil, sys, tempfile, time, tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "etl"), str(ROOT / "scripts"), str(ROOT / "bench")]
+
+from synth_league import generate  # noqa: E402
+
+# name -> (leagues, teams, seasons)
+SCALES = {
+    "tiny":   (1, 8, 1),
+    "small":  (1, 8, 11),
+    "medium": (10, 10, 11),
+    "large":  (50, 12, 25),
+    "xl":     (200, 12, 25),
+}
+DEFAULT_SCALES = "tiny,small,medium"
+THRESHOLD = 0.20      # +20 % gilt als Regression ...
+MIN_DELTA_S = 0.05    # ... aber nur ab 50 ms absolut (Messrauschen)
+MIN_DELTA_KB = 256
+REPEAT = 3            # Zeit = Minimum aus REPEAT Läufen je Stufe und Liga
+
+def _stages(first_season, seasons):
+    import parse_weeks, build_json, compute_elo, draft_value
+    years = range(first_season, first_season + seasons)
+    return [
+        ("parse_weeks", lambda: parse_weeks.run_all(years)),
+        ("draft_value", lambda: draft_value.run_all(years)),
+        ("build_json", build_json.run),
+        ("compute_elo", compute_elo.main),
+        ("aggregate_standings", lambda: runpy.run_path(str(ROOT / "scripts" / "aggregate_standings.py"), run_name="__main__")),
+        ("aggregate_playoffs", lambda: runpy.run_path(str(ROOT / "scripts" / "aggregate_playoffs.py"), run_name="__main__")),
+    ]
+
+def _run(fn, trace_memory):
+    """Führt eine Stufe aus (stdout verschluckt); gibt (Sekunden, Peak-KB oder None, Fehler oder None) zurück."""
+    if trace_memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    err = None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+    except BaseException as e:   # SystemExit der Aggregat-Skripte, fehlendes pandas, ...
+        err = f"{type(e).__name__}: {e}"
+    secs = time.perf_counter() - t0
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    return secs, peak, err
+
+def bench_scale(name, leagues, teams, seasons, first_season=2015, repeat=REPEAT):
+    tmp = Path(tempfile.mkdtemp(prefix=f"ffbench-{name}-"))
+    cwd = os.getcwd()
+    try:
+        t0 = time.perf_counter()
+        dirs = generate(tmp, leagues, teams, seasons, first_season)
+        gen_s = time.perf_counter() - t0
+        stages = {}
+        for i, league_dir in enumerate(dirs):
+            os.chdir(league_dir)
+            for stage, fn in _stages(first_season, seasons):
+                # Zeitmessung ohne tracemalloc-Overhead; Speicher separat an Liga 0
+                runs = [_run(fn, False) for _ in range(max(1, repeat))]
+                secs, err = min(r[0] for r in runs), runs[0][2]
+                st = stages.setdefault(stage, {"seconds": 0.0, "peak_kb": None, "error": None})
+                st["seconds"] += secs
+                st["error"] = st["error"] or err
+                if i == 0 and err is None:
+                    _, st["peak_kb"], _ = _run(fn, True)
+        for st in stages.values():
+            st["seconds"] = round(st["seconds"], 4)
+        return {"leagues": leagues, "teams": teams, "seasons": seasons,
+                "generate_seconds": round(gen_s, 3), "stages": stages}
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def compare(new, old, threshold=THRESHOLD):
+    """Liste von Regressionen (Strings) zwischen zwei Ergebnisdateien."""
+    out = []
+    for scale, res in new["scales"].items():
+        prev = old.get("scales", {}).get(scale)
+        if not prev:
+            continue
+        for stage, st in res["stages"].items():
+            p = prev["stages"].get(stage)
+            if not p or st["error"] or p.get("error"):
+                continue
+            if st["seconds"] > p["seconds"] * (1 + threshold) and st["seconds"] - p["seconds"] > MIN_DELTA_S:
+                out.append(f"{scale}/{stage}: Zeit {p['seconds']:.3f}s -> {st['seconds']:.3f}s")
+            if st["peak_kb"] and p.get("peak_kb") and st["peak_kb"] > p["peak_kb"] * (1 + threshold) \
+                    and st["peak_kb"] - p["peak_kb"] > MIN_DELTA_KB:
+                out.append(f"{scale}/{stage}: Speicher {p['peak_kb']} KB -> {st['peak_kb']} KB")
+    return out
+
+def print_table(results):
+    print(f"{'scale':<8} {'stage':<20} {'seconds':>9} {'peak KB':>9}  error")
+    for scale, res in results["scales"].items():
+        for stage, st in res["stages"].items():
+            peak = "" if st["peak_kb"] is None else st["peak_kb"]
+            print(f"{scale:<8} {stage:<20} {st['seconds']:>9.3f} {peak:>9}  {st['error'] or ''}")
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--scales", default=DEFAULT_SCALES, help=f"Kommaliste aus {', '.join(SCALES)}")
+    ap.add_argument("--out", type=Path, default=ROOT / "bench" / "results.json")
+    ap.add_argument("--compare", type=Path, help="frühere Ergebnisdatei für den Regressionsvergleich")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD)
+    ap.add_argument("--repeat", type=int, default=REPEAT)
+    args = ap.parse_args()
+
+    old = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare and args.compare.exists() else None
+    results = {"python": platform.python_version(), "platform": platform.platform(),
+               "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "scales": {}}
+    for name in [s.strip() for s in args.scales.split(",") if s.strip()]:
+        if name not in SCALES:
+            raise SystemExit(f"Unbekannte Skala: {name}")
+        print(f"… {name} {SCALES[name]}")
+        results["scales"][name] = bench_scale(name, *SCALES[name], repeat=args.repeat)
+
+    print_table(results)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"✓ Ergebnisse: {args.out}")
+
+    if old is not None:
+        regressions = compare(results, old, args.threshold)
+        for r in regressions:
+            print(f"✗ Regression {r}")
+        if regressions:
+            raise SystemExit(1)
+        print("✓ keine Regressionen")
+
+if __name__ == "__main__":
+    main()
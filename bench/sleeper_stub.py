@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Lokaler Stand-in für die Sleeper-API (Offline-/Lasttests der Sleeper-Scraper).
+
+  python bench/sleeper_stub.py --port 8787 --latency-ms 40 --jitter-ms 20 --error-rate 0.01 --rate-429 0.02
+  SLEEPER_API_BASE=http://127.0.0.1:8787/v1 SLEEPER_LEAGUE_ID=5000 python scrapeSleeperGamecenter.py
+
+Implementierte Endpoints (wie https://api.sleeper.app/v1):
+  /league/<id>  /league/<id>/users  /league/<id>/rosters  /league/<id>/matchups/<week>
+  /league/<id>/transactions/<week>  /league/<id>/drafts  /draft/<draft_id>/picks
+  /league/<id>/winners_bracket  /league/<id>/losers_bracket  /players/nfl
+  /user/<user_id>/leagues/nfl/<season>
+  /_stats  (Request-Zähler je Endpoint-Klasse; kein Sleeper-Endpoint)
+
+Fixtures:
+  - generiert (Default): jede numerische League-ID liefert eine deterministische Liga.
+    Kette: idx = id % 1000, season = --base-season - idx, previous_league_id = id+1 solange idx+1 < --seasons.
+    Beispiel --seasons 3: 5000 (2025) -> 5001 (2024) -> 5002 (2023).
+  - aufgezeichnet: --fixtures DIR liest DIR/<pfad>.json (z. B. DIR/league/123/matchups/1.json) und fällt
+    sonst auf generierte Daten zurück. --record URL holt fehlende Pfade einmal von URL und legt sie in DIR ab.
+"""
+import argparse, json, random, re, threading, time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.request import urlopen
+
+N_TEAMS = 8
+REG_WEEKS = 14
+PLAYOFF_WEEK_START = 15
+ROSTER_POSITIONS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"] + ["BN"] * 7
+ROSTER_MIX = {"QB": 2, "RB": 5, "WR": 5, "TE": 2, "K": 1, "DEF": 1}
+POS_MEAN = {"QB": 18.0, "RB": 10.0, "WR": 10.0, "TE": 7.0, "K": 8.0, "DEF": 7.0}
+NFL_TEAMS = ["ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB",
+             "HOU", "IND", "JAX", "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+             "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS"]
+DEF_NAMES = ["Cardinals", "Falcons", "Ravens", "Bills", "Panthers", "Bears", "Bengals", "Browns",
+             "Cowboys", "Broncos", "Lions", "Packers", "Texans", "Colts", "Jaguars", "Chiefs",
+             "Chargers", "Rams", "Raiders", "Dolphins", "Vikings", "Patriots", "Saints", "Giants",
+             "Jets", "Eagles", "Steelers", "Seahawks", "49ers", "Buccaneers", "Titans", "Commanders"]
+FIRST = ["Aaron", "Brandon", "Cam", "Derrick", "Evan", "Frank", "Jalen", "Josh", "Kyle", "Mike", "Nick", "Tyler"]
+LAST = ["Adams", "Brown", "Cook", "Davis", "Evans", "Fields", "Green", "Hill", "Jones", "King",
+        "Lamb", "Moore", "Smith", "Taylor", "Walker", "Young"]
+
+# ---------------- Generierte Fixtures ----------------
+class FakeSleeper:
+    def __init__(self, n_players=2000, seasons=1, base_season=2025, teams=N_TEAMS):
+        self.seasons = seasons
+        self.base_season = base_season
+        self.teams = teams
+        self.players = self._players(n_players)
+        self.by_pos = {}
+        for pid, p in self.players.items():
+            self.by_pos.setdefault(p["position"], []).append(pid)
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _players(n):
+        rng = random.Random(0)
+        # DEF wie bei Sleeper: ID = Teamkürzel, last_name = Nickname, kein full_name
+        out = {t: {"player_id": t, "position": "DEF", "team": t, "first_name": t, "last_name": nick}
+               for t, nick in zip(NFL_TEAMS, DEF_NAMES)}
+        positions = ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "K"]
+        for i in range(1, n + 1):
+            first, last = rng.choice(FIRST), f"{rng.choice(LAST)}{i}"
+            out[str(i)] = {"player_id": str(i), "position": positions[i % len(positions)],
+                           "team": rng.choice(NFL_TEAMS), "first_name": first, "last_name": last,
+                           "full_name": f"{first} {last}"}
+        return out
+
+    # Liga-Grunddaten (Nutzer, Kader, Spielplan) einmal je League-ID erzeugen
+    def league_state(self, league_id):
+        with self._lock:
+            st = self._cache.get(league_id)
+            if st is None:
+                st = self._cache[league_id] = self._build_league(league_id)
+            return st
+
+    def _build_league(self, league_id):
+        lid = int(league_id) if league_id.isdigit() else sum(map(ord, league_id))
+        idx = lid % 1000
+        rng = random.Random(lid)
+        users = [{"user_id": f"u{lid % 1000000}_{i}", "display_name": f"user{i}",
+                  "metadata": {"team_name": f"Team {i}"}} for i in range(self.teams)]
+        rosters, taken = [], set()
+        for i, u in enumerate(users):
+            players = []
+            for pos, n in ROSTER_MIX.items():
+                pool = [p for p in self.by_pos[pos] if p not in taken]
+                pick = rng.sample(pool, n)
+                taken.update(pick)
+                players.extend(pick)
+            rosters.append({"roster_id": i + 1, "owner_id": u["user_id"], "players": players,
+                            "settings": {"wins": 0, "losses": 0}})
+        order = list(range(1, self.teams + 1))
+        rng.shuffle(order)
+        league = {
+            "league_id": league_id, "name": f"Stub League {league_id}", "sport": "nfl",
+            "season": str(self.base_season - idx), "status": "complete", "total_rosters": self.teams,
+            "previous_league_id": str(lid + 1) if idx + 1 < self.seasons else None,
+            "draft_id": f"{league_id}0", "roster_positions": ROSTER_POSITIONS,
+            "settings": {"playoff_week_start": PLAYOFF_WEEK_START, "playoff_teams": 8, "num_teams": self.teams},
+        }
+        return {"lid": lid, "league": league, "users": users, "rosters": rosters,
+                "draft_order": {u["user_id"]: order[i] for i, u in enumerate(users)}}
+
+    def _round(self, week):
+        ts = list(range(1, self.teams + 1))
+        n = len(ts)
+        for _ in range((week - 1) % (n - 1)):
+            ts = [ts[0]] + [ts[-1]] + ts[1:-1]
+        return [(ts[i], ts[n - 1 - i]) for i in range(n // 2)]
+
+    def matchups(self, league_id, week):
+        st = self.league_state(league_id)
+        rng = random.Random(st["lid"] * 100 + week)
+        out = []
+        for mid, pair in enumerate(self._round(week), start=1):
+            for rid in pair:
+                r = st["rosters"][rid - 1]
+                pts = {pid: round(max(0.0, rng.gauss(POS_MEAN[self.players[pid]["position"]], 4.0)), 2)
+                       for pid in r["players"]}
+                starters = self._starters(r["players"], pts)
+                out.append({"roster_id": rid, "matchup_id": mid, "starters": starters,
+                            "players": r["players"], "players_points": pts,
+                            "starters_points": [pts[p] for p in starters],
+                            "points": round(sum(pts[p] for p in starters), 2), "custom_points": None})
+        return out
+
+    def _starters(self, players, pts):
+        by_pos = {}
+        for pid in sorted(players, key=lambda p: -pts[p]):
+            by_pos.setdefault(self.players[pid]["position"], []).append(pid)
+        starters = []
+        for slot in ROSTER_POSITIONS:
+            if slot == "BN":
+                continue
+            if slot == "FLEX":
+                cands = [p for pos in ("RB", "WR", "TE") for p in by_pos.get(pos, []) if p not in starters]
+                cands.sort(key=lambda p: -pts[p])
+            else:
+                cands = [p for p in by_pos.get(slot, []) if p not in starters]
+            starters.append(cands[0] if cands else "0")
+        return starters
+
+    def transactions(self, league_id, week):
+        st = self.league_state(league_id)
+        rng = random.Random(st["lid"] * 1000 + week)
+        free = [p for p in self.players if not any(p in r["players"] for r in st["rosters"])]
+        out = []
+        for n in range(rng.randint(1, 6)):
+            r = rng.choice(st["rosters"])
+            ttype = rng.choice(["waiver", "free_agent", "free_agent", "trade"] if n else ["waiver"])
+            tx = {"transaction_id": f"{st['lid']}{week:02d}{n:02d}", "type": ttype, "status": "complete",
+                  "leg": week, "creator": r["owner_id"], "created": 1700000000000 + week * 604800000 + n,
+                  "roster_ids": [r["roster_id"]], "adds": None, "drops": None}
+            if ttype == "trade":
+                o = rng.choice([x for x in st["rosters"] if x is not r])
+                a, b = rng.choice(r["players"]), rng.choice(o["players"])
+                tx["roster_ids"] = [r["roster_id"], o["roster_id"]]
+                tx["adds"] = {b: r["roster_id"], a: o["roster_id"]}
+                tx["drops"] = {a: r["roster_id"], b: o["roster_id"]}
+            else:
+                tx["adds"] = {rng.choice(free): r["roster_id"]}
+                tx["drops"] = {rng.choice(r["players"]): r["roster_id"]}
+                if ttype == "waiver":
+                    tx["settings"] = {"waiver_bid": rng.randint(0, 30)}
+            out.append(tx)
+        return out
+
+    def drafts(self, league_id):
+        st = self.league_state(league_id)
+        lg = st["league"]
+        return [{"draft_id": lg["draft_id"], "league_id": league_id, "season": lg["season"], "type": "snake",
+                 "status": "complete", "draft_order": st["draft_order"],
+                 "settings": {"teams": self.teams, "rounds": len(ROSTER_POSITIONS)}}]
+
+    def draft_picks(self, draft_id):
+        league_id = draft_id[:-1]
+        st = self.league_state(league_id)
+        slot_to_user = {slot: uid for uid, slot in st["draft_order"].items()}
+        user_to_roster = {r["owner_id"]: r for r in st["rosters"]}
+        picks, n = [], self.teams
+        for rnd in range(1, len(ROSTER_POSITIONS) + 1):
+            slots = range(1, n + 1) if rnd % 2 else range(n, 0, -1)
+            for i, slot in enumerate(slots):
+                uid = slot_to_user[slot]
+                r = user_to_roster[uid]
+                pid = r["players"][rnd - 1] if rnd - 1 < len(r["players"]) else None
+                picks.append({"round": rnd, "pick_no": (rnd - 1) * n + i + 1, "draft_slot": slot,
+                              "picked_by": uid, "roster_id": r["roster_id"], "player_id": pid,
+                              "draft_id": draft_id, "is_keeper": None, "metadata": {}})
+        return picks
+
+    def _bracket(self, league_id, losers):
+        st = self.league_state(league_id)
+        w15, w16 = self.matchups(league_id, 15), self.matchups(league_id, 16)
+        p15 = {e["roster_id"]: e["points"] for e in w15}
+        p16 = {e["roster_id"]: e["points"] for e in w16}
+        seeds = [r["roster_id"] for r in st["rosters"]]
+        seeds = seeds[4:8] if losers else seeds[:4]
+        win = lambda a, b, p: (a, b) if p[a] >= p[b] else (b, a)
+        (w1, l1), (w2, l2) = win(seeds[0], seeds[3], p15), win(seeds[1], seeds[2], p15)
+        fw, fl = win(w1, w2, p16)
+        cw, cl = win(l1, l2, p16)
+        return [{"r": 1, "m": 1, "t1": seeds[0], "t2": seeds[3], "w": w1, "l": l1},
+                {"r": 1, "m": 2, "t1": seeds[1], "t2": seeds[2], "w": w2, "l": l2},
+                {"r": 2, "m": 3, "t1": w1, "t2": w2, "w": fw, "l": fl, "t1_from": {"w": 1}, "t2_from": {"w": 2}, "p": 1},
+                {"r": 2, "m": 4, "t1": l1, "t2": l2, "w": cw, "l": cl, "t1_from": {"l": 1}, "t2_from": {"l": 2}, "p": 3}]
+
+    def user_leagues(self, user_id, season):
+        m = re.match(r"^u(\d+)_\d+$", user_id)
+        lid = int(m.group(1)) if m else 5000
+        return [self.league_state(str(lid))["league"]]
+
+    def route(self, path):
+        """Pfad (ohne /v1) -> JSON-Payload; LookupError bei unbekanntem Pfad."""
+        parts = [p for p in path.split("/") if p]
+        if parts == ["players", "nfl"]:
+            return self.players
+        if len(parts) >= 2 and parts[0] == "league":
+            lid, rest = parts[1], parts[2:]
+            if not rest:
+                return self.league_state(lid)["league"]
+            if rest == ["users"]:
+                return self.league_state(lid)["users"]
+            if rest == ["rosters"]:
+                return self.league_state(lid)["rosters"]
+            if len(rest) == 2 and rest[0] == "matchups" and rest[1].isdigit():
+                w = int(rest[1])
+                return self.matchups(lid, w) if 1 <= w <= 18 else []
+            if len(rest) == 2 and rest[0] == "transactions" and rest[1].isdigit():
+                return self.transactions(lid, int(rest[1]))
+            if rest == ["drafts"]:
+                return self.drafts(lid)
+            if rest == ["winners_bracket"]:
+                return self._bracket(lid, False)
+            if rest == ["losers_bracket"]:
+                return self._bracket(lid, True)
+        if len(parts) == 3 and parts[0] == "draft" and parts[2] == "picks":
+            return self.draft_picks(parts[1])
+        if len(parts) == 5 and parts[0] == "user" and parts[2] == "leagues":
+            return self.user_leagues(parts[1], parts[4])
+        raise LookupError(path)
+
+def endpoint_class(path):
+    """'/league/123/matchups/4' -> 'league/matchups' (für Statistiken)."""
+    return "/".join(p for p in path.strip("/").split("/") if not p.isdigit() and not re.match(r"^u?\d+", p)) or "/"
+
+# ---------------- HTTP ----------------
+class StubConfig:
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, rate_429=0.0, retry_after=1,
+                 fixtures=None, record=None, seed=None):
+        self.latency_ms, self.jitter_ms = latency_ms, jitter_ms
+        self.error_rate, self.rate_429, self.retry_after = error_rate, rate_429, retry_after
+        self.fixtures = Path(fixtures) if fixtures else None
+        self.record = record.rstrip("/") if record else None
+        self.rng = random.Random(seed)
+        self.stats = Counter()
+        self.lock = threading.Lock()
+
+def make_handler(fake: FakeSleeper, cfg: StubConfig):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, status, body: bytes, extra=None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (extra or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _fixture(self, path):
+            if not cfg.fixtures:
+                return None
+            f = cfg.fixtures / (path.strip("/") + ".json")
+            if f.exists():
+                return f.read_bytes()
+            if cfg.record:
+                with urlopen(cfg.record + path, timeout=60) as r:
+                    body = r.read()
+                f.parent.mkdir(parents=True, exist_ok=True)
+                f.write_bytes(body)
+                return body
+            return None
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path.startswith("/v1"):
+                path = path[3:]
+            if path == "/_stats":
+                with cfg.lock:
+                    return self._send(200, json.dumps(dict(cfg.stats)).encode("utf-8"))
+            with cfg.lock:
+                cfg.stats[endpoint_class(path)] += 1
+                roll = cfg.rng.random()
+                delay = max(0.0, cfg.rng.gauss(cfg.latency_ms, cfg.jitter_ms)) / 1000.0 if cfg.latency_ms else 0.0
+            if delay:
+                time.sleep(delay)
+            if roll < cfg.rate_429:
+                with cfg.lock:
+                    cfg.stats["_429"] += 1
+                return self._send(429, b'{"error":"rate limited"}', {"Retry-After": str(cfg.retry_after)})
+            if roll < cfg.rate_429 + cfg.error_rate:
+                with cfg.lock:
+                    cfg.stats["_5xx"] += 1
+                return self._send(500, b'{"error":"injected"}')
+            body = self._fixture(path)
+            if body is None:
+                try:
+                    body = json.dumps(fake.route(path)).encode("utf-8")
+                except LookupError:
+                    return self._send(404, b"null")
+            self._send(200, body)
+    return Handler
+
+def serve(host="127.0.0.1", port=8787, fake=None, cfg=None):
+    """Startet den Stub (nicht blockierend ist Sache des Aufrufers: httpd.serve_forever in einem Thread)."""
+    fake = fake or FakeSleeper()
+    cfg = cfg or StubConfig()
+    httpd = ThreadingHTTPServer((host, port), make_handler(fake, cfg))
+    httpd.daemon_threads = True
+    return httpd
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8787)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Anteil 500er (0..1)")
+    ap.add_argument("--rate-429", type=float, default=0.0, help="Anteil 429er mit Retry-After (0..1)")
+    ap.add_argument("--retry-after", type=int, default=1)
+    ap.add_argument("--seasons", type=int, default=1, help="Länge der previous_league_id-Kette")
+    ap.add_argument("--base-season", type=int, default=2025)
+    ap.add_argument("--teams", type=int, default=N_TEAMS)
+    ap.add_argument("--players", type=int, default=2000, help="Größe der /players/nfl-Datenbank")
+    ap.add_argument("--fixtures", type=Path, help="Verzeichnis mit aufgezeichneten Antworten")
+    ap.add_argument("--record", help="Basis-URL (z. B. https://api.sleeper.app/v1) für fehlende Fixtures")
+    ap.add_argument("--seed", type=int)
+    args = ap.parse_args()
+
+    fake = FakeSleeper(args.players, args.seasons, args.base_season, args.teams)
+    cfg = StubConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_429, args.retry_after,
+                     args.fixtures, args.record, args.seed)
+    httpd = serve(args.host, args.port, fake, cfg)
+    print(f"✓ Sleeper-Stub auf http://{args.host}:{args.port}/v1 "
+          f"(latency={args.latency_ms}±{args.jitter_ms} ms, 5xx={args.error_rate}, 429={args.rate_429})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Synthetischer Liga-Generator für Benchmarks.
+
+Schreibt pro Liga ein eigenes Arbeitsverzeichnis mit exakt den Formaten, die die Pipeline liest:
+  <root>/league-<n>/output/teamgamecenter/<season>/<week>.csv
+  <root>/league-<n>/output/history-standings/<season>.tsv + playoffs-<season>.tsv
+  (gespiegelt nach output/3082897-history-standings/ für die Aggregat-Skripte)
+  <root>/league-<n>/output/history-drafts/<season>-draft.tsv
+
+  python bench/synth_league.py --root /tmp/ffbench --leagues 2 --teams 8 --seasons 3
+"""
+import argparse, csv, random
+from pathlib import Path
+
+REG_WEEKS = 14
+PLAYOFF_WEEKS = (15, 16)
+BENCH_SLOTS = 7
+STARTER_SLOTS = ["QB", "RB", "RB", "WR", "WR", "TE", "W/R", "K", "DEF"]
+HEADER = (["Owner", "Rank"]
+          + [x for s in STARTER_SLOTS for x in (s, "Points")]
+          + [x for _ in range(BENCH_SLOTS) for x in ("BN", "Points")]
+          + ["Total", "Opponent", "Opponent Total"])
+STANDINGS_HEADER = ["TeamName", "RegularSeasonRank", "Record", "PointsFor", "PointsAgainst",
+                    "PlayoffRank", "ManagerName", "Moves", "Trades", "DraftPosition"]
+PLAYOFF_HEADER = ["TeamName", "PlayoffRank", "ManagerName", "Seed", "Week15Pts", "Week16Pts"]
+DRAFT_HEADER = ["Round", "Overall", "PickInRound", "ManagerName", "Player", "Pos", "NFLTeam"]
+DRAFT_POS_ORDER = ["RB", "WR", "QB", "TE", "DEF", "K"]
+# Die Aggregat-Skripte lesen (noch) aus dem historischen Liga-Verzeichnis
+STANDINGS_DIRS = ("output/history-standings", "output/3082897-history-standings")
+
+NFL_TEAMS = ["ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB",
+             "HOU", "IND", "JAX", "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+             "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS"]
+DEF_NAMES = ["Cardinals", "Falcons", "Ravens", "Bills", "Panthers", "Bears", "Bengals", "Browns",
+             "Cowboys", "Broncos", "Lions", "Packers", "Texans", "Colts", "Jaguars", "Chiefs",
+             "Chargers", "Rams", "Raiders", "Dolphins", "Vikings", "Patriots", "Saints", "Giants",
+             "Jets", "Eagles", "Steelers", "Seahawks", "49ers", "Buccaneers", "Titans", "Commanders"]
+# Mittelwert der Wochenpunkte je Position
+POS_MEAN = {"QB": 18.0, "RB": 10.0, "WR": 10.0, "TE": 7.0, "K": 8.0, "DEF": 7.0}
+ROSTER = {"QB": 2, "RB": 5, "WR": 5, "TE": 2, "K": 1, "DEF": 1}
+
+def _fmt(x):
+    return f"{x:,.2f}"
+
+def _round_robin(teams):
+    """Circle-Methode: Liste von Runden, jede Runde = Liste von (a, b)."""
+    ts = list(teams) + ([None] if len(teams) % 2 else [])
+    n, rounds = len(ts), []
+    for _ in range(n - 1):
+        rounds.append([(ts[i], ts[n - 1 - i]) for i in range(n // 2) if ts[i] and ts[n - 1 - i]])
+        ts = [ts[0]] + [ts[-1]] + ts[1:-1]
+    return rounds
+
+def _player_pool(rng, size):
+    first = "ABCDJKMNRST"
+    last = ["Adams", "Brown", "Cook", "Davis", "Evans", "Fields", "Green", "Hill", "Irving", "Jones",
+            "King", "Lamb", "Moore", "Nacua", "Olave", "Pitts", "Quinn", "Ridley", "Smith", "Taylor",
+            "Usher", "Vance", "Walker", "Young", "Zeller"]
+    pool = {}
+    for pos in ("QB", "RB", "WR", "TE", "K"):
+        pool[pos] = [f"{rng.choice(first)}. {rng.choice(last)}{i} {pos} - {rng.choice(NFL_TEAMS)}"
+                     for i in range(size)]
+    pool["DEF"] = [f"{d} DEF" for d in DEF_NAMES]
+    return pool
+
+def _draft_rosters(rng, owners, pool):
+    """Jeder Spieler steht in genau einem Kader (wie nach einem echten Draft)."""
+    left = {pos: rng.sample(players, len(players)) for pos, players in pool.items()}
+    return {o: {pos: [left[pos].pop() for _ in range(n)] for pos, n in ROSTER.items()} for o in owners}
+
+def _lineup(rng, roster):
+    """Starter/Bench je Slot inkl. Punkte; Total = Summe der Starter."""
+    pts = {p: max(0.0, round(rng.gauss(POS_MEAN[pos], POS_MEAN[pos] * 0.5), 2))
+           for pos, players in roster.items() for p in players}
+    starters, used = [], set()
+    for slot in STARTER_SLOTS:
+        if slot == "W/R":
+            cands = [p for pos in ("RB", "WR", "TE") for p in roster[pos] if p not in used]
+        else:
+            cands = [p for p in roster[slot] if p not in used]
+        p = cands[0] if cands else ""
+        used.add(p)
+        starters.append((p, pts.get(p, 0.0) if p else 0.0))
+    bench = [(p, pts[p]) for players in roster.values() for p in players if p not in used][:BENCH_SLOTS]
+    bench += [("", "")] * (BENCH_SLOTS - len(bench))
+    total = round(sum(x for _, x in starters), 2)
+    return starters, bench, total
+
+def _write_week(path, games, lineups):
+    totals = {o: lineups[o][2] for o in lineups}
+    ranks = {t: i + 1 for i, t in enumerate(sorted(set(totals.values()), reverse=True))}
+    opp = {}
+    for a, b in games:
+        opp[a], opp[b] = b, a
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(HEADER)
+        for o in sorted(lineups):
+            starters, bench, total = lineups[o]
+            row = [o, ranks[total]]
+            for p, x in starters + bench:
+                row.extend([p, x])
+            row.extend([total, opp.get(o, "—"), totals.get(opp.get(o), "")])
+            w.writerow(row)
+
+def _write_draft(path, owners_by_slot, rosters):
+    """Snake-Draft aus den Kadern (ohne weitere Zufallszüge, damit die übrigen Daten gleich bleiben)."""
+    queues = {o: [p for pos in DRAFT_POS_ORDER for p in rosters[o][pos]] for o in owners_by_slot}
+    rounds = max(len(q) for q in queues.values())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, delimiter="\t")
+        w.writerow(DRAFT_HEADER)
+        overall = 0
+        for rnd in range(1, rounds + 1):
+            order = owners_by_slot if rnd % 2 else owners_by_slot[::-1]
+            for i, o in enumerate(order, start=1):
+                if not queues[o]:
+                    continue
+                raw = queues[o].pop(0)
+                overall += 1
+                if raw.endswith(" DEF"):
+                    name, pos, team = raw[:-4], "DEF", ""
+                else:
+                    head, team = raw.split(" - ")
+                    name, pos = head.rsplit(" ", 1)
+                w.writerow([rnd, overall, i, o, name, pos, team])
+
+def generate_season(league_dir: Path, season: int, owners, rng, pool_size=60):
+    pool = _player_pool(rng, max(pool_size, len(owners) * max(ROSTER.values())))
+    rosters = _draft_rosters(rng, owners, pool)
+    rounds = _round_robin(owners)
+    stats = {o: {"W": 0, "L": 0, "T": 0, "PF": 0.0, "PA": 0.0} for o in owners}
+    season_dir = league_dir / "output" / "teamgamecenter" / str(season)
+    season_dir.mkdir(parents=True, exist_ok=True)
+    week_totals = {}
+
+    for week in range(1, max(PLAYOFF_WEEKS) + 1):
+        lineups = {o: _lineup(rng, rosters[o]) for o in owners}
+        week_totals[week] = {o: lineups[o][2] for o in owners}
+        games = rounds[(week - 1) % len(rounds)]
+        if week <= REG_WEEKS:
+            for a, b in games:
+                ap, bp = lineups[a][2], lineups[b][2]
+                stats[a]["PF"] += ap; stats[a]["PA"] += bp
+                stats[b]["PF"] += bp; stats[b]["PA"] += ap
+                if ap > bp: stats[a]["W"] += 1; stats[b]["L"] += 1
+                elif bp > ap: stats[b]["W"] += 1; stats[a]["L"] += 1
+                else: stats[a]["T"] += 1; stats[b]["T"] += 1
+        _write_week(season_dir / f"{week}.csv", games, lineups)
+
+    order = sorted(owners, key=lambda o: (-stats[o]["W"], -stats[o]["PF"], o))
+    seeds = order[:8]
+    playoff_rank = {o: i + 1 for i, o in enumerate(seeds)}   # vereinfachtes Finale nach Seed
+    draft = rng.sample(range(1, len(owners) + 1), len(owners))
+    owners_by_slot = [o for _, o in sorted(zip(draft, order))]
+    _write_draft(league_dir / "output" / "history-drafts" / f"{season}-draft.tsv", owners_by_slot, rosters)
+
+    for d in STANDINGS_DIRS:
+        hist = league_dir / d
+        hist.mkdir(parents=True, exist_ok=True)
+        with (hist / f"{season}.tsv").open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f, delimiter="\t")
+            w.writerow(STANDINGS_HEADER)
+            for i, o in enumerate(order):
+                s = stats[o]
+                w.writerow([o, i + 1, f"{s['W']}-{s['L']}-{s['T']}", _fmt(s["PF"]), _fmt(s["PA"]),
+                            playoff_rank.get(o, ""), o, rng.randint(0, 60), rng.randint(0, 4), draft[i]])
+        with (hist / f"playoffs-{season}.tsv").open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f, delimiter="\t")
+            w.writerow(PLAYOFF_HEADER)
+            for o in seeds:
+                w.writerow([o, playoff_rank[o], o, order.index(o) + 1,
+                            f"{week_totals[15][o]:.2f}", f"{week_totals[16][o]:.2f}"])
+
+def generate(root: Path, leagues=1, teams=8, seasons=1, first_season=2015, seed=42):
+    """Erzeugt `leagues` Ligen à `teams` Manager und `seasons` Saisons; gibt die Liga-Verzeichnisse zurück."""
+    rng = random.Random(seed)
+    dirs = []
+    for n in range(leagues):
+        league_dir = root / f"league-{n}"
+        owners = [f"Manager{n}_{i}" for i in range(teams)]
+        for season in range(first_season, first_season + seasons):
+            generate_season(league_dir, season, owners, rng)
+        dirs.append(league_dir)
+    return dirs
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--root", type=Path, required=True)
+    ap.add_argument("--leagues", type=int, default=1)
+    ap.add_argument("--teams", type=int, default=8)
+    ap.add_argument("--seasons", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+    dirs = generate(args.root, args.leagues, args.teams, args.seasons, seed=args.seed)
+    print(f"✓ {len(dirs)} Liga(en) × {args.seasons} Saison(s) unter {args.root}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
-leagueID = "3082897"
-leagueStartYear = 2020
-leagueEndYear = 2022
+import os
+
+# per Umgebung überschreibbar (z. B. vom Multi-Liga-Runner scripts/run_leagues.py)
+leagueID = os.getenv("NFL_LEAGUE_ID", "3082897")
+leagueStartYear = int(os.getenv("LEAGUE_START_YEAR", "2020"))
+leagueEndYear = int(os.getenv("LEAGUE_END_YEAR", "2022"))
 
 standings_directory = './output/'+ leagueID + '-history-standings/'
 gamecenter_directory = './output/'+ leagueID + '-history-teamgamecenter/'
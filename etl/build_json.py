@@ -1,8 +1,20 @@
 from pathlib import Path
-import shutil
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py liegt im Repo-Root
+import tracing, versions, outputs
 SRC = Path("data/processed"); DST = Path("public/data/processed")
+@tracing.traced("build_json.run")
 def run():
     if not SRC.exists(): return
-    if DST.exists(): shutil.rmtree(DST)
-    shutil.copytree(SRC, DST)
+    with versions.publishing("build_json"):   # Deltas gegenüber der zuletzt veröffentlichten Version
+        # Spiegeln statt rmtree+copytree: nur geänderte Dateien werden (atomar) ersetzt, mtimes bleiben sonst stehen
+        with tracing.span("write", "sync", src=str(SRC), dst=str(DST)) as s:
+            files = {f.relative_to(SRC) for f in SRC.rglob("*") if f.is_file()}
+            written = sum(outputs.copy_file(SRC / rel, DST / rel) for rel in sorted(files))
+            removed = 0
+            for f in sorted(DST.rglob("*"), reverse=True):
+                if f.is_file() and f.relative_to(DST) not in files: f.unlink(); removed += 1
+                elif f.is_dir() and not any(f.iterdir()): f.rmdir()
+            s.set(files=len(files), written=written, removed=removed)
+    print(f"✓ build_json: {len(files)} Dateien, {written} geändert, {removed} entfernt")
 if __name__ == "__main__": run()
@@ -0,0 +1,109 @@
+import gzip, hashlib, json, sys
+from pathlib import Path, PurePosixPath
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py liegt im Repo-Root
+import tracing, outputs
+
+try:
+    import brotli   # optional (pip install brotli); ohne gibt es nur .gz-Varianten
+except ImportError:
+    brotli = None
+
+# Nach build_json.py: jede Datei unter public/data als <name>.<hash>.json (+ .gz/.br) unter bundle/,
+# dazu manifest.json (logischer Pfad -> gehashte Dateien + Größen). Gehashte Dateien sind unveränderlich
+# (Cache-Control: immutable); nur manifest.json wird bei jedem Besuch frisch geladen.
+PUBLIC_DIR = Path("public/data")
+BUNDLE_DIR = PUBLIC_DIR / "bundle"
+MANIFEST = PUBLIC_DIR / "manifest.json"
+SKIP = ("bundle/", "versions/", "manifest.json")   # versions/ hat eigene Versionierung (versions.py)
+ENCODINGS = (("gzip", ".gz"), ("br", ".br"))
+
+def content_hash(data: bytes):
+    return hashlib.sha256(data).hexdigest()[:16]
+
+def hashed_name(rel: str, digest: str):
+    """processed/seasons/2024/matchups.json -> processed/seasons/2024/matchups.<hash>.json"""
+    p = PurePosixPath(rel)
+    return str(p.with_name(f"{p.stem}.{digest}{p.suffix}"))
+
+def encode(enc, data: bytes):
+    if enc == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)   # mtime=0: gleicher Inhalt -> gleiche Bytes
+    return brotli.compress(data, quality=11) if brotli else None
+
+def intact(out: Path, enc, data: bytes):
+    """Vorhandene .gz/.br-Datei vollständig (entpackt == data)? Entpacken ist billig, Neukomprimieren nicht."""
+    try:
+        raw = out.read_bytes()
+        return (gzip.decompress(raw) if enc == "gzip" else brotli.decompress(raw)) == data
+    except Exception:   # fehlt, abgeschnitten oder kaputt (EOFError, gzip.BadGzipFile, brotli.error)
+        return False
+
+def load_manifest():
+    if MANIFEST.exists():
+        try:
+            return json.loads(MANIFEST.read_text(encoding="utf-8"))
+        except ValueError:
+            pass
+    return {"files": {}}
+
+def _referenced(manifest):
+    """Alle gehashten Dateien (inkl. .gz/.br), auf die ein Manifest verweist."""
+    out = set()
+    for e in manifest["files"].values():
+        out.add(e["file"])
+        out.update(e[enc]["file"] for enc, _ in ENCODINGS if enc in e)
+    return out
+
+@tracing.traced("bundle.run")
+def run():
+    if not PUBLIC_DIR.exists():
+        return
+    prev = load_manifest()
+    files, written = {}, 0
+    for path in sorted(p for p in PUBLIC_DIR.rglob("*") if p.is_file()):
+        rel = path.relative_to(PUBLIC_DIR).as_posix()
+        if rel.startswith(SKIP):
+            continue
+        data = path.read_bytes()
+        name = hashed_name(rel, content_hash(data))
+        target = BUNDLE_DIR / name
+        entry = {"file": f"bundle/{name}", "bytes": len(data)}
+        # inhaltsadressiert: vorhandene Dateien bleiben liegen – outputs.write_bytes ersetzt nur abweichende
+        # (z. B. von einem abgebrochenen Lauf abgeschnittene), atomar
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with tracing.span("write", tracing.file_class(target), path=str(target), bytes=len(data)):
+            written += outputs.write_bytes(target, data)
+        for enc, ext in ENCODINGS:
+            out = target.with_name(target.name + ext)
+            if enc == "br" and brotli is None:
+                continue
+            if not intact(out, enc, data):
+                with tracing.span("write", f"compress.{enc}", file=rel, bytes=len(data)):
+                    outputs.write_bytes(out, encode(enc, data))
+            entry[enc] = {"file": f"bundle/{name}{ext}", "bytes": out.stat().st_size}
+        files[rel] = entry
+
+    if files == prev["files"]:
+        print(f"✓ Bundle: {len(files)} Dateien, unverändert")
+        return   # vorherige Generation bleibt bis zur nächsten echten Änderung liegen
+    totals = {"bytes": sum(e["bytes"] for e in files.values())}
+    totals.update({enc: sum(e[enc]["bytes"] for e in files.values() if enc in e) for enc, _ in ENCODINGS})
+    manifest = {"files": files, "totals": totals}
+    tracing.write_text(MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True))
+
+    # Alte Generationen aufräumen: nur was im aktuellen oder vorherigen Manifest steht, bleibt liegen
+    keep = _referenced(manifest) | _referenced(prev)
+    removed = 0
+    for p in sorted(BUNDLE_DIR.rglob("*"), reverse=True):
+        if p.is_file() and p.relative_to(PUBLIC_DIR).as_posix() not in keep:
+            p.unlink(); removed += 1
+        elif p.is_dir() and not any(p.iterdir()):
+            p.rmdir()
+    t = manifest["totals"]
+    print(f"✓ Bundle: {len(files)} Dateien ({written} neu, {removed} entfernt), "
+          f"{t['bytes'] / 1e6:.1f} MB roh, gzip {t['gzip'] / 1e6:.1f} MB"
+          + (f", brotli {t['br'] / 1e6:.1f} MB" if brotli else " (brotli nicht installiert)"))
+
+if __name__ == "__main__":
+    run()
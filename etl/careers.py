@@ -0,0 +1,158 @@
+import json, mmap, sys
+from array import array
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py liegt im Repo-Root
+import tracing
+
+# Invertierter Spieler-Index über alle Saisons (statt alle players_games.json zu scannen):
+#   player_careers.json  Kopf: Manager-/Slot-Tabellen, Spalten-Layout des Stores, je player_id Zeilenbereich
+#                        und vorberechnete Karrierewerte (Schlüssel = player_id als String, wie im JSON üblich)
+#   player_games.bin     gepackter Spalten-Store, Zeilen nach Spieler gruppiert (Spieler in ID-Reihenfolge,
+#                        je Spieler nach Saison/Woche sortiert); jede Spalte liegt am Stück, little-endian,
+#                        4-Byte-aligned -> im Browser direkt als Float32Array/Uint16Array/Uint8Array, in Python per mmap
+CAREERS_FILE = Path("data/processed/player_careers.json")
+STORE_FILE = Path("data/processed/player_games.bin")
+
+# (Spalte, array-Typcode, Typ im Kopf); breite Typen zuerst, damit alle Spalten aligned bleiben
+STORE_COLUMNS = (("points", "f", "f4"), ("season", "H", "u2"), ("manager", "H", "u2"),
+                 ("week", "B", "u1"), ("slot", "B", "u1"), ("is_starter", "B", "u1"))
+ROW_FIELDS = ("season", "week", "manager", "slot", "points", "is_starter")
+# Zeile je Spieler in "players"; best = [season, week, points, manager]
+# rostered_by = [[manager, games, starts, points], ...] absteigend nach Einsätzen
+CAREER_COLUMNS = ["id", "name", "pos", "start", "count", "games", "starts", "points", "started_points",
+                  "first_season", "last_season", "best", "rostered_by"]
+
+def _align(n, to=4):
+    return (n + to - 1) // to * to
+
+class CareerStore:
+    """Lesezugriff: Kopf einmal laden, Spalten per mmap einblenden (die Zeilen werden nie geparst)."""
+    def __init__(self, path: Path = CAREERS_FILE):
+        meta = json.loads(path.read_text(encoding="utf-8"))
+        self.managers, self.slots = meta["managers"], meta["slots"]
+        self.players = meta["players"]
+        self.rows = meta["store"]["rows"]
+        self.columns = {}
+        self._mm = None
+        if self.rows:
+            with (path.parent / meta["store"]["file"]).open("rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            codes = {name: code for name, code, _ in STORE_COLUMNS}
+            for name, (offset, _) in meta["store"]["columns"].items():
+                size = array(codes[name]).itemsize
+                view = memoryview(self._mm)[offset:offset + self.rows * size]
+                if sys.byteorder == "little":
+                    self.columns[name] = view.cast(codes[name])
+                else:
+                    col = array(codes[name], view); col.byteswap()
+                    self.columns[name] = col
+
+    def career(self, pid):
+        row = self.players.get(str(pid))
+        return dict(zip(CAREER_COLUMNS, row)) if row else None
+
+    def games(self, pid):
+        """Alle Einsätze eines Spielers als Dicts (season, week, manager, slot, points, is_starter)."""
+        row = self.players.get(str(pid))
+        if not row:
+            return []
+        start, count = row[3], row[4]
+        c = self.columns
+        return [{"season": c["season"][i], "week": c["week"][i], "manager": self.managers[c["manager"][i]],
+                 "slot": self.slots[c["slot"][i]], "points": round(c["points"][i], 2),
+                 "is_starter": bool(c["is_starter"][i])}
+                for i in range(start, start + count)]
+
+class CareerIndex:
+    """
+    Baut den Store aus den player-games von parse_weeks (records.PlayerGame mit player_id).
+    Wie der H2H-Index inkrementell: der vorhandene Store wird geladen, neu eingelesene Saisons ersetzen
+    ihre alten Zeilen (drop_season), andere Saisons bleiben erhalten. Ein Spieler hat je Saison und Woche
+    höchstens eine Zeile – eine zweite heißt, dass zwei Spieler dieselbe ID bekommen haben (add_week bricht ab).
+    """
+    def __init__(self, index):
+        self.index = index    # player_ids.PlayerIndex (Anzeigename, Position)
+        self.rows = defaultdict(list)   # player_id -> [(season, week, manager, slot, points, is_starter)]
+
+    @classmethod
+    def load(cls, index, path: Path = CAREERS_FILE):
+        idx = cls(index)
+        if not path.exists():
+            return idx
+        try:
+            store = CareerStore(path)
+        except (ValueError, KeyError, OSError):
+            return idx   # unlesbar/altes Format -> komplett neu aufbauen
+        if index.rebuilt or not all(k.isdigit() for k in store.players):
+            return idx   # IDs neu vergeben bzw. noch nach player_key -> komplett neu aufbauen
+        for key in store.players:
+            idx.rows[int(key)] = [tuple(g[f] for f in ROW_FIELDS) for g in store.games(key)]
+        return idx
+
+    def drop_season(self, season: int):
+        for pid, rows in self.rows.items():
+            if any(r[0] == season for r in rows):
+                self.rows[pid] = [r for r in rows if r[0] != season]
+
+    def add_week(self, players):
+        for p in players:
+            pid = p.player_id
+            if not isinstance(pid, int):
+                continue   # leerer Slot oder ohne PlayerIndex
+            rows = self.rows[pid]
+            # Wochen kommen je Saison aufsteigend -> eine doppelte Woche steht direkt davor
+            if rows and rows[-1][0] == p.season and rows[-1][1] == p.week:
+                raise ValueError(f"Karriere-Index: player_id {pid} ({p.player_raw!r}, {p.manager}) hat in "
+                                 f"Saison {p.season} Woche {p.week} schon einen Einsatz ({rows[-1][2]})")
+            rows.append((p.season, p.week, p.manager, p.slot, round(p.points or 0.0, 2), p.is_starter))
+
+    def save(self, path: Path = CAREERS_FILE, store_path: Path = STORE_FILE):
+        managers, slots = {}, {}
+        cols = {name: array(code) for name, code, _ in STORE_COLUMNS}
+        players = {}
+        for pid in sorted(pid for pid, rows in self.rows.items() if rows):
+            rows = sorted(self.rows[pid])
+            start = len(cols["points"])
+            starts = 0
+            points = started = 0.0
+            best = None
+            by_manager = {}
+            for season, week, manager, slot, pts, is_starter in rows:
+                m = managers.setdefault(manager, len(managers))
+                cols["points"].append(pts); cols["season"].append(season); cols["manager"].append(m)
+                cols["week"].append(week); cols["slot"].append(slots.setdefault(slot, len(slots)))
+                cols["is_starter"].append(int(is_starter))
+                points += pts
+                acc = by_manager.setdefault(m, [m, 0, 0, 0.0])
+                acc[1] += 1; acc[3] += pts
+                if is_starter:
+                    starts += 1; started += pts; acc[2] += 1
+                if best is None or pts > best[2]:
+                    best = [season, week, pts, m]
+            p = self.index.players[pid]
+            rostered = sorted(by_manager.values(), key=lambda a: (-a[1], a[0]))
+            players[str(pid)] = [pid, p["name"], p["pos"], start, len(rows), len(rows), starts, round(points, 2),
+                            round(started, 2), rows[0][0], rows[-1][0], best,
+                            [[m, g, s, round(pts, 2)] for m, g, s, pts in rostered]]
+
+        layout, offset = {}, 0
+        for name, _, kind in STORE_COLUMNS:
+            layout[name] = [offset, kind]
+            offset = _align(offset + len(cols[name]) * cols[name].itemsize)
+        blob = bytearray(offset)
+        for name, _, _ in STORE_COLUMNS:
+            col = cols[name]
+            if sys.byteorder != "little":
+                col = array(col.typecode, col); col.byteswap()
+            data = col.tobytes()
+            blob[layout[name][0]:layout[name][0] + len(data)] = data
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tracing.write_bytes(store_path, bytes(blob))
+        meta = {"columns": CAREER_COLUMNS, "managers": list(managers), "slots": list(slots),
+                "store": {"file": store_path.name, "rows": len(cols["points"]), "byteorder": "little",
+                          "columns": layout},
+                "players": players}
+        tracing.write_text(path, json.dumps(meta, ensure_ascii=False, separators=(",", ":")))
+        return len(players), len(cols["points"]), len(blob)
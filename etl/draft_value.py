@@ -0,0 +1,162 @@
+import csv, json, sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py liegt im Repo-Root
+import tracing
+
+from player_ids import PlayerIndex
+
+# Draft-Historie: NFL.com output/history-drafts/<season>-draft.tsv, Sleeper output/<season>/draft.tsv
+HIST_DRAFTS = Path("output/history-drafts")
+SLEEPER_OUT = Path("output")
+SEASONS_DIR = Path("data/processed/seasons")          # players_games.json (von parse_weeks.py)
+OUT_FILE = Path("data/processed/draft_value.json")     # All-Time; pro Saison seasons/<y>/draft_value.json
+
+def read_picks(season: int):
+    """Picks einer Saison als Liste von Dicts (NFL.com bevorzugt, sonst Sleeper) oder None."""
+    for path in (HIST_DRAFTS / f"{season}-draft.tsv", SLEEPER_OUT / str(season) / "draft.tsv"):
+        if not path.exists():
+            continue
+        with path.open("r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f, delimiter="\t"))
+        picks = []
+        for r in rows:
+            try:
+                overall = int(r.get("Overall") or 0)
+            except ValueError:
+                continue
+            if not overall or not (r.get("Player") or "").strip():
+                continue
+            picks.append({"round": int(r.get("Round") or 0), "overall": overall,
+                          "pick_in_round": int(r["PickInRound"]) if (r.get("PickInRound") or "").isdigit() else None,
+                          "manager": (r.get("ManagerName") or "").strip(),
+                          "player": r["Player"].strip(), "pos": (r.get("Pos") or "").strip() or None,
+                          "nfl_team": (r.get("NFLTeam") or "").strip() or None})
+        picks.sort(key=lambda p: p["overall"])
+        return picks
+    return None
+
+def season_points(season: int, index: PlayerIndex):
+    """
+    Hash-Index player_id -> [points, started_points, games, started_games] über players_games.json,
+    plus Starter-Slots je Position und Team-Woche (für das Replacement-Level).
+    Zeilen ohne player_id (ältere Ausgaben) löst der PlayerIndex auf, jeden player_raw-String nur einmal.
+    """
+    path = SEASONS_DIR / str(season) / "players_games.json"
+    if not path.exists():
+        return None, None, 0
+    with tracing.span("parse", "players_games.json", season=season):
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    points = defaultdict(lambda: [0.0, 0.0, 0, 0])
+    starts = defaultdict(int)
+    team_weeks, managers = set(), set()
+    for r in rows:
+        pid = r["player_id"] if "player_id" in r else index.resolve(r["player_raw"], season)
+        if pid is None:
+            continue
+        pts = r.get("points") or 0.0
+        acc = points[pid]
+        acc[0] += pts; acc[2] += 1
+        if r.get("is_starter"):
+            acc[1] += pts; acc[3] += 1
+            starts[index.players[pid]["pos"]] += 1
+        team_weeks.add((r["manager"], r["week"]))
+        managers.add(r["manager"])
+    avg_starters = {pos: n / len(team_weeks) for pos, n in starts.items()} if team_weeks else {}
+    return points, avg_starters, len(managers)
+
+def replacement_levels(points, avg_starters, teams, index: PlayerIndex):
+    """
+    Replacement-Level je Position: Saisonpunkte des ersten Spielers hinter den ligaweit
+    gestarteten (Teams x durchschnittliche Starter je Team-Woche, inkl. Flex-Einsätze).
+    """
+    by_pos = defaultdict(list)
+    for pid, acc in points.items():
+        by_pos[index.players[pid]["pos"]].append(acc[0])
+    out = {}
+    for pos, vals in by_pos.items():
+        if pos is None:
+            continue
+        vals.sort(reverse=True)
+        rank = max(1, round(teams * avg_starters.get(pos, 0.0)))
+        out[pos] = {"rank": rank, "points": round(vals[rank], 2) if rank < len(vals) else 0.0}
+    return out
+
+def _group(picks, field):
+    acc = defaultdict(lambda: {"picks": 0, "points": 0.0, "started_points": 0.0, "vor": 0.0, "hits": 0,
+                               "best": None, "worst": None})
+    for p in picks:
+        a = acc[p[field]]
+        a["picks"] += 1
+        a["points"] += p["points"]; a["started_points"] += p["started_points"]; a["vor"] += p["vor"]
+        a["hits"] += p["vor"] > 0
+        ref = {"season": p["season"], "overall": p["overall"], "player": p["player"], "vor": p["vor"]}
+        if a["best"] is None or p["vor"] > a["best"]["vor"]: a["best"] = ref
+        if a["worst"] is None or p["vor"] < a["worst"]["vor"]: a["worst"] = ref
+    out = []
+    for k, a in acc.items():
+        n = a["picks"]
+        out.append({field: k, "picks": n,
+                    "points": round(a["points"], 2), "started_points": round(a["started_points"], 2),
+                    "vor": round(a["vor"], 2), "avg_points": round(a["points"] / n, 2),
+                    "avg_vor": round(a["vor"] / n, 2), "hit_rate": round(a["hits"] / n, 3),
+                    "best": a["best"], "worst": a["worst"]})
+    return out
+
+def summarize(picks):
+    """by_round / by_manager / curve (Draftposition -> Ergebnis) für eine Menge bewerteter Picks."""
+    by_round = sorted(_group(picks, "round"), key=lambda r: r["round"])
+    by_manager = sorted(_group(picks, "manager"), key=lambda r: (-r["vor"], r["manager"]))
+    curve = [{k: r[k] for k in ("overall", "picks", "avg_points", "avg_vor", "hit_rate")}
+             for r in sorted(_group(picks, "overall"), key=lambda r: r["overall"])]
+    return {"by_round": by_round, "by_manager": by_manager, "curve": curve}
+
+def build_season(season: int, index: PlayerIndex):
+    picks = read_picks(season)
+    if not picks:
+        return None
+    points, avg_starters, teams = season_points(season, index)
+    if points is None:
+        return None
+    repl = replacement_levels(points, avg_starters, teams, index)
+    for p in picks:
+        # Join über die player_id: Langname, sonst Kurzname + NFL-Team der Saison (wie parse_weeks)
+        pid = index.lookup(p["player"], p["pos"], p["nfl_team"], season)
+        acc = points.get(pid)
+        p["season"] = season
+        p["player_id"] = pid
+        p["matched"] = acc is not None
+        p["points"] = round(acc[0], 2) if acc else 0.0
+        p["started_points"] = round(acc[1], 2) if acc else 0.0
+        p["games"] = acc[2] if acc else 0
+        p["started_games"] = acc[3] if acc else 0
+        p["vor"] = round(p["points"] - repl.get(p["pos"], {}).get("points", 0.0), 2)
+    out = {"season": season, "replacement": repl, "picks": picks, **summarize(picks)}
+    tracing.write_text(SEASONS_DIR / str(season) / "draft_value.json", json.dumps(out, ensure_ascii=False))
+    matched = sum(p["matched"] for p in picks)
+    print(f"✓ {season}: {len(picks)} Picks, {matched} mit Punkten verknüpft")
+    return out
+
+def run_all(seasons=range(2015, 2026)):
+    index = PlayerIndex.load()
+    all_picks, per_season = [], []
+    for season in seasons:
+        with tracing.stage("draft_value.build_season", season=season):
+            res = build_season(season, index)
+        if res is None:
+            continue
+        all_picks.extend(res["picks"])
+        per_season.append({"season": season, "picks": len(res["picks"]),
+                           "matched": sum(p["matched"] for p in res["picks"]),
+                           "replacement": res["replacement"]})
+    if not all_picks:
+        print("– keine Drafts gefunden")
+        return
+    out = {"seasons": per_season, **summarize(all_picks)}
+    OUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tracing.write_text(OUT_FILE, json.dumps(out, ensure_ascii=False))
+    print(f"✓ Draft-Value: {len(all_picks)} Picks aus {len(per_season)} Saisons")
+
+if __name__ == "__main__":
+    run_all()
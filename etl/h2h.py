@@ -0,0 +1,150 @@
+import json, sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py liegt im Repo-Root
+import tracing
+
+# All-Time Head-to-Head: Manager x Manager, getrennt nach Regular Season und Playoffs
+H2H_FILE = Path("data/processed/h2h.json")
+REGULAR_WEEKS = 14   # wie scripts/compute_elo.py: alles nach Woche 14 zählt als Playoff
+
+# Zeile je Paar und Phase, immer aus Sicht von a (kleinerer Manager-Index):
+# big_win / big_loss = größter Sieg-/Niederlagen-Abstand, *_game = Index in "games" (oder None)
+H2H_COLUMNS = ["games", "wins", "losses", "ties", "pf", "pa", "big_win", "big_win_game", "big_loss", "big_loss_game"]
+# Spiel-Zeiger: matchup = Index in seasons/<season>/matchups.json (O(1)-Drilldown)
+GAME_COLUMNS = ["season", "week", "matchup", "playoff", "a_pts", "b_pts"]
+
+def h2h_row(games, playoff=None):
+    """Aggregiert eine Spielliste (optional nur eine Phase) zu einer H2H_COLUMNS-Zeile."""
+    g = w = l = t = 0
+    pf = pa = 0.0
+    big_win = big_loss = None
+    win_i = loss_i = None
+    for i, (_, _, _, po, ap, bp) in enumerate(games):
+        if playoff is not None and bool(po) != playoff:
+            continue
+        g += 1; pf += ap; pa += bp
+        diff = round(ap - bp, 2)
+        if diff > 0:
+            w += 1
+            if big_win is None or diff > big_win: big_win, win_i = diff, i
+        elif diff < 0:
+            l += 1
+            if big_loss is None or -diff > big_loss: big_loss, loss_i = -diff, i
+        else:
+            t += 1
+    return [g, w, l, t, round(pf, 2), round(pa, 2), big_win, win_i, big_loss, loss_i]
+
+class H2HIndex:
+    """
+    Sparse Matrix "i|j" (i < j) -> {"games": [[season, week, matchup, playoff, a_pts, b_pts], ...],
+    "regular": row, "playoff": row, "total": row}. Die Spielliste ist die Quelle, die Zeilen werden
+    daraus abgeleitet – so kann eine geänderte Saison entfernt und neu eingelesen werden.
+    """
+    def __init__(self):
+        self.managers = []
+        self.by_name = {}
+        self.seasons = {}     # season -> [enthaltene Wochen]
+        self.pairs = {}
+        self.mtime = None
+        self._dirty = set()
+
+    # ---------- Laden / Speichern ----------
+    @classmethod
+    def load(cls, path: Path = H2H_FILE):
+        idx = cls()
+        if not path.exists():
+            return idx
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            return idx
+        if data.get("columns") != H2H_COLUMNS or data.get("game_columns") != GAME_COLUMNS:
+            return idx
+        idx.managers = data["managers"]
+        idx.by_name = {m: i for i, m in enumerate(idx.managers)}
+        idx.seasons = {int(s): weeks for s, weeks in data["seasons"].items()}
+        idx.pairs = data["pairs"]
+        idx.mtime = path.stat().st_mtime
+        return idx
+
+    def save(self, path: Path = H2H_FILE):
+        for key in self._dirty:
+            self._refresh(key)
+        self._dirty.clear()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"columns": H2H_COLUMNS, "game_columns": GAME_COLUMNS, "regular_weeks": REGULAR_WEEKS,
+                   "managers": self.managers,
+                   "seasons": {str(s): w for s, w in sorted(self.seasons.items())},
+                   "pairs": dict(sorted(self.pairs.items(), key=lambda kv: tuple(map(int, kv[0].split("|")))))}
+        # touch: mtime = Stand des Index (prepare_season vergleicht sie mit den Wochen-CSVs)
+        tracing.write_text(path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")), touch=True)
+
+    # ---------- Inkrementelles Update ----------
+    def prepare_season(self, season: int, week_files):
+        """
+        Entfernt eine Saison, wenn eine bereits enthaltene Woche neuer ist als der Index oder sich die
+        Menge der Wochendateien anders geändert hat als durch neue Wochen am Ende: die matchup-Zeiger
+        sind Positionen in matchups.json und stimmen nur, solange die enthaltenen Wochen der Anfang der
+        aktuellen Wochenliste sind. Gibt die Menge der noch enthaltenen Wochen zurück.
+        """
+        known = set(self.seasons.get(season) or [])
+        if not known:
+            return known
+        current = {int(wf.stem): wf for wf in week_files if wf.stem.isdigit()}
+        stale = (sorted(known) != sorted(current)[:len(known)] or self.mtime is None
+                 or any(current[w].stat().st_mtime > self.mtime for w in known))
+        if stale:
+            self.drop_season(season)
+            return set()
+        return known
+
+    def drop_season(self, season: int):
+        for key, p in self.pairs.items():
+            kept = [g for g in p["games"] if g[0] != season]
+            if len(kept) != len(p["games"]):
+                p["games"] = kept
+                self._dirty.add(key)
+        self.seasons.pop(season, None)
+
+    def _manager(self, name):
+        i = self.by_name.get(name)
+        if i is None:
+            i = self.by_name[name] = len(self.managers)
+            self.managers.append(name)
+        return i
+
+    def add_week(self, season: int, week: int, matchups, first_index: int):
+        """matchups (records.Matchup) einer Woche; first_index = Position der ersten davon in matchups.json der Saison."""
+        playoff = int(week > REGULAR_WEEKS)
+        for k, m in enumerate(matchups):
+            hi, ai = self._manager(m.home_team), self._manager(m.away_team)
+            hp, ap = (m.home_points or 0.0), (m.away_points or 0.0)
+            (a, b, a_pts, b_pts) = (hi, ai, hp, ap) if hi < ai else (ai, hi, ap, hp)
+            key = f"{a}|{b}"
+            p = self.pairs.setdefault(key, {"games": []})
+            p["games"].append([season, week, first_index + k, int(m.is_playoff or playoff), a_pts, b_pts])
+            self._dirty.add(key)
+        weeks = self.seasons.setdefault(season, [])
+        if week not in weeks:
+            weeks.append(week)
+            weeks.sort()
+
+    def _refresh(self, key):
+        p = self.pairs[key]
+        p["games"].sort(key=lambda g: (g[0], g[1], g[2]))
+        if not p["games"]:
+            del self.pairs[key]
+            return
+        p["regular"] = h2h_row(p["games"], playoff=False)
+        p["playoff"] = h2h_row(p["games"], playoff=True)
+        p["total"] = h2h_row(p["games"])
+
+    # ---------- Abfrage ----------
+    def pair(self, a: str, b: str):
+        """(Eintrag, swapped) für zwei Managernamen; swapped=True heißt: Zeilen sind aus Sicht von b."""
+        ia, ib = self.by_name.get(a), self.by_name.get(b)
+        if ia is None or ib is None or ia == ib:
+            return None, False
+        lo, hi = min(ia, ib), max(ia, ib)
+        return self.pairs.get(f"{lo}|{hi}"), ia > ib
@@ -1,13 +1,35 @@
-import csv, json
+import csv, json, os, re, sys
+from functools import lru_cache
 from pathlib import Path
 from collections import defaultdict
 
-# TeamGameCenter: output/teamgamecenter/<SEASON>/<WEEK>.csv
-RAW_DIR = Path("output/teamgamecenter")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py/outputs.py liegen im Repo-Root
+import tracing, outputs
+
+from player_ids import PlayerIndex
+from h2h import H2HIndex
+from careers import CareerIndex
+from transactions import TransactionLedger
+from records import LineupEntry, TeamWeek, Matchup, PlayerGame, istr
+
+# TeamGameCenter: output/teamgamecenter/<SEASON>/<WEEK>.csv (NFL.com: output/<liga>-history-teamgamecenter)
+RAW_DIR = Path(os.getenv("GAMECENTER_DIR", "output/teamgamecenter"))
 OUT_DIR = Path("data/processed/seasons")
 
-# History-Standings (TSV):
-HIST_DIR = Path("output/history-standings")  # <season>.tsv und playoffs-<season>.tsv
+# History-Standings (TSV): <season>.tsv und playoffs-<season>.tsv (NFL.com) bzw.
+# <season>/standings_regular_1_14.tsv und <season>/standings_playoffs.tsv (scrapeSleeperStandings, STANDINGS_DIR=output)
+HIST_DIR = Path(os.getenv("STANDINGS_DIR", "output/history-standings"))
+
+def standings_tsv(season: int, playoffs=False):
+    """Standings-TSV der Saison in einem der beiden Layouts, sonst None."""
+    if playoffs:
+        nfl, sleeper = f"playoffs-{season}.tsv", "standings_playoffs.tsv"
+    else:
+        nfl, sleeper = f"{season}.tsv", "standings_regular_1_14.tsv"
+    for tsv in (HIST_DIR / nfl, HIST_DIR / str(season) / sleeper):
+        if tsv.exists():
+            return tsv
+    return None
 
 def safe_float(x):
     if x is None: return None
@@ -16,6 +38,7 @@ def safe_float(x):
     try: return float(s.replace(",", ""))
     except: return None
 
+@lru_cache(maxsize=None)
 def extract_pos(p):
     if not p: return None
     s = p.upper()
@@ -41,12 +64,12 @@ def parse_team_row(header, row):
     gi_total     = idx(header, "Total", "Total Points", "Pts", "Summe")
     gi_opp_total = idx(header, "Opponent Total", "OpponentTotal", "Opp Total", "Gegner Punkte")
 
-    owner = row[gi_owner].strip()
-    opponent = row[gi_opponent].strip()
+    owner = istr(row[gi_owner].strip())
+    opponent = istr(row[gi_opponent].strip())
     total = safe_float(row[gi_total])
     opp_total = safe_float(row[gi_opp_total])
 
-    starters_order = ["QB","RB","RB","WR","WR","TE","W/R","K","DEF"]
+    starters_order = ["QB","RB","RB","WR","WR","TE","W/R","W/T","Q/W/R/T","K","DEF","DL","LB","DB","IDP"]
     starters, bench = [], []
     gi_rank = idx(header, "Rank")
     end_i = gi_total
@@ -59,8 +82,7 @@ def parse_team_row(header, row):
         if norm(col) == "points":
             if slot_buf is not None:
                 slot, player_raw = slot_buf
-                ent = {"slot": slot, "player_raw": player_raw.strip(),
-                       "pos": extract_pos(player_raw), "points": safe_float(val)}
+                ent = LineupEntry(istr(slot), istr(player_raw.strip()), extract_pos(player_raw), safe_float(val))
                 (bench if slot.upper()=="BN" else starters).append(ent)
                 slot_buf = None
         else:
@@ -68,29 +90,23 @@ def parse_team_row(header, row):
         i += 1
 
     def s_key(e):
-        try: return starters_order.index(e["slot"])
+        try: return starters_order.index(e.slot)
         except ValueError: return 999
-    starters_sorted = sorted([e for e in starters if e["slot"].upper() != "BN"], key=s_key)
+    starters_sorted = sorted([e for e in starters if e.slot.upper() != "BN"], key=s_key)
 
-    return {"owner": owner, "opponent": opponent, "total": total, "opponent_total": opp_total,
-            "starters": starters_sorted, "bench": bench}
+    return TeamWeek(owner, opponent, total, opp_total, starters_sorted, bench)
 
 def group_matchups(team_rows):
     bucket = defaultdict(list)
     for r in team_rows:
-        bucket[frozenset((r["owner"], r["opponent"]))].append(r)
+        bucket[frozenset((r.owner, r.opponent))].append(r)
     matchups = []
     for _, sides in bucket.items():
         if len(sides) != 2: 
             continue
         a, b = sides
-        home, away = (a, b) if a["owner"] <= b["owner"] else (b, a)
-        matchups.append({
-            "home_team": home["owner"], "away_team": away["owner"],
-            "home_points": home["total"], "away_points": away["total"],
-            "home_lineup": {"starters": home["starters"], "bench": home["bench"]},
-            "away_lineup": {"starters": away["starters"], "bench": away["bench"]},
-        })
+        home, away = (a, b) if a.owner <= b.owner else (b, a)
+        matchups.append(Matchup(home, away))
     return matchups
 
 def parse_week_file(path: Path, season: int, week: int):
@@ -114,21 +130,16 @@ def parse_week_file(path: Path, season: int, week: int):
         team = parse_team_row(header, row)
         team_rows.append(team)
 
-        def emit(lineup, is_starter):
-            for e in lineup:
-                players.append({
-                    "season": season, "week": week, "manager": team["owner"], "opponent": team["opponent"],
-                    "slot": e["slot"], "pos": e["pos"], "player_raw": e["player_raw"],
-                    "points": e["points"], "is_starter": is_starter
-                })
-        emit(team["starters"], True)
-        emit(team["bench"], False)
+        for e in team.starters:
+            players.append(PlayerGame(season, week, team.owner, team.opponent, e, True))
+        for e in team.bench:
+            players.append(PlayerGame(season, week, team.owner, team.opponent, e, False))
     return team_rows, players
 
 # ---------- NEU: Weekly Standings aus Matchups ----------
 def build_weekly_standings(all_week_matchups):
     """
-    all_week_matchups: dict[int -> list[matchup dict]]
+    all_week_matchups: dict[int -> list[Matchup/Score]]
     Liefert: [{"week": w, "rows":[{team, wins, losses, pf, pa, pct, rank}...]}...]
     Sortierung: wins desc, pf desc, team asc
     """
@@ -137,8 +148,8 @@ def build_weekly_standings(all_week_matchups):
         # pro Team die weekly Zahlen (nur diese Woche, nicht kumulativ)
         table = defaultdict(lambda: {"wins":0,"losses":0,"ties":0,"pf":0.0,"pa":0.0})
         for m in all_week_matchups[w]:
-            ht, at = m["home_team"], m["away_team"]
-            hp, ap = (m["home_points"] or 0.0), (m["away_points"] or 0.0)
+            ht, at = m.home_team, m.away_team
+            hp, ap = (m.home_points or 0.0), (m.away_points or 0.0)
             table[ht]["pf"] += hp; table[ht]["pa"] += ap
             table[at]["pf"] += ap; table[at]["pa"] += hp
             if hp == ap: table[ht]["ties"] += 1; table[at]["ties"] += 1
@@ -162,6 +173,95 @@ def build_weekly_standings(all_week_matchups):
         weekly.append({"week": w, "rows": rows})
     return weekly
 
+# ---------- NEU: Kumulative Standings (Prefix-Summen je Team) ----------
+CUM_COLUMNS = ["wins", "losses", "ties", "pf", "pa", "rank", "rank_change"]
+
+def empty_cumulative_standings():
+    """
+    Kompakte Tabelle: {"columns": CUM_COLUMNS, "weeks": [w...], "teams": {team: [[...], ...]}}
+    teams[t][i] ist der Stand von Team t *nach* weeks[i] (Prefix-Summe über alle Wochen <= weeks[i]).
+    rank_change > 0 = Team ist gegenüber der Vorwoche nach oben geklettert.
+    """
+    return {"columns": list(CUM_COLUMNS), "weeks": [], "teams": {}}
+
+def append_cumulative_week(cum, week, matchups):
+    """
+    Hängt genau eine Woche an cum an (in-place) – nur die letzte Zeile je Team wird gelesen,
+    d. h. kein Rebuild ab Woche 1. Teams ohne Spiel (Bye) übernehmen ihren Vorwochenstand.
+    """
+    if cum["weeks"] and week <= cum["weeks"][-1]:
+        raise ValueError(f"Woche {week} ist nicht neuer als {cum['weeks'][-1]}")
+    n_prev = len(cum["weeks"])
+    teams = cum["teams"]
+
+    # Vorwochenstand je Team (Prefix bis n_prev-1)
+    cur = {}
+    for team, hist in teams.items():
+        w, l, t, pf, pa, _, _ = hist[-1]
+        cur[team] = [w, l, t, pf, pa]
+
+    for m in matchups:
+        ht, at = m.home_team, m.away_team
+        hp, ap = (m.home_points or 0.0), (m.away_points or 0.0)
+        for team in (ht, at):
+            if team not in cur:
+                cur[team] = [0, 0, 0, 0.0, 0.0]
+                # neues Team: Vorwochen mit Nullzeilen auffüllen, damit Indizes zu weeks passen
+                teams[team] = [[0, 0, 0, 0.0, 0.0, None, 0] for _ in range(n_prev)]
+        h, a = cur[ht], cur[at]
+        h[3] += hp; h[4] += ap
+        a[3] += ap; a[4] += hp
+        if hp == ap: h[2] += 1; a[2] += 1
+        elif hp > ap: h[0] += 1; a[1] += 1
+        else:         a[0] += 1; h[1] += 1
+
+    order = sorted(cur, key=lambda t: (-cur[t][0], -cur[t][3], t))
+    for rank, team in enumerate(order, start=1):
+        w, l, t, pf, pa = cur[team]
+        prev_rank = teams[team][-1][5] if teams[team] else None
+        change = (prev_rank - rank) if prev_rank is not None else 0
+        teams[team].append([w, l, t, round(pf, 2), round(pa, 2), rank, change])
+    cum["weeks"].append(week)
+    return cum
+
+def build_cumulative_standings(all_week_matchups, cum=None):
+    """
+    all_week_matchups: dict[int -> list[Matchup/Score]]
+    Baut (oder erweitert) die kumulative Tabelle. Wochen, die in cum bereits enthalten sind,
+    werden übersprungen – bei einer neuen Woche wird also nur diese eine angehängt.
+    """
+    cum = cum if cum is not None else empty_cumulative_standings()
+    last = cum["weeks"][-1] if cum["weeks"] else None
+    for w in sorted(all_week_matchups.keys()):
+        if last is not None and w <= last:
+            continue
+        append_cumulative_week(cum, w, all_week_matchups[w])
+    return cum
+
+def load_cumulative_standings(out_dir: Path, week_files):
+    """
+    Liest eine vorhandene cumulative_standings.json, falls sie weiterverwendet werden darf: nur wenn
+    ihre Wochen der Anfang der aktuellen Wochenliste sind (keine Woche fehlt oder ist dazwischen
+    hinzugekommen) und keine davon neuer ist als die JSON – sonst Rebuild.
+    """
+    f = out_dir / "cumulative_standings.json"
+    if not f.exists():
+        return None
+    try:
+        cum = json.loads(f.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+    if cum.get("columns") != CUM_COLUMNS:
+        return None
+    known = cum.get("weeks") or []
+    current = {int(wf.stem): wf for wf in week_files if wf.stem.isdigit()}
+    if known != sorted(current)[:len(known)]:
+        return None
+    mtime = f.stat().st_mtime
+    if any(current[w].stat().st_mtime > mtime for w in known):
+        return None
+    return cum
+
 # ---------- NEU: TSV-Parser für RegSeason-Finale & Playoffs ----------
 def read_tsv(path: Path):
     with path.open("r", encoding="utf-8") as f:
@@ -170,12 +270,12 @@ def read_tsv(path: Path):
 
 def build_regular_final_from_tsv(season: int):
     """
-    Liest output/history-standings/<season>.tsv mit Spalten:
+    Liest die Standings-TSV der Saison (standings_tsv) mit Spalten:
     TeamName, RegularSeasonRank, Record, PointsFor, PointsAgainst, PlayoffRank, ManagerName, Moves, Trades, DraftPosition
     und gibt eine sortierte Liste von Dicts zurück.
     """
-    tsv = HIST_DIR / f"{season}.tsv"
-    if not tsv.exists():
+    tsv = standings_tsv(season)
+    if tsv is None:
         return None
 
     def _safe_float_num(s):
@@ -232,8 +332,8 @@ def build_regular_final_from_tsv(season: int):
     return out
 
 def build_playoffs_from_tsv(season: int):
-    tsv = HIST_DIR / f"playoffs-{season}.tsv"
-    if not tsv.exists(): return None
+    tsv = standings_tsv(season, playoffs=True)
+    if tsv is None: return None
     rows = read_tsv(tsv)
     out = []
     for r in rows:
@@ -248,70 +348,253 @@ def build_playoffs_from_tsv(season: int):
     out.sort(key=lambda x: (x["playoff_rank"] if x["playoff_rank"] is not None else 999, x["team"] or ""))
     return out
 
-def build_season(season_dir: Path, season: int):
-    # 1) Wochen matchups/players wie bisher
-    week_files = sorted(season_dir.glob("*.csv")) + sorted(season_dir.glob("*.tsv"))
-    all_matchups, all_players = [], []
-    stats = defaultdict(lambda: {"pf":0.0,"pa":0.0,"wins":0,"losses":0,"ties":0})
-    by_week = defaultdict(list)   # ← für weekly standings
-
-    for wf in week_files:
-        try:
-            wk = int(wf.stem)
-        except ValueError:
+# ---------- Streaming-Ausgabe (gebundener Speicher) ----------
+class JsonArrayWriter:
+    """
+    Schreibt eine JSON-Liste stückweise (z. B. Woche für Woche) statt json.dumps(ganze_liste):
+    im Speicher liegt nur der aktuelle Block. Die Ausgabe ist byte-identisch zu
+    json.dumps(liste, ensure_ascii=False). Geschrieben wird in <datei>.tmp, erst close()
+    ersetzt die Zieldatei (nur bei geändertem Inhalt) – bei einem Fehler bleibt die alte Datei unverändert.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._f = self._tmp.open("w", encoding="utf-8")
+        self._f.write("[")
+
+    def extend(self, items):
+        self.extend_encoded([json.dumps(x, ensure_ascii=False) for x in items])
+
+    def extend_encoded(self, texts):
+        """Wie extend, aber mit bereits serialisierten Elementen (einmal kodiert, mehrfach geschrieben)."""
+        chunk = ", ".join(texts)
+        if not chunk:
+            return
+        if self.count:
+            chunk = ", " + chunk
+        with tracing.span("write", tracing.file_class(self.path), path=str(self.path)) as s:
+            self._f.write(chunk)
+            if tracing.ENABLED:
+                s.set(bytes=len(chunk.encode("utf-8")))
+        self.count += len(texts)
+
+    def close(self):
+        self._f.write("]")
+        self._f.close()
+        outputs.replace_if_changed(self._tmp, self.path)
+
+    def abort(self):
+        self._f.close()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.abort() if exc_type else self.close()
+
+class SeasonShards:
+    """
+    Kleine, einzeln ladbare Scheiben einer Saison – im selben Durchlauf wie matchups.json/players_games.json:
+      shards/week-<w>.{matchups,players_games}.json       (Woche komplett im Speicher -> direkt geschrieben)
+      shards/manager-<slug>.{matchups,players_games}.json (über die Wochen gestreamt, JsonArrayWriter je Datei)
+      shards/index.json  {"weeks": {w: {tabelle: {file, rows, bytes}}}, "managers": {name: {...}}}
+    Pfade im Index relativ zum Saisonordner; die vollen Saisondateien bleiben für Bulk-Nutzer.
+    """
+    TABLES = ("matchups", "players_games")
+
+    def __init__(self, season_out: Path, season: int):
+        self.season_out = season_out
+        self.dir = season_out / "shards"
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.season = season
+        self.weeks = {}
+        self._writers = {}   # (manager, tabelle) -> JsonArrayWriter
+        self._slugs = {}
+
+    def _slug(self, manager):
+        slug = self._slugs.get(manager)
+        if slug is None:
+            base = re.sub(r"[^a-z0-9]+", "-", (manager or "").lower()).strip("-") or "manager"
+            slug, n = base, 2
+            while slug in self._slugs.values():
+                slug, n = f"{base}-{n}", n + 1
+            self._slugs[manager] = slug
+        return slug
+
+    def _entry(self, path: Path, rows: int):
+        return {"file": path.relative_to(self.season_out).as_posix(), "rows": rows, "bytes": path.stat().st_size}
+
+    def add_week(self, week: int, matchups, players, matchups_json, players_json):
+        """*_json: dieselben Zeilen bereits serialisiert (wie für die Saisondateien) – keine zweite Kodierung."""
+        self.weeks[week] = {}
+        for table, texts in zip(self.TABLES, (matchups_json, players_json)):
+            path = self.dir / f"week-{week}.{table}.json"
+            tracing.write_text(path, "[" + ", ".join(texts) + "]")
+            self.weeks[week][table] = self._entry(path, len(texts))
+        by_manager = defaultdict(lambda: ([], []))
+        for m, text in zip(matchups, matchups_json):
+            by_manager[m.home_team][0].append(text)
+            by_manager[m.away_team][0].append(text)
+        for p, text in zip(players, players_json):
+            by_manager[p.manager][1].append(text)
+        for manager, tables in by_manager.items():
+            for table, texts in zip(self.TABLES, tables):
+                w = self._writers.get((manager, table))
+                if w is None:
+                    w = self._writers[(manager, table)] = JsonArrayWriter(self.dir / f"manager-{self._slug(manager)}.{table}.json")
+                w.extend_encoded(texts)
+
+    def close(self):
+        managers = defaultdict(dict)
+        for (manager, table), w in self._writers.items():
+            w.close()
+            managers[manager][table] = self._entry(w.path, w.count)
+        written = {e["file"] for group in (*self.weeks.values(), *managers.values()) for e in group.values()}
+        for f in self.dir.glob("*.json"):   # Scheiben entfernter Wochen / umbenannter Manager
+            if f.name != "index.json" and f.relative_to(self.season_out).as_posix() not in written:
+                f.unlink()
+        index = {"season": self.season,
+                 "weeks": {str(w): t for w, t in sorted(self.weeks.items())},
+                 "managers": {m: {t: managers[m][t] for t in self.TABLES if t in managers[m]} for m in sorted(managers)}}
+        tracing.write_text(self.dir / "index.json", json.dumps(index, ensure_ascii=False))
+
+    def abort(self):
+        for w in self._writers.values():
+            w.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.abort() if exc_type else self.close()
+
+def check_player_ids(season: int, week: int, players):
+    """
+    Ein Spieler steht je Woche in höchstens einem Kader-Slot. Taucht eine ID doppelt auf, hat der
+    PlayerIndex zwei Spieler zusammengelegt -> Build abbrechen statt falsche Karrieren zu schreiben.
+    """
+    seen, dupes = {}, []
+    for p in players:
+        if p.player_id is None:
             continue
-        team_rows, players = parse_week_file(wf, season, wk)
-        week_m = group_matchups(team_rows)
-        for m in week_m:
-            m["season"] = season; m["week"] = wk; m["is_playoff"] = False
-            all_matchups.append(m)
-            by_week[wk].append(m)
-
-            hp, ap = (m["home_points"] or 0.0), (m["away_points"] or 0.0)
-            ht, at = m["home_team"], m["away_team"]
-            stats[ht]["pf"] += hp; stats[ht]["pa"] += ap
-            stats[at]["pf"] += ap; stats[at]["pa"] += hp
-            if hp == ap: stats[ht]["ties"] += 1; stats[at]["ties"] += 1
-            elif hp > ap: stats[ht]["wins"] += 1; stats[at]["losses"] += 1
-            else:         stats[at]["wins"] += 1; stats[ht]["losses"] += 1
-        all_players.extend(players)
+        first = seen.setdefault(p.player_id, p)
+        if first is not p:
+            dupes.append(f"{p.player_id}: {first.player_raw!r} ({first.manager}) / {p.player_raw!r} ({p.manager})")
+    if dupes:
+        raise ValueError(f"{season} Woche {week}: player_id mehrfach vergeben – " + "; ".join(dupes))
+
+def week_sort_key(path: Path):
+    """Wochendateien numerisch (1, 2, …, 10) – neue Wochen landen so am Ende von matchups.json."""
+    return (0, int(path.stem), path.suffix) if path.stem.isdigit() else (1, path.stem, path.suffix)
+
+def build_season(season_dir: Path, season: int, index: PlayerIndex = None, h2h: H2HIndex = None,
+                 careers: CareerIndex = None):
+    # 1) Wochen matchups/players: pro Woche parsen und sofort anhängen (nur Team-Akkumulatoren bleiben im Speicher)
+    week_files = sorted([*season_dir.glob("*.csv"), *season_dir.glob("*.tsv")], key=week_sort_key)
+    h2h_weeks = h2h.prepare_season(season, week_files) if h2h is not None else None
+    # nur Sleeper-Saisons mit Transaktions-Log; Spieler per player_id -> nur mit PlayerIndex
+    ledger = TransactionLedger.load(season, index) if index is not None else None
+    if careers is not None:
+        careers.drop_season(season)
+    stats = defaultdict(lambda: {"pf":0.0,"pa":0.0,"wins":0,"losses":0,"ties":0})
+    by_week = defaultdict(list)   # ← für weekly standings (nur Score-Records, ohne Lineups)
 
     out = OUT_DIR / f"{season}"
     out.mkdir(parents=True, exist_ok=True)
 
-    (out/"matchups.json").write_text(json.dumps(all_matchups, ensure_ascii=False), encoding="utf-8")
-    (out/"players_games.json").write_text(json.dumps(all_players, ensure_ascii=False), encoding="utf-8")
-
+    with JsonArrayWriter(out/"matchups.json") as matchups_out, \
+         JsonArrayWriter(out/"players_games.json") as players_out, \
+         SeasonShards(out, season) as shards:
+        for wf in week_files:
+            try:
+                wk = int(wf.stem)
+            except ValueError:
+                continue
+            with tracing.span("parse", "week_csv", season=season, week=wk):
+                team_rows, players = parse_week_file(wf, season, wk)
+            week_m = group_matchups(team_rows)
+            for m in week_m:
+                m.season = season; m.week = wk; m.is_playoff = False
+                hp, ap = (m.home_points or 0.0), (m.away_points or 0.0)
+                ht, at = m.home_team, m.away_team
+                by_week[wk].append(m.score())
+
+                stats[ht]["pf"] += hp; stats[ht]["pa"] += ap
+                stats[at]["pf"] += ap; stats[at]["pa"] += hp
+                if hp == ap: stats[ht]["ties"] += 1; stats[at]["ties"] += 1
+                elif hp > ap: stats[ht]["wins"] += 1; stats[at]["losses"] += 1
+                else:         stats[at]["wins"] += 1; stats[ht]["losses"] += 1
+            if index is not None:
+                ids = index.resolve_week([(p.entry.player_raw, p.manager) for p in players], season)
+                for p, pid in zip(players, ids):
+                    p.player_id = pid
+                check_player_ids(season, wk, players)
+            if ledger is not None:
+                ledger.add_week(wk, players)
+            if careers is not None and index is not None:
+                careers.add_week(players)
+            if h2h is not None and wk not in h2h_weeks:
+                h2h.add_week(season, wk, week_m, matchups_out.count)
+            week_m_json = [m.encode() for m in week_m]      # JSON erst hier, direkt aus den Records
+            players_json = [p.encode() for p in players]
+            matchups_out.extend_encoded(week_m_json)
+            players_out.extend_encoded(players_json)
+            shards.add_week(wk, week_m, players, week_m_json, players_json)
+    n_matchups, n_players = matchups_out.count, players_out.count
+
+    tx_managers = {}
+    if ledger is not None:
+        tx_managers, tx_list = ledger.summary()
+        tracing.write_text(out/"transactions.json",
+                           json.dumps({"managers": tx_managers, "transactions": tx_list}, ensure_ascii=False))
     teams = [{"season": season, "team": t, "wins": v["wins"], "losses": v["losses"], "ties": v["ties"],
               "pf": round(v["pf"],2), "pa": round(v["pa"],2),
               "seed": None, "playoff_rank": None,
               "elo_end": None, "luck": None, "sos": None,
-              "optimal_lineup_eff": None, "waiver_points": None, "bench_points_wasted": None}
+              "optimal_lineup_eff": None,
+              "waiver_points": tx_managers.get(t, {}).get("waiver_points", 0.0) if ledger is not None else None,
+              "trade_net_points": tx_managers.get(t, {}).get("trade_net_points", 0.0) if ledger is not None else None,
+              "bench_points_wasted": None}
              for t,v in sorted(stats.items())]
-    (out/"teams.json").write_text(json.dumps(teams, ensure_ascii=False), encoding="utf-8")
+    tracing.write_text(out/"teams.json", json.dumps(teams, ensure_ascii=False))
 
     # 2) NEU: weekly standings aus by_week
     weekly = build_weekly_standings(by_week)
-    (out/"weekly_standings.json").write_text(json.dumps(weekly, ensure_ascii=False), encoding="utf-8")
+    tracing.write_text(out/"weekly_standings.json", json.dumps(weekly, ensure_ascii=False))
+    cumulative = build_cumulative_standings(by_week, load_cumulative_standings(out, week_files))
+    # touch: mtime = zuletzt geprüft (load_cumulative_standings vergleicht sie mit den Wochen-CSVs)
+    tracing.write_text(out/"cumulative_standings.json", json.dumps(cumulative, ensure_ascii=False), touch=True)
 
     # 3) NEU: TSVs für finale RegSeason & Playoffs (falls vorhanden)
     reg_final = build_regular_final_from_tsv(season)
     if reg_final is not None:
-        (out/"regular_final_standings.json").write_text(json.dumps(reg_final, ensure_ascii=False), encoding="utf-8")
+        tracing.write_text(out/"regular_final_standings.json", json.dumps(reg_final, ensure_ascii=False))
 
     playoffs = build_playoffs_from_tsv(season)
     if playoffs is not None:
-        (out/"playoffs_standings.json").write_text(json.dumps(playoffs, ensure_ascii=False), encoding="utf-8")
+        tracing.write_text(out/"playoffs_standings.json", json.dumps(playoffs, ensure_ascii=False))
 
-    print(f"✓ {season}: {len(all_matchups)} matchups, {len(all_players)} player-games, {len(teams)} teams, weekly={len(weekly)}")
+    print(f"✓ {season}: {n_matchups} matchups, {n_players} player-games, {len(teams)} teams, weekly={len(weekly)}")
 
 def run_all(seasons=range(2015, 2026)):
+    index = PlayerIndex.load()
+    h2h = H2HIndex.load()
+    careers = CareerIndex.load(index)
     for season in seasons:
         sd = RAW_DIR / str(season)
         if not sd.exists():
             print(f"– skip {season}, missing {sd}")
             continue
-        build_season(sd, season)
+        with tracing.stage("parse_weeks.build_season", season=season):
+            build_season(sd, season, index, h2h, careers)
+    index.save()
+    h2h.save()   # Schreib-Span in tracing.write_text
+    n_players, n_rows, n_bytes = careers.save()
+    print(f"✓ Spieler-Index: {len(index.players)} Spieler")
+    print(f"✓ H2H-Index: {len(h2h.managers)} Manager, {len(h2h.pairs)} Paarungen")
+    print(f"✓ Karriere-Index: {n_players} Spieler, {n_rows} Einsätze ({n_bytes / 1024:.0f} KB Spalten-Store)")
 
 if __name__ == "__main__":
     run_all()
@@ -0,0 +1,363 @@
+import csv, json, re, sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py liegt im Repo-Root
+import tracing, sleeper_api
+
+# Persistenter Index: Identität -> stabile Integer-ID (IDs werden nie neu vergeben)
+INDEX_FILE = Path("data/processed/players_index.json")
+# 2: Identität je Sleeper-ID / Langname / Kurzname + NFL-Team (1 war nur der Kurzname und warf z. B.
+#    Antonio Brown und A.J. Brown zusammen) – ein Index mit anderer Version wird neu aufgebaut
+INDEX_VERSION = 2
+# Cache der Sleeper-Spielerdatenbank (wird von den Sleeper-Scrapern geschrieben)
+SLEEPER_PLAYERS = sleeper_api.PLAYERS_FILE
+# Draft-TSVs (NFL.com bzw. Sleeper): Langnamen mit NFL-Team zur Auflösung der Kurzform ("A. Brown" + TEN)
+HIST_DRAFTS = Path("output/history-drafts")
+SLEEPER_OUT = Path("output")
+
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+# "C. Godwin WR - TB IR" / "J. Robinson RB" / "Cam Newton QB - CAR"
+_RAW_RE = re.compile(r"^(?P<name>.+?)\s+(?P<pos>QB|RB|WR|TE|K|DEF)(?:\s+-\s+(?P<team>[A-Z]{2,3}))?(?:\s+.*)?$")
+# NFL.com-/Gamecenter-Kurzform: eine Initiale mit Punkt ("A. Brown"); "A.J. Brown" ist ein Langname
+_SHORT_RE = re.compile(r"^[A-Za-z]\.\s")
+
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+# Umzüge und abweichende Kürzel (NFL.com vs. Sleeper): ein Spieler bleibt beim selben Team eine Identität
+TEAM_ALIASES = {"JAC": "JAX", "LA": "LAR", "STL": "LAR", "SD": "LAC", "OAK": "LV", "WSH": "WAS"}
+
+def _norm(s: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", (s or "").lower())
+
+def _team(team):
+    return TEAM_ALIASES.get(team, team) if team else None
+
+def parse_player_raw(raw):
+    """
+    Zerlegt einen player_raw-String in (name, pos, team).
+    Team fehlt bei Free Agents / DEF -> None. Leere Slots ("", "-", "--empty--") -> (None, None, None).
+    """
+    s = (raw or "").strip()
+    if s in ("", "-", "--empty--"):
+        return None, None, None
+    m = _RAW_RE.match(s)
+    if not m:
+        return s, None, None
+    return m.group("name").strip(), m.group("pos"), m.group("team")
+
+def player_key(name, pos):
+    """
+    Normalisierter Namensschlüssel, unabhängig vom Namensformat:
+    "Antonio Brown"/"A. Brown" + WR -> "a.brown|WR"; DEF -> "def|broncos".
+    Kein Spieler-Identifikator – "a.brown|WR" sind mehrere Spieler (PlayerIndex trennt sie).
+    """
+    if not name:
+        return None
+    tokens = [t for t in re.split(r"[\s.]+", name) if t]
+    if pos == "DEF":
+        # "Broncos", "D. Broncos", "Denver Broncos" -> Nickname
+        return f"def|{_norm(tokens[-1])}"
+    if len(tokens) == 1:
+        return f"{_norm(tokens[0])}|{pos or ''}"
+    # Initialen ("A.J.") zählen nur als Vorname, Suffixe (Jr./III) nicht zum Nachnamen
+    rest = [t for t in tokens[1:] if len(t) > 1 and t.lower() not in _SUFFIXES]
+    last = "".join(_norm(t) for t in rest) or _norm(tokens[-1])
+    return f"{_norm(tokens[0])[:1]}.{last}|{pos or ''}"
+
+def full_name(name):
+    """Der Name selbst, wenn er ein Langname ist ("Antonio Brown"), sonst None ("A. Brown")."""
+    return name if name and not _SHORT_RE.match(name) and len(name.split()) > 1 else None
+
+def _team_key(key, team):
+    return f"{key}|{_team(team) or ''}"
+
+def _name_key(name, pos):
+    return f"n:{_norm(name)}|{pos or ''}"
+
+def _alias(key, team, season):
+    return f"{_team_key(key, team)}|{season or ''}"
+
+def read_draft_names():
+    """(player_key, NFL-Team) -> {Saison: Langnamen} aus allen Draft-TSVs."""
+    names = defaultdict(lambda: defaultdict(set))
+    files = [(int(p.name.split("-")[0]), p) for p in HIST_DRAFTS.glob("*-draft.tsv") if p.name[:4].isdigit()]
+    files += [(int(p.parent.name), p) for p in SLEEPER_OUT.glob("*/draft.tsv") if p.parent.name.isdigit()]
+    for season, path in sorted(files):
+        with path.open("r", encoding="utf-8") as f:
+            for r in csv.DictReader(f, delimiter="\t"):
+                name, pos = (r.get("Player") or "").strip(), (r.get("Pos") or "").strip() or None
+                team = (r.get("NFLTeam") or "").strip() or None
+                if pos != "DEF" and full_name(name) and team:
+                    names[(player_key(name, pos), _team(team))][season].add(name)
+    return names
+
+class PlayerIndex:
+    """
+    Interniert Spieler-Strings zu kleinen Integer-IDs.
+    players[id] = {"id", "key", "name", "pos", "team", "teams", "sleeper_id"}
+
+    Identität (players[id]["key"]), in dieser Reihenfolge:
+      "sleeper:<id>"          Sleeper-player_id, wenn sie eindeutig auflöst (Langname bzw. Kurzname + Team)
+      "n:antoniobrown|WR"     Langname aus der Zeile selbst oder eindeutig aus den Drafts (Kurzform + Team)
+      "a.brown|WR|TEN"        sonst Kurzname + NFL-Team – getrennt statt über Teams hinweg zusammengeworfen
+      "def|broncos"           Defenses
+    Langnamen aus Drafts gelten nur für die Draft-Saison und spätere Saisons (Duke Johnson HOU 2019 ist nicht
+    der 2020 als HOU gedraftete David Johnson). by_key enthält zusätzlich alle Aliasse (Kurzname + Team +
+    Saison, Langname) -> ID, damit dieselbe Zeile in jedem Lauf dieselbe ID bekommt, auch wenn später
+    weitere Drafts/Sleeper-Daten dazukommen.
+    Bleibt ein Label trotzdem mehrdeutig (Damien und Darrel Williams, beide "D. Williams RB - KC" 2019),
+    trennt resolve_week nach Kader: steht eine ID in einer Woche bei zwei Managern, behält sie der
+    bisherige Besitzer, der andere bekommt eine Geschwister-Identität "<key>#2" und behält diese.
+    """
+    def __init__(self):
+        self.by_key = {}
+        self.players = []
+        self.rebuilt = False     # Index mit alter Version verworfen -> abhängige Caches (Karrieren) neu
+        self._by_short = defaultdict(set)   # player_key ("a.brown|WR") -> IDs
+        self._by_season = defaultdict(set)  # (player_key, Saison) -> IDs, die in der Saison aufgetaucht sind
+        self._siblings = {}   # ID -> [ID, Geschwister-IDs] bei Labels, hinter denen mehrere Spieler stehen
+        self._owner = {}      # ID -> Manager, der den Spieler zuletzt im Kader hatte (nur während des Laufs)
+        self._raw_cache = {}
+        self._sleeper = None
+        self._drafts = None
+
+    # ---------- Laden / Speichern ----------
+    @classmethod
+    def load(cls, path: Path = INDEX_FILE):
+        idx = cls()
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                idx.rebuilt = True
+                return idx
+            for p in data["players"]:
+                idx.players.append(p)
+                idx.by_key[p["key"]] = p["id"]
+                idx._by_short[player_key(p["name"], p["pos"])].add(p["id"])
+                if "#" in p["key"]:
+                    primary = idx.by_key[p["key"].rsplit("#", 1)[0]]
+                    idx._siblings.setdefault(primary, [primary]).append(p["id"])
+            for alias, pid in data.get("aliases", {}).items():
+                idx.by_key.setdefault(alias, pid)
+                parts = alias.split("|")
+                if len(parts) == 4 and parts[3]:   # Kurzname|Pos|Team|Saison
+                    idx._by_season[(f"{parts[0]}|{parts[1]}", int(parts[3]))].add(pid)
+        return idx
+
+    def save(self, path: Path = INDEX_FILE):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        aliases = {k: pid for k, pid in sorted(self.by_key.items()) if self.players[pid]["key"] != k}
+        payload = {"version": INDEX_VERSION,
+                   "columns": ["id", "key", "name", "pos", "team", "teams", "sleeper_id"],
+                   "players": self.players, "aliases": aliases}
+        tracing.write_text(path, json.dumps(payload, ensure_ascii=False))
+
+    # ---------- Sleeper-Mapping / Drafts ----------
+    def _sleeper_map(self):
+        """player_key bzw. Langname-Schlüssel -> [(Sleeper player_id, Team, full_name)]."""
+        if self._sleeper is not None:
+            return self._sleeper
+        self._sleeper = defaultdict(list)
+        if not SLEEPER_PLAYERS.exists():
+            return self._sleeper
+        db = json.loads(SLEEPER_PLAYERS.read_text(encoding="utf-8"))
+        for pid, p in db.items():
+            pos = p.get("position")
+            if pos not in POSITIONS or pos == "DEF":
+                continue
+            name = p.get("full_name") or f"{p.get('first_name') or ''} {p.get('last_name') or ''}".strip()
+            key = player_key(name, pos)
+            if key:
+                entry = (pid, _team(p.get("team")), name)
+                self._sleeper[key].append(entry)
+                self._sleeper[_name_key(name, pos)].append(entry)
+        return self._sleeper
+
+    def _sleeper_player(self, key, pos, team, full):
+        """(Sleeper player_id, full_name) nur bei eindeutigem Treffer: Langname, sonst Kurzname (+ Team)."""
+        db = self._sleeper_map()
+        if full:
+            cands = db.get(_name_key(full, pos)) or []
+            if len(cands) == 1:
+                return cands[0][0], cands[0][2]
+            if cands:
+                cands = [c for c in cands if team and c[1] == team]
+                return (cands[0][0], cands[0][2]) if len(cands) == 1 else (None, None)
+        cands = db.get(key) or []
+        if len(cands) == 1:
+            return cands[0][0], cands[0][2]
+        same_team = [c for c in cands if team and c[1] == team]
+        return (same_team[0][0], same_team[0][2]) if len(same_team) == 1 else (None, None)
+
+    def _draft_name(self, key, team, season):
+        """Eindeutiger Langname zu Kurzname + Team aus dem Draft dieser Saison, sonst dem letzten davor."""
+        if self._drafts is None:
+            self._drafts = read_draft_names()
+        by_season = self._drafts.get((key, team))
+        if not by_season:
+            return None
+        seasons = [s for s in by_season if season is None or s <= season]
+        names = by_season[max(seasons)] if seasons else ()
+        return next(iter(names)) if len(names) == 1 else None
+
+    # ---------- Interning ----------
+    def _new(self, ident, name, pos, team, sleeper_id):
+        pid = len(self.players)
+        self.by_key[ident] = pid
+        self.players.append({"id": pid, "key": ident, "name": name, "pos": pos,
+                             "team": team, "teams": [team] if team else [], "sleeper_id": sleeper_id})
+        self._by_short[player_key(name, pos)].add(pid)
+        return pid
+
+    def _identify(self, key, name, pos, team, season):
+        """ID zu Name + Position + NFL-Team in einer Saison; legt bei Bedarf eine neue Identität an."""
+        full = full_name(name) or (self._draft_name(key, team, season) if team else None)
+        sid, sleeper_name = self._sleeper_player(key, pos, team, full)
+        full = full or sleeper_name
+        candidates = [f"sleeper:{sid}" if sid else None, _name_key(full, pos) if full else None,
+                      None if full else _team_key(key, team)]
+        pid = next((self.by_key[k] for k in candidates if k in self.by_key), None)
+        if pid is None and not team and not full:
+            # Free Agent ohne Team: nur wenn der Kurzname genau einen bekannten Spieler meint
+            ids = self._by_short.get(key) or ()
+            pid = next(iter(ids)) if len(ids) == 1 else None
+        if pid is None:
+            pid = self._new(next(k for k in candidates if k), full or name, pos, team, sid)
+        for k in candidates:
+            if k:
+                self.by_key.setdefault(k, pid)
+        return pid
+
+    def intern(self, name, pos, team=None, season=None):
+        key = player_key(name, pos)
+        if key is None:
+            return None
+        team = _team(team)
+        if pos == "DEF":
+            pid = self.by_key.get(key)
+            if pid is None:
+                pid = self._new(key, name, pos, team, None)
+        else:
+            alias = _alias(key, team, season)
+            pid = self.by_key.get(alias)
+            if pid is None:
+                pid = self.by_key[alias] = self._identify(key, name, pos, team, season)
+                if season is not None:
+                    self._by_season[(key, season)].add(pid)
+        p = self.players[pid]
+        # Langform ("Antonio Brown") schlägt Kurzform ("A. Brown") als Anzeigename
+        if full_name(name) and not full_name(p["name"]):
+            p["name"] = name
+        if team and team != p["team"]:
+            p["team"] = team
+            if team not in p["teams"]:
+                p["teams"].append(team)
+        return pid
+
+    def resolve(self, raw, season=None, sleeper_id=None):
+        """
+        player_raw einer Saison -> ID (gecacht je String und Saison, d. h. jeder String wird nur einmal
+        geparst). Mit bekannter Sleeper-player_id (Transaktions-Log) gewinnt deren Identität.
+        """
+        if sleeper_id is not None and f"sleeper:{sleeper_id}" in self.by_key:
+            return self.by_key[f"sleeper:{sleeper_id}"]
+        try:
+            return self._raw_cache[(raw, season)]
+        except KeyError:
+            pass
+        name, pos, team = parse_player_raw(raw)
+        pid = self.intern(name, pos, team, season)
+        self._raw_cache[(raw, season)] = pid
+        return pid
+
+    def _sibling(self, pid, n, raw):
+        ident = f"{self.players[pid]['key']}#{n}"
+        if ident in self.by_key:
+            return self.by_key[ident]
+        name, pos, team = parse_player_raw(raw)
+        return self._new(ident, name, pos, _team(team), None)
+
+    def resolve_week(self, rows, season):
+        """
+        [(player_raw, manager)] einer Woche -> IDs. Ein Spieler steht je Woche nur in einem Kader:
+        löst ein Label bei mehreren Managern auf dieselbe ID auf, sind es verschiedene Spieler.
+        """
+        ids = [self.resolve(raw, season) for raw, _ in rows]
+        owners = {}
+        shared = set()   # IDs bei mehr als einem Manager
+        for (_, m), pid in zip(rows, ids):
+            if owners.setdefault(pid, m) != m:
+                shared.add(pid)
+        shared |= self._siblings.keys() & owners.keys()
+        shared.discard(None)
+        for pid in shared:
+            rows_i = [i for i, p in enumerate(ids) if p == pid]
+            managers = list(dict.fromkeys(rows[i][1] for i in rows_i))
+            family = self._siblings.setdefault(pid, [pid])
+            taken = {}
+            # bisherige Besitzer zuerst, dann freie Geschwister, sonst ein neues
+            for m in sorted(managers, key=lambda m: all(self._owner.get(f) != m for f in family)):
+                free = [f for f in family if f not in taken.values()]
+                sib = next((f for f in free if self._owner.get(f) == m), None)
+                if sib is None:
+                    sib = next((f for f in free if self._owner.get(f) not in managers), None)
+                if sib is None:
+                    sib = self._sibling(pid, len(family) + 1, rows[rows_i[0]][0])
+                    family.append(sib)
+                taken[m] = sib
+            for i in rows_i:
+                ids[i] = taken[rows[i][1]]
+        self._owner.update((pid, m) for (_, m), pid in zip(rows, ids) if pid is not None)
+        return ids
+
+    def lookup(self, name, pos, team=None, season=None):
+        """
+        Hash-Lookup für Joins (Draft-TSVs, players.tsv) ohne neue IDs. Mit Saison zählen zuerst die Spieler,
+        die in der Saison unter dem Kurznamen aufgetaucht sind: der mit dem Langnamen, Kurzname + Team (ohne
+        Team: der Free Agent) oder der einzige; sonst Langname, Kurzname + Team bzw. der Kurzname, wenn er genau einen Spieler meint.
+        None, wenn nichts eindeutig passt.
+        """
+        key = player_key(name, pos)
+        if key is None:
+            return None
+        if pos == "DEF":
+            return self.by_key.get(key)
+        full, team = full_name(name), _team(team)
+        by_name = self.by_key.get(_name_key(full, pos)) if full else None
+        in_season = self._by_season.get((key, season)) or set() if season is not None else set()
+        if by_name in in_season:
+            return by_name
+        if season is not None and _alias(key, team, season) in self.by_key:   # auch ohne Team (Free Agent)
+            return self.by_key[_alias(key, team, season)]
+        if len(in_season) == 1:
+            return next(iter(in_season))
+        if by_name is not None:
+            return by_name
+        if team and _team_key(key, team) in self.by_key:
+            return self.by_key[_team_key(key, team)]
+        ids = self._by_short.get(key) or ()
+        return next(iter(ids)) if len(ids) == 1 else None
+
+    def candidates(self, name, pos=None, team=None):
+        """
+        Alle IDs, die zu einem (Such-)Namen passen – für Abfragen, nicht für Joins: exakter Langname
+        zuerst, dann Kurzname; optional nach Position und NFL-Team gefiltert.
+        """
+        if not name:
+            return []
+        team = _team(team)
+        poss = [pos] if pos else list(POSITIONS)
+        full = full_name(name)
+        exact = {self.by_key[k] for k in (_name_key(full, p) for p in poss) if full and k in self.by_key}
+        short = set()
+        for p in poss:
+            short |= self._by_short.get(player_key(name, p)) or set()
+        out = []
+        for pid in (*sorted(exact), *sorted(short - exact)):
+            if team and team not in self.players[pid]["teams"]:
+                continue
+            out.append(pid)
+        return out
+
+    def get(self, pid):
+        return self.players[pid] if pid is not None else None
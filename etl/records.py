@@ -0,0 +1,140 @@
+import json, math
+from dataclasses import dataclass
+from sys import intern
+
+# Kompakte Datensätze des ETL statt Dicts mit wiederholten Schlüsseln: __slots__-Dataclasses,
+# wiederkehrende Strings (Manager, Slot, Position, Spieler) interniert, JSON erst beim Schreiben.
+# encode() liefert exakt json.dumps(to_json(), ensure_ascii=False) – ohne den Umweg über ein Dict.
+
+def istr(s):
+    """Interniert Strings (None/"" bleiben unverändert)."""
+    return intern(s) if s else s
+
+_JS = {}
+def _js(s):
+    """JSON-String-Literal, je (internierten) String nur einmal kodiert."""
+    try:
+        return _JS[s]
+    except KeyError:
+        v = _JS[s] = json.dumps(s, ensure_ascii=False)
+        return v
+
+def _num(x):
+    if x is None:
+        return "null"
+    if isinstance(x, bool):
+        return "true" if x else "false"
+    if isinstance(x, float) and math.isfinite(x):
+        return float.__repr__(x)
+    return json.dumps(x)
+
+@dataclass(slots=True)
+class LineupEntry:
+    slot: str
+    player_raw: str
+    pos: str
+    points: float
+
+    def to_json(self):
+        return {"slot": self.slot, "player_raw": self.player_raw, "pos": self.pos, "points": self.points}
+
+    def encode(self):
+        return (f'{{"slot": {_js(self.slot)}, "player_raw": {_js(self.player_raw)}, '
+                f'"pos": {_js(self.pos)}, "points": {_num(self.points)}}}')
+
+@dataclass(slots=True)
+class TeamWeek:
+    """Eine Zeile der Gamecenter-CSV: Team, Gegner, Totals und Lineup."""
+    owner: str
+    opponent: str
+    total: float
+    opponent_total: float
+    starters: list
+    bench: list
+
+    def lineup_json(self):
+        return {"starters": [e.to_json() for e in self.starters], "bench": [e.to_json() for e in self.bench]}
+
+    def encode_lineup(self):
+        return (f'{{"starters": [{", ".join(e.encode() for e in self.starters)}], '
+                f'"bench": [{", ".join(e.encode() for e in self.bench)}]}}')
+
+@dataclass(slots=True)
+class Score:
+    """Ergebnis ohne Lineups (für Standings, die über die ganze Saison im Speicher bleiben)."""
+    home_team: str
+    away_team: str
+    home_points: float
+    away_points: float
+
+@dataclass(slots=True)
+class Matchup:
+    home: TeamWeek
+    away: TeamWeek
+    season: int = None
+    week: int = None
+    is_playoff: bool = False
+
+    @property
+    def home_team(self): return self.home.owner
+    @property
+    def away_team(self): return self.away.owner
+    @property
+    def home_points(self): return self.home.total
+    @property
+    def away_points(self): return self.away.total
+
+    def score(self):
+        return Score(self.home.owner, self.away.owner, self.home.total, self.away.total)
+
+    def to_json(self):
+        return {"home_team": self.home.owner, "away_team": self.away.owner,
+                "home_points": self.home.total, "away_points": self.away.total,
+                "home_lineup": self.home.lineup_json(), "away_lineup": self.away.lineup_json(),
+                "season": self.season, "week": self.week, "is_playoff": self.is_playoff}
+
+    def encode(self):
+        return (f'{{"home_team": {_js(self.home.owner)}, "away_team": {_js(self.away.owner)}, '
+                f'"home_points": {_num(self.home.total)}, "away_points": {_num(self.away.total)}, '
+                f'"home_lineup": {self.home.encode_lineup()}, "away_lineup": {self.away.encode_lineup()}, '
+                f'"season": {_num(self.season)}, "week": {_num(self.week)}, "is_playoff": {_num(self.is_playoff)}}}')
+
+NO_ID = object()   # player_id nicht aufgelöst (ohne PlayerIndex) -> Feld fehlt im JSON
+
+@dataclass(slots=True)
+class PlayerGame:
+    """Ein Spieler-Einsatz; teilt sich den LineupEntry mit dem TeamWeek statt ihn zu kopieren."""
+    season: int
+    week: int
+    manager: str
+    opponent: str
+    entry: LineupEntry
+    is_starter: bool
+    player_id: object = NO_ID
+
+    @property
+    def slot(self): return self.entry.slot
+    @property
+    def pos(self): return self.entry.pos
+    @property
+    def player_raw(self): return self.entry.player_raw
+    @property
+    def points(self): return self.entry.points
+
+    def to_json(self):
+        e = self.entry
+        d = {"season": self.season, "week": self.week, "manager": self.manager, "opponent": self.opponent,
+             "slot": e.slot, "pos": e.pos, "player_raw": e.player_raw, "points": e.points,
+             "is_starter": self.is_starter}
+        if self.player_id is not NO_ID:
+            d["player_id"] = self.player_id
+        return d
+
+    def encode(self):
+        e = self.entry
+        s = (f'{{"season": {_num(self.season)}, "week": {_num(self.week)}, "manager": {_js(self.manager)}, '
+             f'"opponent": {_js(self.opponent)}, "slot": {_js(e.slot)}, "pos": {_js(e.pos)}, '
+             f'"player_raw": {_js(e.player_raw)}, "points": {_num(e.points)}, "is_starter": {_num(self.is_starter)}')
+        if self.player_id is not NO_ID:
+            s += f', "player_id": {_num(self.player_id)}'
+        return s + "}"
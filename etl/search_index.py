@@ -0,0 +1,220 @@
+import json, re, sys, unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py/outputs.py liegen im Repo-Root
+import tracing
+
+from player_ids import INDEX_FILE, SLEEPER_PLAYERS, full_name, player_key
+from careers import CAREERS_FILE
+
+# Type-ahead-Suchindex über Spieler, Manager und Teamnamen als ein JSON-Blob – die Seite lädt ihn einmal
+# und braucht danach keine Saison-Datei mehr:
+#   entries   [[typ, label, detail, ref, kontext], ...]  typ "m" Manager, "t" Teamname, "p" Spieler;
+#             sortiert nach Rang (Manager, Teamnamen, dann Spieler nach Einsätzen + Starts) -> ID = Rang
+#   tokens    sortierte, normalisierte Tokens aller Namen (a-z0-9, Akzente/Apostrophe entfernt)
+#   postings  je Token (gleicher Index) die Eintrags-IDs aufsteigend, delta-kodiert
+#   keys      Namensschlüssel Initiale + Nachname ("a.brown", wie player_ids.player_key ohne Position) ->
+#             alle Spieler-Einträge mit diesem Schlüssel, nach Rang ("A. Brown" sind Antonio und A.J. Brown)
+# Ein Spieler-Eintrag je player_id; ref -> player_id (für /player bzw. player_careers.json),
+# Manager/Team -> Managername. kontext (nur Spieler): [erste Saison, letzte Saison, [NFL-Teams]]
+#
+# Lookup (Referenz: SearchIndex.lookup; im Browser genauso):
+#   1. Anfrage wie die Namen tokenisieren ("A. Brown" -> ["a", "brown"])
+#   2. je Token per binärer Suche den Bereich der tokens mit diesem Präfix, Postings des Bereichs vereinigen
+#   3. Schnitt über alle Tokens der Anfrage
+#   4. Token ohne Präfix-Treffer (ab 4 Zeichen): Tokens mit höchstens einem Tippfehler im Präfix
+#   5. Treffer nach ID aufsteigend = nach Popularität, danach die übrigen Kandidaten des Namensschlüssels
+#      der Anfrage aus keys: "Antonio Brown" findet so auch Spieler, die nur als "A. Brown" bekannt sind
+#      (NFL.com) – hinter dem eindeutigen Treffer statt mit ihm vermischt
+#   6. mit Kontext (team, season) zuerst die Spieler, die für das Team bzw. in der Saison gespielt haben;
+#      die ersten k sind das Ergebnis
+SEARCH_FILE = Path("data/processed/search_index.json")
+SEASONS_DIR = Path("data/processed/seasons")
+TYPE_RANK = {"m": 0, "t": 1, "p": 2}
+FUZZY_MIN = 4
+
+_APOSTROPHES = re.compile(r"['’`´]")
+_SPLIT = re.compile(r"[^a-z0-9]+")
+
+def tokens(text):
+    s = unicodedata.normalize("NFKD", text or "")
+    s = "".join(c for c in s if not unicodedata.combining(c)).lower()
+    return [t for t in _SPLIT.split(_APOSTROPHES.sub("", s)) if t]
+
+def name_key(text):
+    """ "Antonio Brown"/"A. Brown" -> "a.brown"; None bei nur einem Wort."""
+    if len(tokens(text)) < 2:
+        return None
+    key = player_key(text, None)
+    return key.split("|")[0] if key else None
+
+def _within_one(a, b):
+    """Editierdistanz(a, b) <= 1."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    return a[i + 1:] == b[i + 1:] or a[i + 1:] == b[i:] or a[i:] == b[i + 1:]
+
+class SearchIndex:
+    def __init__(self, data):
+        self.entries = data["entries"]
+        self.tokens = data["tokens"]
+        self.keys = data["keys"]
+        self.postings = []
+        for deltas in data["postings"]:
+            ids, last = [], 0
+            for d in deltas:
+                last += d
+                ids.append(last)
+            self.postings.append(ids)
+
+    @classmethod
+    def load(cls, path: Path = SEARCH_FILE):
+        return cls(json.loads(path.read_text(encoding="utf-8")))
+
+    def _prefix(self, tok):
+        lo = bisect_left(self.tokens, tok)
+        hi = lo
+        while hi < len(self.tokens) and self.tokens[hi].startswith(tok):
+            hi += 1
+        return range(lo, hi)
+
+    def _fuzzy(self, tok):
+        return [i for i, t in enumerate(self.tokens)
+                if t[0] == tok[0] and any(_within_one(tok, t[:n]) for n in (len(tok) - 1, len(tok), len(tok) + 1))]
+
+    def matches(self, tok):
+        rows = self._prefix(tok)
+        if not rows and len(tok) >= FUZZY_MIN:
+            rows = self._fuzzy(tok)
+        ids = set()
+        for i in rows:
+            ids.update(self.postings[i])
+        return ids
+
+    def _fits(self, eid, team, season):
+        """(passt zum Team, passt zur Saison) – ohne Kontext bzw. für Manager/Teamnamen immer True."""
+        ctx = self.entries[eid][4] if len(self.entries[eid]) > 4 else None
+        if ctx is None:
+            return True, True
+        first, last, teams = ctx
+        return team is None or team in teams, season is None or first <= season <= last
+
+    def lookup(self, query, k=10, team=None, season=None):
+        """
+        Die k populärsten Einträge zur Anfrage als Dicts (type, label, detail, ref); mit team/season
+        werden Spieler mit passendem Kontext vorgezogen.
+        """
+        toks = tokens(query)
+        if not toks:
+            return []
+        hits = None
+        for tok in sorted(toks, key=len, reverse=True):   # lange Tokens zuerst: kleinste Mengen
+            ids = self.matches(tok)
+            hits = ids if hits is None else hits & ids
+            if not hits:
+                break
+        ranked = sorted(hits)
+        ranked += [i for i in self.keys.get(name_key(query), ()) if i not in hits]
+        if team is not None or season is not None:
+            team = team.upper() if team else None
+            ranked.sort(key=lambda i: [not f for f in self._fits(i, team, season)])   # stabil: Rang bleibt
+        return [dict(zip(("type", "label", "detail", "ref"), self.entries[i])) for i in ranked[:k]]
+
+# ---------- Aufbau ----------
+def _load_json(path: Path, default):
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else default
+
+def _league_names():
+    """Manager und abweichende Teamnamen mit ihren Saisons (standings + teams.json)."""
+    managers, teams = defaultdict(set), defaultdict(lambda: [set(), set()])   # team -> [managers, seasons]
+    for d in sorted(p for p in SEASONS_DIR.glob("*") if p.name.isdigit()):
+        season = int(d.name)
+        rows = _load_json(d / "regular_final_standings.json", None) or []
+        for r in rows:
+            if r.get("manager"):
+                managers[r["manager"]].add(season)
+        for r in rows:
+            team = r.get("team")
+            if team and team not in managers:
+                teams[team][0].add(r.get("manager"))
+                teams[team][1].add(season)
+        if not rows:   # ohne Standings-TSV: die Namen der Matchups sind die Manager
+            for t in _load_json(d / "teams.json", []):
+                managers[t["team"]].add(season)
+    return managers, teams
+
+def _seasons_label(seasons):
+    lo, hi = min(seasons), max(seasons)
+    return str(lo) if lo == hi else f"{lo}–{hi}"
+
+def _aliases(players):
+    """player_id -> weitere Schreibweisen: Langnamen aus den Draft-Picks und der Sleeper-DB."""
+    aliases = defaultdict(set)
+    for path in SEASONS_DIR.glob("*/draft_value.json"):
+        for pick in _load_json(path, {}).get("picks", []):
+            if pick.get("player_id") is not None:
+                aliases[pick["player_id"]].add(pick["player"])
+    wanted = {p["sleeper_id"]: p["id"] for p in players if p.get("sleeper_id")}
+    if wanted and SLEEPER_PLAYERS.exists():
+        with tracing.span("parse", "sleeper_players.json"):
+            db = json.loads(SLEEPER_PLAYERS.read_text(encoding="utf-8"))
+        for sid, pid in wanted.items():
+            full = (db.get(sid) or {}).get("full_name")
+            if full:
+                aliases[pid].add(full)
+    return aliases
+
+def build():
+    players = _load_json(INDEX_FILE, {"players": []})["players"]
+    careers = _load_json(CAREERS_FILE, {"players": {}})["players"]   # games = 5, starts = 6, Saisons = 9/10
+    aliases = _aliases(players)
+    managers, teams = _league_names()
+
+    items = []   # (typ-rang, -popularität, label, [typ, label, detail, ref], namensformen, weitere tokens)
+    for m, seasons in managers.items():
+        items.append((TYPE_RANK["m"], -len(seasons), m, ["m", m, _seasons_label(seasons), m], [m], []))
+    for team, (owners, seasons) in teams.items():
+        owner = "/".join(sorted(o for o in owners if o))
+        items.append((TYPE_RANK["t"], -len(seasons), team,
+                      ["t", team, f"{owner} · {_seasons_label(seasons)}".lstrip(" ·"), owner or None], [team], []))
+    for p in players:
+        c = careers.get(str(p["id"]))
+        if not c:
+            continue   # nie eingesetzt (z. B. nur im Transaktions-Log)
+        forms = [p["name"], *sorted(aliases.get(p["id"], set()) - {p["name"]})]
+        # Anzeige: eindeutige Langform ("Antonio Brown") statt der NFL.com-Kurzform ("A. Brown")
+        label = forms[1] if not full_name(p["name"]) and len(forms) == 2 else p["name"]
+        seasons = (c[9], c[10])
+        detail = " · ".join(x for x in (p["pos"], "/".join(p["teams"]), _seasons_label(seasons)) if x)
+        items.append((TYPE_RANK["p"], -(c[5] + c[6]), label,
+                      ["p", label, detail, p["id"], [c[9], c[10], p["teams"]]],
+                      forms, [p["pos"] or "", *p["teams"]]))
+    items.sort(key=lambda it: it[:3])
+
+    postings, keys = defaultdict(list), defaultdict(list)
+    for eid, (_, _, _, entry, forms, extra) in enumerate(items):
+        for tok in sorted({t for n in (*forms, *extra) for t in tokens(n)}):
+            postings[tok].append(eid)
+        if entry[0] == "p":
+            for key in sorted({name_key(n) for n in forms} - {None}):
+                keys[key].append(eid)
+    toks = sorted(postings)
+    deltas = [[ids[0], *(b - a for a, b in zip(ids, ids[1:]))] for ids in (postings[t] for t in toks)]
+    return {"version": 2, "entries": [it[3] for it in items], "tokens": toks, "postings": deltas,
+            "keys": dict(sorted(keys.items()))}
+
+def run():
+    data = build()
+    SEARCH_FILE.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    tracing.write_text(SEARCH_FILE, text)
+    print(f"✓ Suchindex: {len(data['entries'])} Einträge, {len(data['tokens'])} Tokens "
+          f"({len(text.encode('utf-8')) / 1024:.0f} KB)")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,112 @@
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from player_ids import PlayerIndex
+
+# Transaktions-Log der Sleeper-Scraper (scrapeSleeperTransactions.py): output/<season>/transactions.jsonl
+TX_DIR = Path("output")
+LOG_NAME = "transactions.jsonl"
+PICKUP_TYPES = ("waiver", "free_agent")
+
+class TransactionLedger:
+    """
+    Verknüpft das Transaktions-Log einer Saison mit den player-games (Woche für Woche aus parse_weeks).
+    Ein Spieler-Spiel zählt für die letzte Erwerbung (Waiver/FA/Trade) desselben Spielers durch
+    denselben Manager bis einschließlich dieser Woche – also genau solange er auf dem Kader steht.
+    Spieler werden über die player_id des PlayerIndex verknüpft (Sleeper-ID bzw. Label der Saison),
+    so wie parse_weeks die player-games auflöst.
+    """
+    def __init__(self, season: int, records, index: PlayerIndex):
+        self.season = season
+        self.index = index
+        self.txs = {}
+        self.acquired = defaultdict(list)   # (manager, player_id) -> [(week, created, transaction_id)]
+        self.points = defaultdict(lambda: [0.0, 0.0, 0, 0])   # (transaction_id, manager, id) -> pts, started, g, gs
+        latest = {}
+        for r in records:
+            latest[r["transaction_id"]] = r   # letzte Zeile je ID gilt
+        for r in sorted(latest.values(), key=lambda r: (r["week"], r.get("created") or 0)):
+            if r.get("status") != "complete" or not r.get("adds"):
+                continue
+            self.txs[r["transaction_id"]] = r
+            for sid, rid in r["adds"].items():
+                pid = self.player_id(r, sid)
+                manager = r["managers"].get(str(rid))
+                if pid is not None and manager:
+                    self.acquired[(manager, pid)].append((r["week"], r.get("created") or 0, r["transaction_id"]))
+
+    @classmethod
+    def load(cls, season: int, index: PlayerIndex, tx_dir: Path = TX_DIR):
+        """Ledger einer Saison oder None, wenn es kein Log gibt (z. B. NFL.com-Saisons)."""
+        path = tx_dir / str(season) / LOG_NAME
+        if not path.exists():
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            return cls(season, [json.loads(line) for line in f if line.strip()], index)
+
+    def player_id(self, r, sid):
+        """player_id eines Sleeper-Spielers einer Transaktion (der PlayerIndex cacht je Label)."""
+        return self.index.resolve(r["players"].get(sid), self.season, sleeper_id=sid)
+
+    def add_week(self, week: int, players):
+        """player-games einer Woche (records.PlayerGame) den Erwerbungen zuordnen."""
+        for p in players:
+            acq = self.acquired.get((p.manager, p.player_id))
+            if not acq:
+                continue
+            tx_id = None
+            for w, _, t in acq:   # chronologisch; letzte Erwerbung bis zu dieser Woche
+                if w > week:
+                    break
+                tx_id = t
+            if tx_id is None:
+                continue
+            acc = self.points[(tx_id, p.manager, p.player_id)]
+            pts = p.points or 0.0
+            acc[0] += pts; acc[2] += 1
+            if p.is_starter:
+                acc[1] += pts; acc[3] += 1
+
+    def summary(self):
+        """(Manager -> Kennzahlen, Transaktionsliste mit Punkten je Zugang)."""
+        managers = defaultdict(lambda: {"pickups": 0, "waiver_points": 0.0, "waiver_bench_points": 0.0,
+                                        "trades": 0, "trade_points_in": 0.0, "trade_points_out": 0.0})
+        out = []
+        for tx_id, r in self.txs.items():
+            pickup = r["type"] in PICKUP_TYPES
+            moves = []
+            for sid, rid in r["adds"].items():
+                label = r["players"].get(sid)
+                pid = self.player_id(r, sid)
+                to = r["managers"].get(str(rid))
+                giver = r.get("drops", {}).get(sid) if r["type"] == "trade" else None
+                frm = r["managers"].get(str(giver)) if giver is not None else None
+                pts, started, g, gs = self.points.get((tx_id, to, pid), (0.0, 0.0, 0, 0))
+                moves.append({"player": label, "player_id": pid, "to": to, "from": frm,
+                              "points": round(pts, 2), "started_points": round(started, 2),
+                              "games": g, "started_games": gs})
+                if to is None:
+                    continue
+                if pickup:
+                    managers[to]["pickups"] += 1
+                    managers[to]["waiver_points"] += started
+                    managers[to]["waiver_bench_points"] += pts - started
+                elif r["type"] == "trade":
+                    managers[to]["trade_points_in"] += started
+                    if frm is not None:
+                        managers[frm]["trade_points_out"] += started
+            if r["type"] == "trade":
+                for m in {mv["to"] for mv in moves} | {mv["from"] for mv in moves}:
+                    if m is not None:
+                        managers[m]["trades"] += 1
+            out.append({"transaction_id": tx_id, "week": r["week"], "type": r["type"],
+                        "waiver_bid": r.get("waiver_bid"), "moves": moves})
+        rows = {}
+        for m, a in sorted(managers.items()):
+            rows[m] = {"pickups": a["pickups"], "waiver_points": round(a["waiver_points"], 2),
+                       "waiver_bench_points": round(a["waiver_bench_points"], 2), "trades": a["trades"],
+                       "trade_points_in": round(a["trade_points_in"], 2),
+                       "trade_points_out": round(a["trade_points_out"], 2),
+                       "trade_net_points": round(a["trade_points_in"] - a["trade_points_out"], 2)}
+        return rows, out
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+ffscrape – eine CLI für alle Pipeline-Schritte; mehrere Schritte laufen nacheinander in einem Prozess.
+
+  python ffscrape.py etl publish elo aggregate
+  python ffscrape.py --league-id 1180... scrape-sleeper etl publish
+  python ffscrape.py --trace traces/ etl publish
+
+Schwere Abhängigkeiten (pandas, bs4, requests, …) werden erst im Schritt importiert, der sie braucht;
+--help und kleine Schritte starten ohne sie. Innerhalb eines Laufs bleiben Module und geladene Daten
+(Spieler-DB, Sleeper-Snapshot, Elo-Historie) für die folgenden Schritte im Speicher.
+Die Optionen setzen nur die üblichen Umgebungsvariablen; die Skripte bleiben einzeln lauffähig.
+"""
+import argparse, os, sys, time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+STANDINGS_DIR = "output/3082897-history-standings"   # Vorgabe der Aggregat-Skripte
+
+def load(name):
+    """Importiert ein Pipeline-Modul aus Repo-Root, etl/ oder scripts/ (erst bei Bedarf)."""
+    for d in (ROOT, ROOT / "etl", ROOT / "scripts"):
+        if str(d) not in sys.path:
+            sys.path.insert(0, str(d))
+    return __import__(name)
+
+def _run_script(name):
+    """NFL.com-Scraper arbeiten auf Modulebene – im selben Prozess als __main__ ausführen."""
+    import runpy
+    load("tracing")   # Pfade setzen
+    runpy.run_path(str(ROOT / name), run_name="__main__")
+
+# ----------------------------- Schritte ----------------------------- #
+def scrape_sleeper():
+    load("scrapeSleeperSync").main()
+
+def scrape_sleeper_history():
+    load("scrapeSleeperHistory").main()
+
+def scrape_transactions():
+    load("scrapeSleeperTransactions").main()
+
+def scrape_nfl():
+    _run_script("scrapeStandings.py")
+    _run_script("scrapeGamecenter.py")
+
+def live():
+    load("scrapeSleeperLive").main()
+
+def etl():
+    load("parse_weeks").run_all()
+    load("draft_value").run_all()
+    load("search_index").run()
+
+def publish():
+    load("build_json").run()
+    bundle()
+
+def bundle():
+    load("bundle").run()
+
+def elo():
+    load("compute_elo").main()
+
+def aggregate():
+    input_dir = Path(os.getenv("STANDINGS_DIR", STANDINGS_DIR))
+    if not input_dir.is_dir():
+        print(f"– aggregate: {input_dir} fehlt, nichts zu aggregieren")
+        return
+    load("aggregate_standings").main(input_dir)
+    load("aggregate_playoffs").main(input_dir)
+
+def refresh():
+    status = load("pipeline").run()
+    if any(v in ("failed", "blocked") for v in status.values()):
+        raise SystemExit("Pipeline: Stufen fehlgeschlagen")
+
+COMMANDS = {
+    "scrape-sleeper": (scrape_sleeper, "Sleeper-Saison: Gamecenter-CSVs, Standings-TSVs, draft.tsv (scrapeSleeperSync)"),
+    "scrape-sleeper-history": (scrape_sleeper_history, "komplette Sleeper-Ligahistorie (scrapeSleeperHistory)"),
+    "scrape-transactions": (scrape_transactions, "Sleeper-Transaktions-Log (scrapeSleeperTransactions)"),
+    "scrape-nfl": (scrape_nfl, "NFL.com-Standings und -Gamecenter (braucht NFL-Cookie)"),
+    "live": (live, "Live-Modus für den laufenden Spieltag (scrapeSleeperLive)"),
+    "etl": (etl, "parse_weeks + draft_value + search_index -> data/processed"),
+    "publish": (publish, "build_json + bundle -> public/data (mit Versionen/Deltas)"),
+    "bundle": (bundle, "nur Hash-Bundle + manifest.json neu bauen"),
+    "elo": (elo, "Rating-Historie (compute_elo; Modell per --rating-model)"),
+    "aggregate": (aggregate, "aggregierte Standings/Playoffs je Manager (pandas)"),
+    "refresh": (refresh, "nur geänderte Stufen neu bauen, unabhängige parallel (pipeline.py)"),
+}
+
+# Optionen -> Umgebungsvariablen der Skripte (vor dem ersten Import gesetzt)
+ENV_OPTIONS = (
+    ("--league-id", "SLEEPER_LEAGUE_ID", "Sleeper-Liga"),
+    ("--season", "SEASON", "Saison für die Sleeper-Scraper"),
+    ("--nfl-league-id", "NFL_LEAGUE_ID", "NFL.com-Liga"),
+    ("--start", "LEAGUE_START_YEAR", "erste NFL.com-Saison"),
+    ("--end", "LEAGUE_END_YEAR", "NFL.com-Saison bis (exklusiv)"),
+    ("--standings-dir", "STANDINGS_DIR", "Standings-TSVs für etl und aggregate"),
+    ("--gamecenter-dir", "GAMECENTER_DIR", "Gamecenter-CSVs für etl und elo (Vorgabe output/teamgamecenter)"),
+    ("--rating-model", "RATING_MODEL", "Rating-Modell für elo: elo (Vorgabe), glicko2, margin"),
+    ("--trace", "TRACE", "Trace-Verzeichnis (ein Trace für den ganzen Lauf)"),
+    ("--profile", "PROFILE", "Stages profilieren (z. B. build_season oder all)"),
+)
+
+def parse_args(argv=None):
+    epilog = "Schritte:\n" + "\n".join(f"  {name:<24}{text}" for name, (_, text) in COMMANDS.items())
+    ap = argparse.ArgumentParser(prog="ffscrape", description=__doc__, epilog=epilog,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("steps", nargs="+", metavar="SCHRITT", choices=COMMANDS,
+                    help="ein oder mehrere Schritte, in dieser Reihenfolge")
+    for flag, env, text in ENV_OPTIONS:
+        ap.add_argument(flag, dest=env, metavar=env, help=text)
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    for _, env, _ in ENV_OPTIONS:
+        if getattr(args, env) is not None:
+            os.environ[env] = getattr(args, env)
+    tracing = load("tracing")
+    t_all = time.perf_counter()
+    for name in args.steps:
+        fn, _ = COMMANDS[name]
+        t0 = time.perf_counter()
+        with tracing.stage(f"ffscrape.{name}"):
+            fn()
+        print(f"✓ {name}: {time.perf_counter() - t0:.2f}s")
+    if len(args.steps) > 1:
+        print(f"✓ {len(args.steps)} Schritte in {time.perf_counter() - t_all:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# outputs.py
+# Gemeinsame Schreibschicht für alle Ausgaben: atomar und nur bei geändertem Inhalt.
+# Geschrieben wird in eine temporäre Datei im Zielverzeichnis; ist der Inhalt (Größe + gestreamter Hash) gleich
+# der vorhandenen Datei, wird sie verworfen und das Ziel bleibt samt mtime unangetastet – sonst os.replace().
+# So sehen git, die Pipeline-Fingerabdrücke (pipeline.py) und mtime-basierte Caches nur echte Änderungen.
+# touch=True: bei gleichem Inhalt trotzdem mtime setzen (für Caches, deren Alter "zuletzt geprüft" bedeutet).
+# Zähler je Prozess (geschrieben/unverändert) werden beim Beenden ausgegeben.
+import atexit, hashlib, os, shutil, tempfile, threading
+from collections import Counter
+from pathlib import Path
+
+COUNTS = Counter()
+_LOCK = threading.Lock()
+_CHUNK = 1 << 16   # kleiner, wiederverwendeter Puffer: Vergleich kostet kaum Speicher
+_UMASK = os.umask(0); os.umask(_UMASK)   # für die Rechte neuer Dateien (mkstemp legt 0600 an)
+
+def _count(changed):
+    with _LOCK:
+        COUNTS["written" if changed else "unchanged"] += 1
+
+def file_hash(path: Path):
+    h = hashlib.sha1()
+    buf = bytearray(_CHUNK)
+    view = memoryview(buf)
+    with Path(path).open("rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            h.update(view[:n])
+    return h.digest()
+
+def _same(path: Path, size, digest):
+    """Vergleicht eine vorhandene Datei mit (Größe, Hash) – Größe zuerst, Hash nur bei gleicher Größe."""
+    try:
+        if path.stat().st_size != size:
+            return False
+    except FileNotFoundError:
+        return False
+    return file_hash(path) == digest()
+
+def _tmp_for(path: Path):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    return Path(tmp)
+
+def replace_if_changed(tmp: Path, path: Path, touch=False):
+    """Fertige temporäre Datei an ihr Ziel bringen; False (tmp verworfen), wenn der Inhalt gleich ist."""
+    tmp, path = Path(tmp), Path(path)
+    if _same(path, tmp.stat().st_size, lambda: file_hash(tmp)):
+        tmp.unlink()
+        if touch:
+            os.utime(path)
+        _count(False)
+        return False
+    return _install(tmp, path)
+
+def _install(tmp: Path, path: Path):
+    if path.exists():
+        shutil.copymode(path, tmp)   # Rechte der alten Datei übernehmen
+    else:
+        os.chmod(tmp, 0o666 & ~_UMASK)
+    os.replace(tmp, path)
+    _count(True)
+    return True
+
+def write_bytes(path, data: bytes, touch=False):
+    """Schreibt data nach path, falls abweichend; Rückgabe: ob die Datei ersetzt wurde."""
+    path = Path(path)
+    if _same(path, len(data), lambda: hashlib.sha1(data).digest()):
+        if touch:
+            os.utime(path)
+        _count(False)
+        return False
+    tmp = _tmp_for(path)
+    try:
+        tmp.write_bytes(data)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return _install(tmp, path)
+
+def write_text(path, text, encoding="utf-8", touch=False):
+    return write_bytes(path, text.encode(encoding), touch)
+
+def copy_file(src, dst, touch=False):
+    """Kopiert src nach dst, falls der Inhalt abweicht (gleiche Größe -> Hash-Vergleich)."""
+    src, dst = Path(src), Path(dst)
+    if _same(dst, src.stat().st_size, lambda: file_hash(src)):
+        if touch:
+            os.utime(dst)
+        _count(False)
+        return False
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_for(dst)
+    try:
+        shutil.copyfile(src, tmp)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return _install(tmp, dst)
+
+class AtomicWriter:
+    """
+    Kontextmanager wie open(path, "w"): schreibt in eine temporäre Datei, beim Verlassen
+    replace_if_changed(); bei einer Exception bleibt das Ziel unverändert. changed danach gesetzt.
+    mode="a" (Append-Logs) schreibt direkt in die Datei und zählt als geschrieben.
+    """
+    def __init__(self, path, mode="w", newline=None, encoding="utf-8", touch=False):
+        self.path, self.mode, self.touch = Path(path), mode, touch
+        self.newline, self.encoding = newline, encoding
+        self.changed = None
+        self._tmp = None
+
+    def __enter__(self):
+        if self.mode == "a":
+            self.file = self.path.open("a", newline=self.newline, encoding=self.encoding)
+        else:
+            self._tmp = _tmp_for(self.path)
+            self.file = self._tmp.open(self.mode, newline=self.newline, encoding=self.encoding)
+        return self.file
+
+    def __exit__(self, exc_type, exc, tb):
+        self.file.close()
+        if self._tmp is None:
+            self.changed = True
+            _count(True)
+        elif exc_type is not None:
+            self._tmp.unlink(missing_ok=True)
+        else:
+            self.changed = replace_if_changed(self._tmp, self.path, self.touch)
+        return False
+
+def open_write(path, newline=None, encoding="utf-8", mode="w", touch=False):
+    return AtomicWriter(path, mode, newline, encoding, touch)
+
+def summary():
+    return f"{COUNTS['written']} geschrieben, {COUNTS['unchanged']} unverändert"
+
+@atexit.register
+def _report():
+    if COUNTS:
+        print(f"── Ausgaben: {summary()}")
@@ -0,0 +1,257 @@
+# pipeline.py
+# Lokaler Orchestrator: die Stufen als DAG mit deklarierten Ein- und Ausgaben, alles in einem Prozess
+#   python pipeline.py [--scrape] [--force] [--jobs 4] [--dry-run] [--only elo,bundle]
+#   python ffscrape.py refresh
+# Vor jeder Stufe wird ein Fingerabdruck ihrer Eingaben gebildet (Inhalts-Hashes der Dateien, der eigene Code
+# und relevante Umgebungsvariablen). Stimmt er mit dem letzten erfolgreichen Lauf überein und sind die Ausgaben
+# vorhanden, wird die Stufe übersprungen. Unabhängige Stufen (Elo, Aggregate, parse_weeks) laufen parallel.
+# Zustand: data/pipeline_state.json (PIPELINE_STATE); Datei-Hashes werden über (Größe, mtime) wiederverwendet.
+import argparse, hashlib, json, os, time, traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import tracing, sleeper_api
+import ffscrape
+
+ROOT = Path(__file__).resolve().parent
+STATE_FILE = Path(os.getenv("PIPELINE_STATE", "data/pipeline_state.json"))
+JOBS = int(os.getenv("PIPELINE_JOBS", "4"))
+
+def _standings_dir():
+    return os.getenv("STANDINGS_DIR", ffscrape.STANDINGS_DIR)
+
+def _gamecenter_dir():
+    return os.getenv("GAMECENTER_DIR", "output/teamgamecenter")
+
+def _history_dir():
+    return os.getenv("STANDINGS_DIR", "output/history-standings")   # Vorgabe von parse_weeks
+
+def _players_db():
+    return str(sleeper_api.PLAYERS_FILE)
+
+class Stage:
+    """
+    Eine Stufe: run() ohne Argumente, inputs/outputs als Glob-Muster relativ zum Arbeitsverzeichnis
+    (dürfen Callables sein, wenn sie von Umgebungsvariablen abhängen), code = eigene Quelldateien
+    relativ zum Repo, deps = Stufen, die vorher fertig sein müssen. cached=False: läuft immer (Scraper).
+    """
+    def __init__(self, name, run, inputs=(), outputs=(), deps=(), code=(), exclude=(), env=(), cached=True):
+        self.name, self.run = name, run
+        self.inputs, self.outputs, self.deps = inputs, outputs, deps
+        self.code, self.exclude, self.env, self.cached = code, exclude, env, cached
+
+    def patterns(self, which):
+        return [p() if callable(p) else p for p in getattr(self, which)]
+
+    def input_files(self):
+        seen = set()
+        for pat in self.patterns("inputs"):
+            for p in _glob(pat):
+                rel = p.as_posix()
+                if p.is_file() and not rel.startswith(self.exclude):
+                    seen.add(rel)
+        return sorted(seen)
+
+    def outputs_exist(self):
+        return all(any(p.is_file() for p in _glob(pat)) for pat in self.patterns("outputs"))
+
+def _glob(pat):
+    """Path().glob, auch für absolute Muster (z. B. ein geteilter SLEEPER_CACHE_DIR außerhalb des Arbeitsverzeichnisses)."""
+    p = Path(pat)
+    if p.is_absolute():
+        anchor = Path(p.anchor)
+        return anchor.glob(str(p.relative_to(anchor)))
+    return Path().glob(pat)
+
+def _parse_weeks():
+    ffscrape.load("parse_weeks").run_all()
+
+def _draft_value():
+    ffscrape.load("draft_value").run_all()
+
+def _search_index():
+    ffscrape.load("search_index").run()
+
+def _build_json():
+    ffscrape.load("build_json").run()
+
+def _rating_output(which):
+    def path():
+        return ffscrape.load("compute_elo").output_paths()[which]
+    return path
+
+def _aggregate(module):
+    def run():
+        ffscrape.load(module).main(_standings_dir())
+    return run
+
+STAGES = [
+    Stage("scrape", ffscrape.scrape_sleeper, cached=False),
+    Stage("parse_weeks", _parse_weeks, deps=("scrape",),
+          inputs=(lambda: f"{_gamecenter_dir()}/*/*.csv", lambda: f"{_gamecenter_dir()}/*/*.tsv",
+                  lambda: f"{_history_dir()}/[0-9][0-9][0-9][0-9].tsv", lambda: f"{_history_dir()}/playoffs-*.tsv",
+                  lambda: f"{_history_dir()}/[0-9][0-9][0-9][0-9]/standings_*.tsv",
+                  "output/*/transactions.jsonl", "output/history-drafts/*-draft.tsv", "output/*/draft.tsv",
+                  _players_db),
+          outputs=("data/processed/seasons/*/matchups.json", "data/processed/h2h.json",
+                   "data/processed/player_careers.json"),
+          code=("etl/parse_weeks.py", "etl/records.py", "etl/h2h.py", "etl/transactions.py", "etl/player_ids.py",
+                "etl/careers.py"), env=("GAMECENTER_DIR", "STANDINGS_DIR")),
+    Stage("draft_value", _draft_value, deps=("parse_weeks",),
+          inputs=("output/history-drafts/*-draft.tsv", "output/*/draft.tsv",
+                  "data/processed/seasons/*/players_games.json"),
+          outputs=("data/processed/draft_value.json",),
+          code=("etl/draft_value.py", "etl/player_ids.py")),
+    Stage("search_index", _search_index, deps=("parse_weeks", "draft_value"),
+          inputs=("data/processed/players_index.json", "data/processed/player_careers.json",
+                  "data/processed/seasons/*/regular_final_standings.json", "data/processed/seasons/*/teams.json",
+                  "data/processed/seasons/*/draft_value.json", _players_db),
+          outputs=("data/processed/search_index.json",),
+          code=("etl/search_index.py", "etl/player_ids.py")),
+    Stage("build_json", _build_json, deps=("parse_weeks", "draft_value", "search_index"),
+          inputs=("data/processed/**/*",), outputs=("public/data/processed/seasons/*/matchups.json",),
+          code=("etl/build_json.py", "versions.py")),
+    Stage("elo", ffscrape.elo, deps=("scrape",),
+          inputs=(lambda: f"{_gamecenter_dir()}/*/*.csv",),
+          outputs=(_rating_output(0), _rating_output(1)),
+          code=("scripts/compute_elo.py", "scripts/ratings.py", "versions.py"), env=("RATING_MODEL", "GAMECENTER_DIR")),
+    Stage("aggregate_standings", _aggregate("aggregate_standings"), deps=("scrape",),
+          inputs=(lambda: f"{_standings_dir()}/[0-9][0-9][0-9][0-9].tsv",
+                  lambda: f"{_standings_dir()}/[0-9][0-9][0-9][0-9]/standings_regular_1_14.tsv"),
+          outputs=(lambda: f"{_standings_dir()}/aggregated_standings.tsv",),
+          code=("scripts/aggregate_standings.py",), env=("STANDINGS_DIR",)),
+    Stage("aggregate_playoffs", _aggregate("aggregate_playoffs"), deps=("scrape",),
+          inputs=(lambda: f"{_standings_dir()}/playoffs-*.tsv",
+                  lambda: f"{_standings_dir()}/[0-9][0-9][0-9][0-9]/standings_playoffs.tsv"),
+          outputs=(lambda: f"{_standings_dir()}/aggregated_playoffs.tsv",),
+          code=("scripts/aggregate_playoffs.py",), env=("STANDINGS_DIR",)),
+    Stage("bundle", ffscrape.bundle, deps=("build_json", "elo"),
+          inputs=("public/data/**/*",), outputs=("public/data/manifest.json",),
+          exclude=("public/data/bundle/", "public/data/versions/", "public/data/manifest.json"),
+          code=("etl/bundle.py",)),
+]
+
+class Fingerprints:
+    """Inhalts-Hashes von Dateien; unveränderte Dateien (gleiche Größe und mtime) werden nicht neu gelesen."""
+    def __init__(self, cache):
+        self.cache = cache    # pfad -> [size, mtime_ns, sha]
+        self.hashed = 0
+
+    def file(self, path: Path):
+        st = path.stat()
+        key = path.as_posix()
+        hit = self.cache.get(key)
+        if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            return hit[2]
+        h = hashlib.sha1()
+        with path.open("rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        self.hashed += 1
+        self.cache[key] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        return self.cache[key][2]
+
+    def stage(self, stage, files):
+        h = hashlib.sha1()
+        for rel in files:
+            h.update(f"{rel}\0{self.file(Path(rel))}\n".encode())
+        for rel in stage.code:
+            h.update(f"code:{rel}\0{self.file(ROOT / rel)}\n".encode())
+        for var in stage.env:
+            h.update(f"env:{var}={os.getenv(var, '')}\n".encode())
+        return h.hexdigest()
+
+def load_state():
+    if STATE_FILE.exists():
+        try:
+            return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+        except ValueError:
+            pass
+    return {"stages": {}, "files": {}}
+
+def plan(stages, only=None, scrape=False):
+    """Auswahl der Stufen; Abhängigkeiten auf nicht ausgewählte Stufen gelten als erfüllt."""
+    selected = [s for s in stages if (s.cached or scrape) and (not only or s.name in only)]
+    names = {s.name for s in selected}
+    return {s.name: (s, [d for d in s.deps if d in names]) for s in selected}
+
+def run(force=False, jobs=JOBS, only=None, scrape=False, dry_run=False):
+    """Führt den DAG aus; Rückgabe: {stage: "ran" | "skipped" | "no-input" | "failed" | "blocked"}."""
+    state = load_state()
+    fps = Fingerprints(state["files"])
+    stages = plan(STAGES, only, scrape)
+    status, started, pending = {}, {}, dict(stages)
+    t_all = time.perf_counter()
+
+    def execute(stage):
+        """Läuft im Worker-Thread: Fingerabdruck prüfen, ggf. ausführen."""
+        files = stage.input_files() if stage.cached else []
+        if stage.cached and not files:
+            return "no-input", None, 0.0
+        fp = fps.stage(stage, files) if stage.cached else None
+        prev = state["stages"].get(stage.name, {})
+        if stage.cached and not force and prev.get("fingerprint") == fp and stage.outputs_exist():
+            return "skipped", fp, 0.0
+        if dry_run:
+            return "ran", None, 0.0
+        t0 = time.perf_counter()
+        with tracing.stage(f"pipeline.{stage.name}", inputs=len(files)):
+            stage.run()
+        return "ran", fp, time.perf_counter() - t0
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as ex:
+        while pending or started:
+            for name, (stage, deps) in list(pending.items()):
+                if any(status.get(d) in ("failed", "blocked") for d in deps):
+                    status[name] = "blocked"
+                    del pending[name]
+                elif all(d in status for d in deps):
+                    started[ex.submit(execute, stage)] = name
+                    del pending[name]
+            if not started:
+                continue
+            done, _ = wait(started, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = started.pop(fut)
+                try:
+                    result, fp, secs = fut.result()
+                except BaseException as exc:   # auch SystemExit der Skripte: nur diese Stufe scheitert
+                    status[name] = "failed"
+                    if not isinstance(exc, SystemExit):
+                        traceback.print_exception(exc)
+                    print(f"✗ {name}: {type(exc).__name__}: {exc}")
+                    continue
+                status[name] = result
+                if fp is not None and result == "ran":
+                    state["stages"][name] = {"fingerprint": fp, "secs": round(secs, 3),
+                                             "finished": time.strftime("%Y-%m-%dT%H:%M:%S")}
+                mark = {"ran": "✓", "skipped": "=", "no-input": "–"}[result]
+                label = {"ran": f"{secs:.2f}s" if not dry_run else "würde laufen",
+                         "skipped": "unverändert", "no-input": "keine Eingaben"}[result]
+                print(f"{mark} {name:<20} {label}")
+
+    if not dry_run:
+        state["files"] = {k: v for k, v in fps.cache.items() if Path(k).exists()}
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tracing.write_text(STATE_FILE, json.dumps(state, ensure_ascii=False, indent=1, sort_keys=True))
+    ran = sum(v == "ran" for v in status.values())
+    print(f"Pipeline: {ran}/{len(status)} Stufen {'würden laufen' if dry_run else 'gelaufen'}, "
+          f"{fps.hashed} Dateien neu gehasht, "
+          f"{time.perf_counter() - t_all:.1f}s")
+    return status
+
+def main():
+    ap = argparse.ArgumentParser(description="DAG der Pipeline-Stufen mit Fingerabdruck-Cache.")
+    ap.add_argument("--scrape", action="store_true", help="vorher scrapeSleeperSync (SLEEPER_LEAGUE_ID)")
+    ap.add_argument("--force", action="store_true", help="alle Stufen ausführen")
+    ap.add_argument("--jobs", type=int, default=JOBS, help="parallele Stufen")
+    ap.add_argument("--only", default="", help="Kommaliste: " + ", ".join(s.name for s in STAGES))
+    ap.add_argument("--dry-run", action="store_true", help="nur anzeigen, was laufen würde")
+    args = ap.parse_args()
+    only = {s.strip() for s in args.only.split(",") if s.strip()} or None
+    status = run(args.force, args.jobs, only, args.scrape, args.dry_run)
+    if any(v in ("failed", "blocked") for v in status.values()):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
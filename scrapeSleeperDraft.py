@@ -1,33 +1,14 @@
 # scrapeSleeperDraft.py
-import os, json, csv, time
+import os, csv
 from pathlib import Path
-import requests
+import tracing
+from sleeper_api import get_drafts, get_draft_picks  # Retry bei 429/5xx, Antworten je Lauf gecacht
 
-BASE = "https://api.sleeper.app/v1"
 OUT_DIR = Path("./output")
-DATA_DIR = Path("./data")
 
 LEAGUE_ID = os.getenv("SLEEPER_LEAGUE_ID", "").strip()
 ENV_SEASON = os.getenv("SEASON")  # optional
 
-def _get(url):
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    return r.json()
-
-def get_league(league_id):       return _get(f"{BASE}/league/{league_id}")
-def get_users(league_id):        return _get(f"{BASE}/league/{league_id}/users")
-def get_rosters(league_id):      return _get(f"{BASE}/league/{league_id}/rosters")
-def get_drafts(league_id):       return _get(f"{BASE}/league/{league_id}/drafts")
-def get_draft_picks(draft_id):   return _get(f"{BASE}/draft/{draft_id}/picks")
-def get_players_cached():
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    cache = DATA_DIR / "sleeper_players.json"
-    if cache.exists() and time.time() - cache.stat().st_mtime < 7*24*3600:
-        return json.loads(cache.read_text(encoding="utf-8"))
-    players = _get(f"{BASE}/players/nfl")
-    cache.write_text(json.dumps(players), encoding="utf-8")
-    return players
 
 def short_name(player):
     if not player: return ""
@@ -43,15 +24,19 @@ def fmt_player(pdb, pid):
     name = p.get("full_name") or (short_name(p) if (p.get("first_name") or p.get("last_name")) else pid)
     return name, pos, team
 
-def main():
-    if not LEAGUE_ID:
+@tracing.traced()
+def main(league_id=None, season=None, maps=None):
+    """maps: Owner-/Spieler-Maps der Saison (scrapeSleeperSync.season_maps), sonst hier gebaut."""
+    league_id = league_id or LEAGUE_ID
+    if not league_id:
         raise SystemExit("Bitte SLEEPER_LEAGUE_ID setzen.")
 
-    league   = get_league(LEAGUE_ID)
-    users    = get_users(LEAGUE_ID)
-    rosters  = get_rosters(LEAGUE_ID)
-    players  = get_players_cached()
-    season_str = ENV_SEASON or league.get("season") or "2022"
+    if maps is None:
+        import scrapeSleeperSync   # erst hier: scrapeSleeperSync importiert dieses Modul
+        maps = scrapeSleeperSync.season_maps(league_id)
+    league   = maps["league"]
+    players  = maps["players"]
+    season_str = str(season or ENV_SEASON or league.get("season") or "2022")
     try: SEASON = int(season_str)
     except: SEASON = 2022
 
@@ -59,10 +44,10 @@ def main():
     season_dir.mkdir(parents=True, exist_ok=True)
 
     # Maps
-    user_display  = {u["user_id"]: (u.get("display_name") or "Unknown") for u in users}
-    user_teamname = {u["user_id"]: (u.get("metadata", {}) or {}).get("team_name") or user_display[u["user_id"]] for u in users}
+    user_display  = maps["owner_to_display"]
+    user_teamname = {uid: maps["owner_to_teamname"].get(uid) or name for uid, name in user_display.items()}
 
-    drafts = get_drafts(LEAGUE_ID) or []
+    drafts = get_drafts(league_id) or []
     if not drafts:
         print("Kein Draft gefunden.")
         return
@@ -83,7 +68,7 @@ def main():
     out_path = season_dir / "draft.tsv"
     header = ["Round","Overall","PickInRound","TeamName","ManagerName","OriginalSlot","PickedByUser","Player","Pos","NFLTeam","Keeper","Notes"]
 
-    with out_path.open("w", newline="", encoding="utf-8") as f:
+    with tracing.open_write(out_path, newline="") as f:
         w = csv.writer(f, delimiter="\t")
         w.writerow(header)
 
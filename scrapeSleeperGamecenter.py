@@ -1,12 +1,11 @@
 # scrapeSleeperGamecenter.py
-import os, json, csv, time, re
+import os, csv, re
 from collections import defaultdict
 from pathlib import Path
-import requests
+import tracing
+from sleeper_api import get_matchups  # Retry bei 429/5xx, Antworten je Lauf gecacht
 
-BASE = "https://api.sleeper.app/v1"
 OUT_DIR = Path("./output")
-DATA_DIR = Path("./data")
 
 ENV_SEASON = os.getenv("SEASON")  # kann None sein
 LEAGUE_ID = os.getenv("SLEEPER_LEAGUE_ID", "").strip()
@@ -52,23 +51,6 @@ def alias_for(name: str) -> str:
     return _ALIAS_MAP.get(key, name or "")
 
 # -------------------------- API -------------------------- #
-def _get(url):
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    return r.json()
-
-def get_league(league_id):           return _get(f"{BASE}/league/{league_id}")
-def get_league_users(league_id):     return _get(f"{BASE}/league/{league_id}/users")
-def get_league_rosters(league_id):   return _get(f"{BASE}/league/{league_id}/rosters")
-def get_matchups(league_id, week):   return _get(f"{BASE}/league/{league_id}/matchups/{week}")
-def get_players_cached():
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    cache = DATA_DIR / "sleeper_players.json"
-    if cache.exists() and time.time() - cache.stat().st_mtime < 7*24*3600:
-        return json.loads(cache.read_text(encoding="utf-8"))
-    players = _get(f"{BASE}/players/nfl")
-    cache.write_text(json.dumps(players), encoding="utf-8")
-    return players
 
 # -------------------------- Helpers -------------------------- #
 def short_name(player):
@@ -104,39 +86,101 @@ def owner_maps(users, rosters):
         owner_to_name[u["user_id"]] = team_name or display
     return rid_to_owner, owner_to_name
 
-# Slots fixieren wie gewünscht
+# -------------------------- Slot-Engine -------------------------- #
+# Aufbau aus league.roster_positions (Superflex, 2x FLEX, IDP, ...); ohne Angabe das bisherige Standard-Lineup.
 BENCH_SLOTS = 7
-def assign_starters_to_slots(players_db, starters, starters_points):
-    qb, rb, wr, te, k, dst, flex_pool = [], [], [], [], [], [], []
-    used = set()
-    for pid in starters:
-        pos = (players_db.get(pid, {}) or {}).get("position")
-        if pos == "QB": qb.append(pid)
-        elif pos == "RB": rb.append(pid); flex_pool.append(pid)
-        elif pos == "WR": wr.append(pid); flex_pool.append(pid)
-        elif pos == "TE": te.append(pid); flex_pool.append(pid)
-        elif pos == "K": k.append(pid)
-        elif pos == "DEF": dst.append(pid)
-    keypts = lambda pid: -points_for(starters_points, pid)
-    for lst in (qb, rb, wr, te, k, dst, flex_pool): lst.sort(key=keypts)
-    slots = {"QB": None, "RB":[None,None], "WR":[None,None], "TE":None, "FLEX":None, "K":None, "DEF":None}
-    slots["QB"] = qb[0] if qb else None
-    slots["RB"][0] = rb[0] if len(rb)>0 else None
-    slots["RB"][1] = rb[1] if len(rb)>1 else None
-    slots["WR"][0] = wr[0] if len(wr)>0 else None
-    slots["WR"][1] = wr[1] if len(wr)>1 else None
-    slots["TE"] = te[0] if te else None
-    slots["K"] = k[0] if k else None
-    slots["DEF"] = dst[0] if dst else None
-    for x in [slots["QB"], slots["TE"], slots["K"], slots["DEF"]]:
-        if x: used.add(x)
-    for x in slots["RB"] + slots["WR"]:
-        if x: used.add(x)
-    for pid in flex_pool:
-        if pid not in used:
-            slots["FLEX"] = pid
-            break
-    return slots
+DEFAULT_ROSTER = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"] + ["BN"] * BENCH_SLOTS
+RESERVE_SLOTS = {"BN", "IR", "TAXI"}
+FLEX_SLOTS = {"FLEX", "WRRB_FLEX", "REC_FLEX", "SUPER_FLEX", "IDP_FLEX"}
+SLOT_POSITIONS = {
+    "FLEX": ("RB", "WR", "TE"), "WRRB_FLEX": ("RB", "WR"), "REC_FLEX": ("WR", "TE"),
+    "SUPER_FLEX": ("QB", "RB", "WR", "TE"),
+    "DL": ("DL", "DE", "DT"), "DB": ("DB", "CB", "S"),
+    "IDP_FLEX": ("DL", "DE", "DT", "LB", "DB", "CB", "S"),
+}
+# CSV-Spaltennamen wie bisher (NFL.com-Stil, etl/parse_weeks.py sortiert danach)
+SLOT_LABELS = {"FLEX": "W/R", "WRRB_FLEX": "W/R", "REC_FLEX": "W/T", "SUPER_FLEX": "Q/W/R/T", "IDP_FLEX": "IDP"}
+
+class PlayerTable:
+    """Position(en) und formatierter Name je Spieler – einmal pro Lauf berechnet statt pro Team und Woche."""
+    def __init__(self, players_db):
+        self.db = players_db
+        self._meta = {}
+
+    def meta(self, pid):
+        m = self._meta.get(pid)
+        if m is None:
+            p = self.db.get(pid) or {} if pid else {}
+            positions = frozenset(x for x in [p.get("position"), *(p.get("fantasy_positions") or [])] if x)
+            m = self._meta[pid] = (positions, fmt_player(self.db, pid))
+        return m
+
+    def positions(self, pid): return self.meta(pid)[0]
+    def label(self, pid):     return self.meta(pid)[1]
+
+_TABLES = {}
+def player_table(players_db):
+    """Eine PlayerTable je Spieler-DB (get_players_cached liefert pro Prozess dasselbe Objekt)."""
+    t = _TABLES.get(id(players_db))
+    if t is None or t.db is not players_db:
+        t = _TABLES[id(players_db)] = PlayerTable(players_db)
+    return t
+
+class SlotPlan:
+    """Startslots (Reihenfolge = CSV-Spalten) und Bench-Größe einer Liga, einmal aus roster_positions kompiliert."""
+    def __init__(self, roster_positions=None):
+        rp = roster_positions or DEFAULT_ROSTER
+        self.slots = [x for x in rp if x not in RESERVE_SLOTS]
+        self.bench = sum(1 for x in rp if x == "BN")   # ohne roster_positions: BENCH_SLOTS aus DEFAULT_ROSTER
+        self.eligible = [frozenset(SLOT_POSITIONS.get(x, (x,))) for x in self.slots]
+        # Füllreihenfolge: feste Slots vor Flex, engere Flex-Slots vor weiten, sonst Roster-Reihenfolge
+        self.fill_order = sorted(range(len(self.slots)),
+                                 key=lambda i: (self.slots[i] in FLEX_SLOTS, len(self.eligible[i]), i))
+
+    def header(self):
+        cols = ["Owner", "Rank"]
+        for x in self.slots:
+            cols += [SLOT_LABELS.get(x, x), "Points"]
+        cols += ["BN", "Points"] * self.bench
+        return cols + ["Total", "Opponent", "Opponent Total"]
+
+    def assign(self, table, starters, starters_points):
+        """Liste pid|None je Slot: jeder Slot bekommt den punktbesten noch freien berechtigten Starter."""
+        ranked = sorted((pid for pid in starters if pid), key=lambda pid: -points_for(starters_points, pid))
+        out, used = [None] * len(self.slots), set()
+        for i in self.fill_order:
+            elig = self.eligible[i]
+            for pid in ranked:
+                if pid not in used and table.positions(pid) & elig:
+                    out[i] = pid
+                    used.add(pid)
+                    break
+        return out
+
+def team_row(plan, table, entry, owner):
+    """CSV-Zeile eines Matchup-Eintrags (Rank/Gegner noch leer) und gerundetes Total."""
+    starters = entry.get("starters") or []
+    players_all = entry.get("players") or []
+    players_points = entry.get("players_points") or {}
+    starters_points = entry.get("starters_points") or {}
+    if not starters_points and players_points and starters:
+        starters_points = {pid: players_points.get(pid, 0.0) for pid in starters}
+
+    slots = plan.assign(table, starters, starters_points)
+    p = lambda pid: round(points_for(players_points, pid), 2) if pid else ""
+
+    bench = bench_list(players_all, starters)
+    bench.sort(key=lambda pid: -points_for(players_points, pid))
+    bench = bench[:plan.bench] + [None] * (plan.bench - len(bench))
+
+    total = float(entry.get("points", sum(points_for(players_points, pid) for pid in starters)))
+    total = round(total, 2)
+
+    row = [owner, ""]  # Owner (Alias), Rank
+    for pid in slots + bench:
+        row.extend([table.label(pid), p(pid)])
+    row.extend([total, "", ""])  # Total, Opponent(Alias), Opponent Total
+    return row, total
 
 def bench_list(all_players, starters):
     s = set(starters); return [pid for pid in all_players if pid not in s]
@@ -168,18 +212,23 @@ def parse_weeks(spec):
     return sorted(x for x in out if 1 <= x <= 16)  # Boundaries wie bisher (1..16)
 
 # ----------------------------- MAIN ----------------------------- #
-def main():
-    if not LEAGUE_ID:
+@tracing.traced()
+def main(league_id=None, season=None, maps=None):
+    """maps: Owner-/Alias-/Spieler-Maps der Saison (scrapeSleeperSync.season_maps), sonst hier gebaut."""
+    league_id = league_id or LEAGUE_ID
+    if not league_id:
         raise SystemExit("Bitte SLEEPER_LEAGUE_ID als Umgebungsvariable setzen.")
 
-    league     = get_league(LEAGUE_ID)
-    users      = get_league_users(LEAGUE_ID)
-    rosters    = get_league_rosters(LEAGUE_ID)
-    players_db = get_players_cached()
-    rid_to_owner, owner_to_name = owner_maps(users, rosters)
+    if maps is None:
+        import scrapeSleeperSync   # erst hier: scrapeSleeperSync importiert dieses Modul
+        maps = scrapeSleeperSync.season_maps(league_id)
+    league      = maps["league"]
+    table       = maps["table"]
+    owner_alias = maps["owner_alias"]   # roster_id -> Alias (Teamname bzw. Displayname durch alias_for)
+    plan        = SlotPlan(league.get("roster_positions"))
 
     # Saison bestimmen: ENV > League.season > Fallback
-    season_str = ENV_SEASON or league.get("season") or "2022"
+    season_str = str(season or ENV_SEASON or league.get("season") or "2022")
     try:
         SEASON = int(season_str)
     except:
@@ -193,7 +242,7 @@ def main():
     season_dir.mkdir(parents=True, exist_ok=True)
 
     for week in weeks:
-        week_data = get_matchups(LEAGUE_ID, week)
+        week_data = get_matchups(league_id, week)
         if not week_data:
             print(f"– Keine Daten für Woche {week}. Überspringe.")
             continue
@@ -203,87 +252,37 @@ def main():
             by_mid[t.get("matchup_id")].append(t)
 
         rows, totals = [], []
-        team_total_by_roster, team_owner_by_roster = {}, {}
-
-        for teams in by_mid.values():
-            for entry in teams:
-                rid = entry["roster_id"]
-                owner_id = rid_to_owner.get(rid)
-
-                # Ursprungslabel (Teamname oder Displayname) …
-                owner_raw = owner_to_name.get(owner_id, f"Roster {rid}")
-                # … in Alias umwandeln
-                owner = alias_for(owner_raw)
-
-                starters = entry.get("starters") or []
-                players_all = entry.get("players") or []
-                players_points = entry.get("players_points") or {}
-                starters_points = entry.get("starters_points") or {}
-                if not starters_points and players_points and starters:
-                    starters_points = {pid: players_points.get(pid, 0.0) for pid in starters}
-
-                slots = assign_starters_to_slots(players_db, starters, starters_points)
-                p = lambda pid: round(points_for(players_points, pid), 2) if pid else ""
-
-                bench = bench_list(players_all, starters)
-                bench.sort(key=lambda pid: -points_for(players_points, pid))
-                bench = bench[:BENCH_SLOTS]
-                bench_pairs = [
-                    (fmt_player(players_db, (bench[i] if i < len(bench) else None)),
-                     p(bench[i] if i < len(bench) else None))
-                    for i in range(BENCH_SLOTS)
-                ]
-
-                total = float(entry.get("points", sum(points_for(players_points, pid) for pid in starters)))
-                total = round(total, 2)
-
-                team_total_by_roster[rid] = total
-                team_owner_by_roster[rid] = owner  # bereits aliasiert
-
-                row = [
-                    owner, "",  # Owner (Alias), Rank
-                    fmt_player(players_db, slots["QB"]), p(slots["QB"]),
-                    fmt_player(players_db, slots["RB"][0]), p(slots["RB"][0]),
-                    fmt_player(players_db, slots["RB"][1]), p(slots["RB"][1]),
-                    fmt_player(players_db, slots["WR"][0]), p(slots["WR"][0]),
-                    fmt_player(players_db, slots["WR"][1]), p(slots["WR"][1]),
-                    fmt_player(players_db, slots["TE"]), p(slots["TE"]),
-                    fmt_player(players_db, slots["FLEX"]), p(slots["FLEX"]),
-                    fmt_player(players_db, slots["K"]), p(slots["K"]),
-                    fmt_player(players_db, slots["DEF"]), p(slots["DEF"]),
-                ]
-                for name, pts in bench_pairs:
-                    row.extend([name, pts])
-                row.extend([total, "", ""])  # Total, Opponent(Alias), Opponent Total
-                rows.append({"roster_id": rid, "matchup_id": entry.get("matchup_id"), "row": row, "total": total})
-                totals.append(total)
+        packs_by_mid = defaultdict(list)   # matchup_id -> Zeilen (Gegner-Lookup ohne Suche über alle Teams)
+
+        for entry in (e for teams in by_mid.values() for e in teams):
+            rid = entry["roster_id"]
+            owner = owner_alias.get(rid) or alias_for(f"Roster {rid}")
+
+            row, total = team_row(plan, table, entry, owner)
+            pack = {"roster_id": rid, "matchup_id": entry.get("matchup_id"), "owner": owner, "row": row, "total": total}
+            rows.append(pack)
+            packs_by_mid[pack["matchup_id"]].append(pack)
+            totals.append(total)
 
         # Rank (1 = höchste Total)
         sorted_totals = sorted(set(totals), reverse=True)
         total_to_rank = {t: i+1 for i, t in enumerate(sorted_totals)}
 
         for pack in rows:
-            rid = pack["roster_id"]; mid = pack["matchup_id"]; row = pack["row"]; total = pack["total"]
-            row[1] = total_to_rank.get(total, "")
-            opps = [x for x in rows if x["matchup_id"] == mid and x["roster_id"] != rid]
-            if opps:
-                opp = opps[0]
-                # Opponent-Name ist bereits aliasiert, weil team_owner_by_roster das Alias speichert
-                row[-2] = team_owner_by_roster.get(opp["roster_id"], "")
-                row[-1] = team_total_by_roster.get(opp["roster_id"], "")
+            row = pack["row"]
+            row[1] = total_to_rank.get(pack["total"], "")
+            opp = next((x for x in packs_by_mid[pack["matchup_id"]] if x["roster_id"] != pack["roster_id"]), None)
+            if opp:
+                # Opponent-Name ist bereits aliasiert
+                row[-2] = opp["owner"]
+                row[-1] = opp["total"]
             else:
                 row[-2] = "—"; row[-1] = ""
 
-        header = [
-            "Owner","Rank",
-            "QB","Points","RB","Points","RB","Points","WR","Points","WR","Points","TE","Points",
-            "W/R","Points","K","Points","DEF","Points",
-            "BN","Points","BN","Points","BN","Points","BN","Points","BN","Points","BN","Points","BN","Points",
-            "Total","Opponent","Opponent Total"
-        ]
+        header = plan.header()
 
         out_path = season_dir / f"{week}.csv"
-        with out_path.open("w", newline="", encoding="utf-8") as f:
+        with tracing.open_write(out_path, newline="") as f:
             w = csv.writer(f); w.writerow(header)
             for pack in rows: w.writerow(pack["row"])
         print(f"✓ Geschrieben: {out_path}")
@@ -0,0 +1,44 @@
+# scrapeSleeperHistory.py
+# Backfill der kompletten Sleeper-Ligahistorie in einem Lauf:
+#   SLEEPER_LEAGUE_ID=<aktuelle Liga> python scrapeSleeperHistory.py
+# Folgt previous_league_id bis zur ersten Saison, lädt alle Endpoints aller Saisons parallel
+# und schreibt danach pro Saison die üblichen Ausgaben (Gamecenter-CSVs, Standings-TSVs, draft.tsv).
+import os
+from sleeper_api import BASE, fetch_json, get_players_cached
+
+from scrapeSleeperSync import prefetch_seasons, sync_season, WORKERS
+
+LEAGUE_ID = os.getenv("SLEEPER_LEAGUE_ID", "").strip()
+MAX_SEASONS = int(os.getenv("MAX_SEASONS", "0"))  # 0 = ganze Kette
+
+def discover_chain(league_id):
+    """[(league_id, season, league)] von der aktuellen bis zur ältesten Saison."""
+    chain, seen = [], set()
+    while league_id and league_id not in seen and str(league_id) != "0":
+        seen.add(league_id)
+        league = fetch_json(f"{BASE}/league/{league_id}")
+        if not league:
+            break
+        chain.append((league_id, league.get("season"), league))
+        if MAX_SEASONS and len(chain) >= MAX_SEASONS:
+            break
+        league_id = league.get("previous_league_id")
+    return chain
+
+def main():
+    if not LEAGUE_ID:
+        raise SystemExit("Bitte SLEEPER_LEAGUE_ID (aktuelle Saison) setzen.")
+
+    chain = discover_chain(LEAGUE_ID)
+    print("Kette: " + " -> ".join(f"{s} ({lid})" for lid, s, _ in chain))
+
+    # Alle Saisons parallel in den Snapshot holen, danach Ausgaben ohne weitere Requests schreiben
+    get_players_cached()
+    prefetch_seasons([lid for lid, _, _ in chain], WORKERS)
+    for lid, season, _ in reversed(chain):
+        print(f"— Saison {season} ({lid})")
+        sync_season(lid, season)
+    print(f"✓ Backfill fertig: {len(chain)} Saisons")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# scrapeSleeperLive.py
+# Live-Modus für Spieltage: pollt nur /matchups/<week> der laufenden Woche, mehrere Ligen in einem Prozess
+#   LIVE_LEAGUE_IDS=111,222 [WEEK=5] [LIVE_POLLS=0] python scrapeSleeperLive.py
+# Nur Rosters mit geänderten players_points/starters/points werden neu gerechnet (Matchup, Weekly-Standings-Zeile,
+# Elo-Vorschau); geschrieben wird ein kleines Delta statt der Saisondateien:
+#   output/live/<league_id>/<season>-<week>/<seq>.json  (seq 1 = kompletter Stand der Woche)
+#   output/live/<league_id>/index.json                  (aktuelle seq für Clients)
+# Intervall je Liga adaptiv: nach einer Änderung LIVE_MIN_S, sonst verdoppelt bis LIVE_MAX_S.
+# Ohne WEEK wird /state/nfl alle LIVE_WEEK_CHECK_S neu gefragt; bei einem Wochenwechsel beginnt die neue Woche
+# bei seq 1. Nach einem Neustart in derselben Woche geht seq dort weiter, wo index.json steht.
+import json, os, sys, time
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+import tracing
+from sleeper_api import BASE, fetch_json, get_league, get_league_users, get_league_rosters, get_players_cached
+
+import scrapeSleeperGamecenter as gamecenter
+
+ROOT = Path(__file__).resolve().parent
+sys.path[:0] = [str(ROOT / "etl"), str(ROOT / "scripts")]
+import parse_weeks   # noqa: E402  Matchup-/Standings-Format wie im ETL
+import compute_elo   # noqa: E402  Elo-Formel und -Parameter
+
+LIVE_DIR = Path(os.getenv("LIVE_DIR", "output/live"))
+LEAGUE_IDS = [x.strip() for x in (os.getenv("LIVE_LEAGUE_IDS") or os.getenv("SLEEPER_LEAGUE_ID", "")).split(",") if x.strip()]
+ENV_WEEK = os.getenv("WEEK")                          # optional, sonst /state/nfl bzw. league.settings.leg
+MIN_S = float(os.getenv("LIVE_MIN_S", "60"))
+MAX_S = float(os.getenv("LIVE_MAX_S", "600"))
+POLLS = int(os.getenv("LIVE_POLLS", "0"))             # Polls je Liga, 0 = bis Strg+C
+WEEK_CHECK_S = float(os.getenv("LIVE_WEEK_CHECK_S", "900"))
+
+def current_week(league):
+    if ENV_WEEK:
+        return int(ENV_WEEK)
+    try:
+        return int(fetch_json(f"{BASE}/state/nfl", cache=False)["week"])
+    except Exception:
+        try: return int((league.get("settings") or {}).get("leg") or 1)
+        except (TypeError, ValueError): return 1
+
+@lru_cache(maxsize=None)
+def _elo_rows():
+    path = Path(compute_elo.ELO_JSON)
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else []
+
+def pre_week_ratings(season, week):
+    """Elo je Team vor der Woche (letzter Snapshot davor, je Saisonwechsel zur Mitte regressiert)."""
+    last = {}
+    for r in _elo_rows():
+        if (r["Season"], r["Week"]) < (season, week):
+            last[r["Team"]] = (r["Season"], r["Elo"])
+    out = {}
+    for team, (s, elo) in last.items():
+        for _ in range(season - s):
+            elo = compute_elo.MEAN_REGRESSION * elo + (1.0 - compute_elo.MEAN_REGRESSION) * compute_elo.BASE_RATING
+        out[team] = elo
+    return out
+
+def signature(entry):
+    return (entry.get("points"), tuple(entry.get("starters") or ()),
+            tuple(sorted((entry.get("players_points") or {}).items())))
+
+class LiveLeague:
+    """Zustand einer Liga über die Polls: Roster-Signaturen und zuletzt ausgelieferte Zeilen."""
+    def __init__(self, league_id):
+        self.league_id = league_id
+        league = get_league(league_id) or {}
+        rid_to_owner, owner_to_name = gamecenter.owner_maps(get_league_users(league_id) or [],
+                                                            get_league_rosters(league_id) or [])
+        self.owner = {rid: gamecenter.alias_for(owner_to_name.get(oid, f"Roster {rid}"))
+                      for rid, oid in rid_to_owner.items()}
+        self.season = int(league.get("season") or 0)
+        self.plan = gamecenter.SlotPlan(league.get("roster_positions"))
+        self.header = self.plan.header()
+        self.table = gamecenter.player_table(get_players_cached())
+        self.start_week(current_week(league))
+        self.week_due = time.monotonic() + WEEK_CHECK_S
+        self.interval = MIN_S
+        self.due = 0.0
+        self.polls = 0
+
+    def start_week(self, week):
+        """Zustand für eine (neue) Woche; seq aus index.json, wenn der für dieselbe Woche steht (Neustart)."""
+        self.week = week
+        self.elo = pre_week_ratings(self.season, week)
+        self.url = f"{BASE}/league/{self.league_id}/matchups/{week}"
+        self.sigs, self.matchups, self.standings = {}, {}, {}
+        try:
+            index = json.loads((LIVE_DIR / str(self.league_id) / "index.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = {}
+        same = (index.get("season"), index.get("week")) == (self.season, week)
+        self.seq = int(index.get("seq") or 0) if same else 0
+
+    def check_week(self):
+        """Fragt /state/nfl höchstens alle WEEK_CHECK_S; bei einer neuen Woche wird der Zustand zurückgesetzt."""
+        if ENV_WEEK or time.monotonic() < self.week_due:
+            return
+        self.week_due = time.monotonic() + WEEK_CHECK_S
+        try:
+            week = int(fetch_json(f"{BASE}/state/nfl", cache=False)["week"])
+        except Exception:   # Netzfehler o. ä.: Woche beibehalten, nächster Versuch beim nächsten Check
+            return
+        if week != self.week:
+            print(f"→ {self.league_id}: Woche {self.week} -> {week}")
+            self.start_week(week)
+
+    def _matchup(self, teams):
+        """records.Matchup exakt wie parse_weeks es aus den Gamecenter-CSVs baut."""
+        rows = []
+        for e in teams:
+            row, total = gamecenter.team_row(self.plan, self.table, e, self.owner.get(e["roster_id"], f"Roster {e['roster_id']}"))
+            rows.append((row, total))
+        (ra, ta), (rb, tb) = rows
+        ra[-2:], rb[-2:] = [rb[0], tb], [ra[0], ta]
+        parsed = [parse_weeks.parse_team_row(self.header, [str(x) for x in r]) for r, _ in rows]
+        m = parse_weeks.group_matchups(parsed)[0]
+        m.season = self.season; m.week = self.week; m.is_playoff = False
+        return m
+
+    def _elo_preview(self, m):
+        """Elo vor dem Spiel, Erwartung und Elo, falls der aktuelle Stand der Endstand wäre."""
+        base = compute_elo.BASE_RATING
+        ht, at = m.home_team, m.away_team
+        ra, rb = self.elo.get(ht, base), self.elo.get(at, base)
+        hp, ap = (m.home_points or 0.0), (m.away_points or 0.0)
+        ea = compute_elo.expected_score(ra, rb)
+        sa = 0.5 if hp == ap else float(hp > ap)
+        k = compute_elo.K_BASE * (compute_elo.PLAYOFF_MULT if self.week > 14 else 1.0) * compute_elo.margin_multiplier(abs(hp - ap))
+        return {"home_team": ht, "away_team": at, "home_elo": round(ra, 2), "away_elo": round(rb, 2),
+                "home_expected": round(ea, 4),
+                "home_elo_if_final": round(ra + k * (sa - ea), 2), "away_elo_if_final": round(rb + k * (ea - sa), 2)}
+
+    def poll(self):
+        """Ein Poll; Rückgabe: Delta-Dict oder None (nichts geändert)."""
+        self.polls += 1
+        self.check_week()
+        with tracing.span("stage", "live.poll", league_id=self.league_id, week=self.week) as sp:
+            entries = fetch_json(self.url, cache=False) or []
+            by_mid, changed = defaultdict(list), set()
+            for e in entries:
+                by_mid[e.get("matchup_id")].append(e)
+                sig = signature(e)
+                if self.sigs.get(e["roster_id"]) != sig:
+                    self.sigs[e["roster_id"]] = sig
+                    changed.add(e.get("matchup_id"))
+            sp.set(changed=len(changed))
+            if not changed:
+                return None
+
+            matchups = []
+            for mid in sorted(changed, key=str):
+                if mid is None or len(by_mid[mid]) != 2:
+                    continue
+                m = self.matchups[mid] = self._matchup(by_mid[mid])
+                matchups.append(m)
+            weekly = parse_weeks.build_weekly_standings({self.week: list(self.matchups.values())})
+            rows = [r for r in (weekly[0]["rows"] if weekly else []) if self.standings.get(r["team"]) != r]
+            for r in rows:
+                self.standings[r["team"]] = r
+
+            self.seq += 1
+            return {"league_id": self.league_id, "season": self.season, "week": self.week,
+                    "seq": self.seq, "base_seq": self.seq - 1,
+                    "polled_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "matchups": [m.to_json() for m in matchups], "weekly_standings": rows,
+                    "elo_preview": [self._elo_preview(m) for m in matchups]}
+
+    def write(self, delta):
+        out = LIVE_DIR / str(self.league_id)
+        week_dir = out / f"{self.season}-{self.week}"
+        week_dir.mkdir(parents=True, exist_ok=True)
+        tracing.write_text(week_dir / f"{delta['seq']}.json", json.dumps(delta, ensure_ascii=False))
+        tracing.write_text(out / "index.json", json.dumps(
+            {"league_id": self.league_id, "season": self.season, "week": self.week, "seq": delta["seq"],
+             "updated": delta["polled_at"]}, ensure_ascii=False))
+
+    def schedule(self, changed):
+        self.interval = MIN_S if changed else min(MAX_S, self.interval * 2)
+        self.due = time.monotonic() + self.interval
+
+@tracing.traced()
+def main(league_ids=None):
+    league_ids = league_ids or LEAGUE_IDS
+    if not league_ids:
+        raise SystemExit("Bitte LIVE_LEAGUE_IDS (oder SLEEPER_LEAGUE_ID) setzen.")
+    get_players_cached()
+    leagues = [LiveLeague(lid) for lid in league_ids]
+    print("Live: " + ", ".join(f"{lg.league_id} ({lg.season}, Woche {lg.week})" for lg in leagues))
+    try:
+        while True:
+            active = [lg for lg in leagues if not POLLS or lg.polls < POLLS]
+            if not active:
+                break
+            lg = min(active, key=lambda x: x.due)
+            time.sleep(max(0.0, lg.due - time.monotonic()))
+            try:
+                delta = lg.poll()
+            except Exception as exc:   # Netzfehler o. ä.: nächster Versuch nach dem Backoff
+                print(f"! {lg.league_id}: {exc}")
+                delta = None
+            if delta:
+                lg.write(delta)
+                print(f"✓ {lg.league_id} #{delta['seq']}: {len(delta['matchups'])} Matchups, "
+                      f"{len(delta['weekly_standings'])} Standings-Zeilen")
+            lg.schedule(bool(delta))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,17 @@
 # scrapeSleeperStandings.py
-import os, json, csv, time
+import os, csv
 from pathlib import Path
 from collections import defaultdict
-import requests
+import tracing
+from sleeper_api import get_matchups, get_transactions, get_drafts, get_draft_picks  # Retry bei 429/5xx, Antworten je Lauf gecacht
+import scrapeSleeperTransactions as txlog
 
-BASE = "https://api.sleeper.app/v1"
 OUT_DIR = Path("./output")
-DATA_DIR = Path("./data")
 
 LEAGUE_ID = os.getenv("SLEEPER_LEAGUE_ID", "").strip()
 ENV_SEASON = os.getenv("SEASON")  # optional
 
 # ---------------- API ---------------- #
-def _get(url):
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    return r.json()
-
-def get_league(league_id):              return _get(f"{BASE}/league/{league_id}")
-def get_league_users(league_id):        return _get(f"{BASE}/league/{league_id}/users")
-def get_league_rosters(league_id):      return _get(f"{BASE}/league/{league_id}/rosters")
-def get_matchups(league_id, week):      return _get(f"{BASE}/league/{league_id}/matchups/{week}")
-def get_transactions(league_id, week):  return _get(f"{BASE}/league/{league_id}/transactions/{week}")
-def get_drafts(league_id):              return _get(f"{BASE}/league/{league_id}/drafts")
-def get_draft_picks(draft_id):          return _get(f"{BASE}/draft/{draft_id}/picks")
-
-def get_players_cached():
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    cache = DATA_DIR / "sleeper_players.json"
-    if cache.exists() and time.time() - cache.stat().st_mtime < 7*24*3600:
-        return json.loads(cache.read_text(encoding="utf-8"))
-    players = _get(f"{BASE}/players/nfl")  # groß
-    cache.write_text(json.dumps(players), encoding="utf-8")
-    return players
 
 # --------------- Helpers --------------- #
 def owner_maps(users, rosters):
@@ -91,14 +70,18 @@ def draft_positions_for_league(league_id):
     return mapping
 
 # --------------- Moves/Trades (optional) --------------- #
-def count_moves_and_trades(league_id, owner_id):
+def count_moves_and_trades(league_id, owner_id, log=None):
+    """log = Einträge aus scrapeSleeperTransactions (sonst direkt von der API)."""
     moves = 0
     trades = 0
     for week in range(1, 15):  # Regular 1..14
-        try:
-            txs = get_transactions(league_id, week) or []
-        except:
-            continue
+        if log is not None:
+            txs = [tx for tx in log if tx["week"] == week]
+        else:
+            try:
+                txs = get_transactions(league_id, week) or []
+            except:
+                continue
         for tx in txs:
             ttype = tx.get("type")
             creator = tx.get("creator")  # user_id
@@ -243,29 +226,34 @@ def compute_playoffs_custom(league_id, owners_sorted, owner_to_rid, stats):
     return rows
 
 # ----------------------------- MAIN ----------------------------- #
-def main():
-    if not LEAGUE_ID:
+@tracing.traced()
+def main(league_id=None, season=None, maps=None):
+    """maps: Owner-Maps der Saison (scrapeSleeperSync.season_maps), sonst hier gebaut."""
+    league_id = league_id or LEAGUE_ID
+    if not league_id:
         raise SystemExit("Bitte SLEEPER_LEAGUE_ID als Umgebungsvariable setzen.")
 
-    league  = get_league(LEAGUE_ID)
-    users   = get_league_users(LEAGUE_ID)
-    rosters = get_league_rosters(LEAGUE_ID)
+    if maps is None:
+        import scrapeSleeperSync   # erst hier: scrapeSleeperSync importiert dieses Modul
+        maps = scrapeSleeperSync.season_maps(league_id)
+    league = maps["league"]
 
     # Saison bestimmen
-    season_str = ENV_SEASON or league.get("season") or "2022"
+    season_str = str(season or ENV_SEASON or league.get("season") or "2022")
     try: SEASON = int(season_str)
     except: SEASON = 2022
 
     season_dir = OUT_DIR / str(SEASON)
     season_dir.mkdir(parents=True, exist_ok=True)
 
-    rid_to_owner, owner_to_rid, owner_to_teamname, owner_to_display = owner_maps(users, rosters)
+    rid_to_owner, owner_to_rid = maps["rid_to_owner"], maps["owner_to_rid"]
+    owner_to_teamname, owner_to_display = maps["owner_to_teamname"], maps["owner_to_display"]
 
     # Regular Season 1..14
-    stats, owners_sorted = compute_regular_season(LEAGUE_ID, rid_to_owner, owner_to_teamname, owner_to_display)
+    stats, owners_sorted = compute_regular_season(league_id, rid_to_owner, owner_to_teamname, owner_to_display)
 
     # Draft-Positionen (fix)
-    owner_to_dpos = draft_positions_for_league(LEAGUE_ID)
+    owner_to_dpos = draft_positions_for_league(league_id)
     for oid in stats.keys():
         dp = owner_to_dpos.get(str(oid))
         if dp is not None:
@@ -273,8 +261,10 @@ def main():
 
     # Moves/Trades (optional; Moves exakt, Trades best effort je Owner via creator/roster_ids)
     # Wenn du keine Moves/Trades willst: diesen Block weglassen.
+    # Quelle ist das persistente Transaktions-Log (nur offene Wochen werden neu geholt).
+    log = txlog.update_log(league_id, SEASON)
     for oid in stats.keys():
-        m, tr = count_moves_and_trades(LEAGUE_ID, oid)
+        m, tr = count_moves_and_trades(league_id, oid, log)
         stats[oid]["Moves"] = m
         stats[oid]["Trades"] = tr
 
@@ -286,7 +276,7 @@ def main():
     ]
 
     # PlayoffRank hier NICHT aus Brackets, sondern erstmal leer – der kommt in Datei 2 separat.
-    with regular_out.open("w", newline="", encoding="utf-8") as f:
+    with tracing.open_write(regular_out, newline="") as f:
         w = csv.writer(f, delimiter="\t")
         w.writerow(header_regular)
         for oid in owners_sorted:
@@ -310,11 +300,11 @@ def main():
     print(f"✓ Regular Season geschrieben: {regular_out}")
 
     # ---------- Datei 2: Playoffs (nach deinem Schema) ----------
-    playoff_rows = compute_playoffs_custom(LEAGUE_ID, owners_sorted, owner_to_rid, stats)
+    playoff_rows = compute_playoffs_custom(league_id, owners_sorted, owner_to_rid, stats)
     playoff_out = season_dir / f"standings_playoffs.tsv"
     header_playoffs = ["TeamName","PlayoffRank","ManagerName","Seed","Week15Pts","Week16Pts"]
 
-    with playoff_out.open("w", newline="", encoding="utf-8") as f:
+    with tracing.open_write(playoff_out, newline="") as f:
         w = csv.writer(f, delimiter="\t")
         w.writerow(header_playoffs)
         for row in playoff_rows:
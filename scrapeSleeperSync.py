@@ -0,0 +1,75 @@
+# scrapeSleeperSync.py
+# Ein Lauf statt drei Skripten: Gamecenter-CSVs (W1–16), beide Standings-TSVs und draft.tsv
+#   SLEEPER_LEAGUE_ID=... [SEASON=2025] python scrapeSleeperSync.py
+# Jeder Endpoint wird genau einmal (parallel) geholt; die Spieler-DB wird einmal geladen.
+# Transaktionen nur für Wochen, die im Log (output/<season>/transactions.jsonl) noch offen sind.
+# Die drei Exporte laufen danach auf diesem In-Memory-Snapshot (sleeper_api-Cache); Owner-, Alias- und
+# Spieler-Maps werden je Saison einmal gebaut (season_maps) und an alle Exporte übergeben.
+import os
+from sleeper_api import (BASE, fetch_json, prefetch, get_league, get_league_users, get_league_rosters,
+                         get_players_cached)
+import tracing
+
+import scrapeSleeperGamecenter as gamecenter
+import scrapeSleeperStandings as standings
+import scrapeSleeperDraft as draft
+import scrapeSleeperTransactions as txlog
+
+LEAGUE_ID = os.getenv("SLEEPER_LEAGUE_ID", "").strip()
+ENV_SEASON = os.getenv("SEASON")  # optional
+WORKERS = int(os.getenv("SLEEPER_WORKERS", "16"))
+WEEKS = range(1, 16 + 1)          # Gamecenter + Playoff-Wochen 15/16 der Standings
+
+def season_urls(league_id):
+    lg = f"{BASE}/league/{league_id}"
+    urls = [lg, f"{lg}/users", f"{lg}/rosters", f"{lg}/drafts", f"{lg}/winners_bracket", f"{lg}/losers_bracket"]
+    urls += [f"{lg}/matchups/{w}" for w in WEEKS]
+    return urls
+
+@tracing.traced()
+def prefetch_seasons(league_ids, workers=WORKERS):
+    """Snapshot aller Endpoints der Ligen in den sleeper_api-Cache (2 Phasen: Liga/Draft-IDs -> Picks + offene Transaktionswochen)."""
+    urls = [u for lid in league_ids for u in season_urls(lid)]
+    prefetch(urls, workers)
+    more = [f"{BASE}/draft/{d['draft_id']}/picks"
+            for lid in league_ids for d in (fetch_json(f"{BASE}/league/{lid}/drafts") or [])[:1]]
+    more += [f"{BASE}/league/{lid}/transactions/{w}"
+             for lid in league_ids for w in txlog.pending_weeks(lid, fetch_json(f"{BASE}/league/{lid}") or {}, ENV_SEASON)]
+    prefetch(more, workers)
+    return len(urls) + len(more)
+
+def season_maps(league_id):
+    """
+    Liga, Users, Rosters und die daraus abgeleiteten Maps, die Gamecenter, Standings und Draft brauchen:
+    roster_id/owner_id, Team- und Anzeigenamen, Alias je Roster (Gamecenter), Spieler-DB und -Tabelle.
+    """
+    league  = get_league(league_id) or {}
+    users   = get_league_users(league_id) or []
+    rosters = get_league_rosters(league_id) or []
+    players = get_players_cached()
+    rid_to_owner, owner_to_rid, owner_to_teamname, owner_to_display = standings.owner_maps(users, rosters)
+    _, owner_to_name = gamecenter.owner_maps(users, rosters)
+    return {"league": league, "players": players, "table": gamecenter.player_table(players),
+            "rid_to_owner": rid_to_owner, "owner_to_rid": owner_to_rid,
+            "owner_to_teamname": owner_to_teamname, "owner_to_display": owner_to_display,
+            "owner_alias": {rid: gamecenter.alias_for(owner_to_name.get(oid, f"Roster {rid}"))
+                            for rid, oid in rid_to_owner.items()}}
+
+def sync_season(league_id, season=None):
+    """Schreibt alle Exporte einer Saison aus dem Snapshot."""
+    with tracing.stage("sync_season", league_id=league_id, season=season):
+        maps = season_maps(league_id)
+        gamecenter.main(league_id, season, maps)
+        standings.main(league_id, season, maps)
+        draft.main(league_id, season, maps)
+
+def main():
+    if not LEAGUE_ID:
+        raise SystemExit("Bitte SLEEPER_LEAGUE_ID als Umgebungsvariable setzen.")
+    get_players_cached()          # einmal laden, alle Exporte teilen das Objekt
+    n = prefetch_seasons([LEAGUE_ID])
+    sync_season(LEAGUE_ID, ENV_SEASON)
+    print(f"✓ Sync fertig: {n} Endpoints je einmal abgerufen")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# scrapeSleeperTransactions.py
+# Persistentes Transaktions-Log einer Sleeper-Saison:
+#   SLEEPER_LEAGUE_ID=... [SEASON=2025] python scrapeSleeperTransactions.py
+# output/<season>/transactions.jsonl – eine Transaktion pro Zeile, nur angehängt, dedupliziert per transaction_id
+#   (ändert sich der Status einer offenen Woche, kommt eine neue Zeile dazu; beim Lesen gilt die letzte).
+# output/<season>/transactions.state.json – abgeschlossene Wochen; nur offene Wochen werden erneut abgefragt.
+import json, os
+from pathlib import Path
+import tracing
+from sleeper_api import get_league, get_league_users, get_league_rosters, get_transactions, get_players_cached
+
+import scrapeSleeperGamecenter as gamecenter
+
+OUT_DIR = Path("./output")
+LOG_NAME = "transactions.jsonl"
+STATE_NAME = "transactions.state.json"
+
+LEAGUE_ID = os.getenv("SLEEPER_LEAGUE_ID", "").strip()
+ENV_SEASON = os.getenv("SEASON")  # optional
+TX_WEEKS = range(1, 14 + 1)       # Moves/Trades (Regular Season)
+
+
+def season_of(league, season=None):
+    try: return int(season or ENV_SEASON or league.get("season") or 2022)
+    except: return 2022
+
+def log_paths(season):
+    d = OUT_DIR / str(season)
+    return d / LOG_NAME, d / STATE_NAME
+
+def read_log(path: Path):
+    """Alle Einträge eines Logs (Reihenfolge wie angehängt); fehlende Datei -> []."""
+    if not path.exists():
+        return []
+    with path.open("r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def latest(records):
+    """Eine Zeile je transaction_id (die zuletzt angehängte gewinnt), Reihenfolge der Erstaufnahme."""
+    out = {}
+    for r in records:
+        out[r["transaction_id"]] = r
+    return list(out.values())
+
+def final_weeks(league_id, state_path: Path):
+    """Bereits vollständig geloggte Wochen (Zustand gehört zur league_id, sonst neu)."""
+    if not state_path.exists():
+        return set()
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except ValueError:
+        return set()
+    return set(state.get("final_weeks") or []) if str(state.get("league_id")) == str(league_id) else set()
+
+def is_final(league, week):
+    """Eine Woche ist abgeschlossen, wenn die Saison vorbei ist oder Sleeper schon eine spätere Woche spielt."""
+    if league.get("status") == "complete":
+        return True
+    try: leg = int((league.get("settings") or {}).get("leg") or 0)
+    except (TypeError, ValueError): leg = 0
+    return week < leg
+
+def pending_weeks(league_id, league, season=None, weeks=TX_WEEKS):
+    """Wochen, deren Transaktionen (noch) abgefragt werden müssen."""
+    _, state_path = log_paths(season_of(league, season))
+    done = final_weeks(league_id, state_path)
+    return [w for w in weeks if w not in done]
+
+def log_record(tx, week, table, rid_to_manager):
+    """Schlanker Log-Eintrag; Spieler als Gamecenter-Label und Roster als Manager-Alias (Join im ETL)."""
+    adds, drops = tx.get("adds") or {}, tx.get("drops") or {}
+    return {"transaction_id": str(tx.get("transaction_id")), "week": week,
+            "type": tx.get("type"), "status": tx.get("status"),
+            "created": tx.get("created"), "creator": tx.get("creator"),
+            "roster_ids": tx.get("roster_ids") or [],
+            "adds": adds, "drops": drops,
+            "waiver_bid": (tx.get("settings") or {}).get("waiver_bid"),
+            "players": {pid: table.label(pid) for pid in {**adds, **drops}},
+            "managers": {str(rid): rid_to_manager.get(rid, f"Roster {rid}")
+                         for rid in {*(tx.get("roster_ids") or []), *adds.values(), *drops.values()}}}
+
+def update_log(league_id, season=None, weeks=TX_WEEKS):
+    """Hängt neue Transaktionen der offenen Wochen an das Log an; Rückgabe: latest() über das ganze Log."""
+    league = get_league(league_id) or {}
+    season = season_of(league, season)
+    log_path, state_path = log_paths(season)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    records = read_log(log_path)
+    known = {r["transaction_id"]: r["status"] for r in records}
+    done = final_weeks(league_id, state_path)
+    pending = [w for w in weeks if w not in done]
+    if not pending:
+        return latest(records)
+
+    users = get_league_users(league_id) or []
+    rosters = get_league_rosters(league_id) or []
+    rid_to_owner, owner_to_name = gamecenter.owner_maps(users, rosters)
+    rid_to_manager = {rid: gamecenter.alias_for(owner_to_name.get(oid, f"Roster {rid}"))
+                      for rid, oid in rid_to_owner.items()}
+    table = gamecenter.player_table(get_players_cached())
+
+    new = []
+    for week in pending:
+        for tx in get_transactions(league_id, week) or []:
+            rec = log_record(tx, week, table, rid_to_manager)
+            if known.get(rec["transaction_id"], ...) != rec["status"]:
+                known[rec["transaction_id"]] = rec["status"]
+                new.append(rec)
+        if is_final(league, week):
+            done.add(week)
+    if new:
+        with tracing.open_write(log_path, mode="a") as f:
+            for rec in new:
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    tracing.write_text(state_path, json.dumps({"league_id": str(league_id), "final_weeks": sorted(done)}))
+    records = latest(records + new)
+    print(f"✓ Transaktionen {season}: {len(new)} neu (Wochen {pending[0]}–{pending[-1]}), {len(records)} gesamt")
+    return records
+
+@tracing.traced()
+def main(league_id=None, season=None):
+    league_id = league_id or LEAGUE_ID
+    if not league_id:
+        raise SystemExit("Bitte SLEEPER_LEAGUE_ID als Umgebungsvariable setzen.")
+    return update_log(league_id, season)
+
+if __name__ == "__main__":
+    main()
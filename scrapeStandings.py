@@ -1,9 +1,7 @@
 import csv
-from bs4 import BeautifulSoup as bs
-import requests
-from cookieString import cookies
-from utils import setup_output_folders
+from utils import setup_output_folders, get_soup
 from constants import leagueID, leagueStartYear, leagueEndYear, standings_directory
+import tracing
 
 
 # Iterate through each season
@@ -15,8 +13,7 @@ for i in range(leagueStartYear, leagueEndYear):
 
     # Parse Regular Season Standings
     # https://fantasy.nfl.com/league/1609009/history/2023/standings?historyStandingsType=regular
-    page = requests.get('https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/standings?historyStandingsType=regular', cookies=cookies)
-    soup = bs(page.text, 'html.parser')
+    soup = get_soup('https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/standings?historyStandingsType=regular')
     csv_rows = []
 
     # Parse the regular season standings table
@@ -32,8 +29,7 @@ for i in range(leagueStartYear, leagueEndYear):
 
     # Parse Playoffs Season Standings
     # https://fantasy.nfl.com/league/1609009/history/2023/standings?historyStandingsType=final
-    page = requests.get('https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/standings?historyStandingsType=final', cookies=cookies)
-    soup = bs(page.text, 'html.parser')
+    soup = get_soup('https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/standings?historyStandingsType=final')
 
     # Parse the playoffs standings table
     # Adds col: 'PlayoffRank'
@@ -54,8 +50,7 @@ for i in range(leagueStartYear, leagueEndYear):
 
     # Parse Owners
     # https://fantasy.nfl.com/league/1609009/history/2023/owners
-    page = requests.get('https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/owners', cookies=cookies)
-    soup = bs(page.text, 'html.parser')
+    soup = get_soup('https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/owners')
 
     # Parse the owners table
     # Adds cols: 'ManagerName', 'Moves', 'Trades'
@@ -71,16 +66,11 @@ for i in range(leagueStartYear, leagueEndYear):
                 csv_row.append(moves)
                 csv_row.append(trades)
 
-    # Parse Draft Results
-    # https://fantasy.nfl.com/league/1609009/history/2023/draftresults
-    page = requests.get('https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/draftresults', cookies=cookies)
-    soup = bs(page.text, 'html.parser')
-
     # Parse the Draft results table (robust) – Adds col: 'DraftPosition'
     # https://fantasy.nfl.com/league/<id>/history/<season>/draftresults
     try:
         url_draft = f"https://fantasy.nfl.com/league/{leagueID}/history/{season}/draftresults"
-        soup = get_soup(url_draft) if 'get_soup' in globals() else bs(requests.get(url_draft, headers=HEADERS, cookies=cookies, timeout=30).text, 'html.parser')
+        soup = get_soup(url_draft)
     
         # 1) Versuche "Round 1" Header tolerant zu finden
         draft_h4 = None
@@ -133,7 +123,7 @@ for i in range(leagueStartYear, leagueEndYear):
 
                 
     # Write all to a csv file
-    with open(standings_directory + season + '.csv', 'w', newline='') as f:
+    with tracing.open_write(standings_directory + season + '.csv', newline='') as f:
         writer = csv.writer(f)
         header= ['TeamName', 'RegularSeasonRank', 'Record', 'PointsFor', 'PointsAgainst', 'PlayoffRank', 'ManagerName', 'Moves', "Trades", "DraftPosition"]
         writer.writerow(header) 
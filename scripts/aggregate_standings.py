@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 import re
+import sys
 from pathlib import Path
 
 import pandas as pd
 
-INPUT_DIR = Path("output/3082897-history-standings")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # tracing.py liegt im Repo-Root
+import tracing
+
+INPUT_DIR = Path(os.getenv("STANDINGS_DIR", "output/3082897-history-standings"))
 OUTPUT_FILE = INPUT_DIR / "aggregated_standings.tsv"
 
 
@@ -63,137 +68,156 @@ def parse_record(rec: str):
     return (0, 0, 0)
 
 
-# ---------- Load all seasons (YYYY.tsv only) ----------
-rows = []
-tsv_files = sorted(INPUT_DIR.glob("[0-9][0-9][0-9][0-9].tsv"))
-if not tsv_files:
-    raise SystemExit(f"No TSV files found matching YYYY.tsv under {INPUT_DIR}")
-
-for f in tsv_files:
-    season = int(f.stem)  # stem ist '2015' etc.
-
-    # Einlesen als Strings, damit wir selber normalisieren
-    df = pd.read_csv(f, sep="\t", dtype=str, keep_default_na=False)
-
-    # Case-insensitive Spaltenzuordnung
-    colmap = {c.lower(): c for c in df.columns}
-
-    def get(*candidates):
-        """Hole die erste existierende Spalte aus Kandidatennamen (case-insensitive)."""
-        for cand in candidates:
-            real = colmap.get(cand.lower())
-            if real:
-                return real
-        return None
-
-    c_manager = get("ManagerName", "Manager", "Owner", "OwnerName")
-    c_points_for = get("PointsFor", "PF", "Points For")
-    c_points_against = get("PointsAgainst", "PA", "Points Against")
-    c_moves = get("Moves")
-    c_trades = get("Trades")
-    c_record = get("Record")
-    c_playoff = get("PlayoffRank", "Playoff Rank", "Playoff")
-    c_draftpos = get("DraftPosition", "Draft Position")
-
-    # Pflichtspalten prüfen – wenn PF/PA/Manager fehlen, Datei überspringen
-    missing = [n for n, real in [
-        ("ManagerName", c_manager),
-        ("PointsFor", c_points_for),
-        ("PointsAgainst", c_points_against),
-    ] if real is None]
-    if missing:
-        print(f"Skipping {f} — missing required columns: {missing}")
-        continue
-
-    def col_stripped(colname):
-        return df[colname].astype(str).str.strip()
-
-    tmp = pd.DataFrame({
-        "Season": season,
-        "ManagerName": col_stripped(c_manager),
-        "PointsFor": col_stripped(c_points_for).map(to_float),
-        "PointsAgainst": col_stripped(c_points_against).map(to_float),
-        "Moves": col_stripped(c_moves).map(to_int) if c_moves else 0,
-        "Trades": col_stripped(c_trades).map(to_int) if c_trades else 0,
-        "Record": col_stripped(c_record) if c_record else "",
-        "PlayoffRank": pd.to_numeric(col_stripped(c_playoff), errors="coerce") if c_playoff else pd.Series([pd.NA]*len(df)),
-        "DraftPosition": pd.to_numeric(col_stripped(c_draftpos), errors="coerce") if c_draftpos else pd.NA,
-    })
-
-    # Record -> Wins/Losses/Ties
-    wlt = tmp["Record"].apply(parse_record)
-    tmp[["Wins", "Losses", "Ties"]] = pd.DataFrame(wlt.tolist(), index=tmp.index)
-
-    rows.append(tmp)
-
-if not rows:
-    raise SystemExit("No valid season rows parsed (after skipping files with missing required columns).")
-
-all_seasons = pd.concat(rows, ignore_index=True)
-
-# ---------- Aggregate ----------
-grouped = all_seasons.groupby("ManagerName", dropna=False)
-
-agg_num = grouped[["PointsFor", "PointsAgainst", "Moves", "Trades", "Wins", "Losses", "Ties"]].sum().round(2)
-avg_draft = grouped["DraftPosition"].mean().round(2).rename("DraftPosition")
-season_counts = grouped["Season"].nunique().rename("Seasons")
-
-# Playoff-Buckets ohne MultiIndex-Duplikate
-playoff_df = grouped["PlayoffRank"].agg(
-    Championships=lambda s: (s == 1).sum(),
-    Playoffs=lambda s: ((s >= 1) & (s <= 4)).sum(),
-    Finals=lambda s: ((s >= 1) & (s <= 2)).sum(),
-    Toiletbowls=lambda s: ((s >= 7) & (s <= 8)).sum(),
-    Sackos=lambda s: (s == 8).sum(),
-)
-
-result = (
-    agg_num
-    .join(playoff_df)
-    .join(avg_draft)
-    .join(season_counts)
-    .reset_index()
-)
-
-# Fehlende Spalten ergänzen + Typen bereinigen
-int_cols = [
-    "Moves", "Trades", "Wins", "Losses", "Ties",
-    "Championships", "Playoffs", "Finals", "Toiletbowls", "Sackos", "Seasons"
-]
-for c in int_cols:
-    if c not in result.columns:
-        result[c] = 0
-    result[c] = pd.to_numeric(result[c], errors="coerce").fillna(0).astype(int)
-
-if "DraftPosition" in result.columns:
-    result["DraftPosition"] = pd.to_numeric(result["DraftPosition"], errors="coerce").round(2)
-
-# Spaltenreihenfolge & Sortierung
-cols = [
-    "ManagerName",
-    "PointsFor",
-    "PointsAgainst",
-    "Moves",
-    "Trades",
-    "Wins",
-    "Losses",
-    "Ties",
-    "Championships",
-    "Playoffs",
-    "Finals",
-    "Toiletbowls",
-    "Sackos",
-    "DraftPosition",
-    "Seasons",
-]
-for c in cols:
-    if c not in result.columns:
-        result[c] = 0
-
-result = result[cols].sort_values(by=["Championships", "Wins", "PointsFor"], ascending=[False, False, False])
-
-# Export
-OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-result.to_csv(OUTPUT_FILE, sep="\t", index=False)
-
-print(f"Wrote {OUTPUT_FILE} with {len(result)} rows.")
+def season_files(input_dir: Path):
+    """
+    (Saison, Datei) aller Regular-Season-TSVs: NFL.com legt <dir>/YYYY.tsv ab,
+    scrapeSleeperStandings <dir>/YYYY/standings_regular_1_14.tsv (mit STANDINGS_DIR=output).
+    """
+    files = {int(f.parent.name): f for f in input_dir.glob("[0-9][0-9][0-9][0-9]/standings_regular_1_14.tsv")}
+    files.update((int(f.stem), f) for f in input_dir.glob("[0-9][0-9][0-9][0-9].tsv"))
+    return sorted(files.items())
+
+
+@tracing.traced("aggregate_standings.main")
+def main(input_dir=None):
+    input_dir = Path(input_dir) if input_dir else INPUT_DIR
+    output_file = input_dir / OUTPUT_FILE.name
+
+    # ---------- Load all seasons (YYYY.tsv bzw. YYYY/standings_regular_1_14.tsv) ----------
+    rows = []
+    tsv_files = season_files(input_dir)
+    if not tsv_files:
+        raise SystemExit(f"No TSV files found matching YYYY.tsv or YYYY/standings_regular_1_14.tsv under {input_dir}")
+
+    for season, f in tsv_files:
+        # Einlesen als Strings, damit wir selber normalisieren
+        with tracing.span("parse", "standings_tsv", path=str(f)):
+            df = pd.read_csv(f, sep="\t", dtype=str, keep_default_na=False)
+
+        # Case-insensitive Spaltenzuordnung
+        colmap = {c.lower(): c for c in df.columns}
+
+        def get(*candidates):
+            """Hole die erste existierende Spalte aus Kandidatennamen (case-insensitive)."""
+            for cand in candidates:
+                real = colmap.get(cand.lower())
+                if real:
+                    return real
+            return None
+
+        c_manager = get("ManagerName", "Manager", "Owner", "OwnerName")
+        c_points_for = get("PointsFor", "PF", "Points For")
+        c_points_against = get("PointsAgainst", "PA", "Points Against")
+        c_moves = get("Moves")
+        c_trades = get("Trades")
+        c_record = get("Record")
+        c_playoff = get("PlayoffRank", "Playoff Rank", "Playoff")
+        c_draftpos = get("DraftPosition", "Draft Position")
+
+        # Pflichtspalten prüfen – wenn PF/PA/Manager fehlen, Datei überspringen
+        missing = [n for n, real in [
+            ("ManagerName", c_manager),
+            ("PointsFor", c_points_for),
+            ("PointsAgainst", c_points_against),
+        ] if real is None]
+        if missing:
+            print(f"Skipping {f} — missing required columns: {missing}")
+            continue
+
+        def col_stripped(colname):
+            return df[colname].astype(str).str.strip()
+
+        tmp = pd.DataFrame({
+            "Season": season,
+            "ManagerName": col_stripped(c_manager),
+            "PointsFor": col_stripped(c_points_for).map(to_float),
+            "PointsAgainst": col_stripped(c_points_against).map(to_float),
+            "Moves": col_stripped(c_moves).map(to_int) if c_moves else 0,
+            "Trades": col_stripped(c_trades).map(to_int) if c_trades else 0,
+            "Record": col_stripped(c_record) if c_record else "",
+            "PlayoffRank": pd.to_numeric(col_stripped(c_playoff), errors="coerce") if c_playoff else pd.Series([pd.NA]*len(df)),
+            "DraftPosition": pd.to_numeric(col_stripped(c_draftpos), errors="coerce") if c_draftpos else pd.NA,
+        })
+
+        # Record -> Wins/Losses/Ties
+        wlt = tmp["Record"].apply(parse_record)
+        tmp[["Wins", "Losses", "Ties"]] = pd.DataFrame(wlt.tolist(), index=tmp.index)
+
+        rows.append(tmp)
+
+    if not rows:
+        raise SystemExit("No valid season rows parsed (after skipping files with missing required columns).")
+
+    all_seasons = pd.concat(rows, ignore_index=True)
+
+    # ---------- Aggregate ----------
+    grouped = all_seasons.groupby("ManagerName", dropna=False)
+
+    agg_num = grouped[["PointsFor", "PointsAgainst", "Moves", "Trades", "Wins", "Losses", "Ties"]].sum().round(2)
+    avg_draft = grouped["DraftPosition"].mean().round(2).rename("DraftPosition")
+    season_counts = grouped["Season"].nunique().rename("Seasons")
+
+    # Playoff-Buckets ohne MultiIndex-Duplikate
+    playoff_df = grouped["PlayoffRank"].agg(
+        Championships=lambda s: (s == 1).sum(),
+        Playoffs=lambda s: ((s >= 1) & (s <= 4)).sum(),
+        Finals=lambda s: ((s >= 1) & (s <= 2)).sum(),
+        Toiletbowls=lambda s: ((s >= 7) & (s <= 8)).sum(),
+        Sackos=lambda s: (s == 8).sum(),
+    )
+
+    result = (
+        agg_num
+        .join(playoff_df)
+        .join(avg_draft)
+        .join(season_counts)
+        .reset_index()
+    )
+
+    # Fehlende Spalten ergänzen + Typen bereinigen
+    int_cols = [
+        "Moves", "Trades", "Wins", "Losses", "Ties",
+        "Championships", "Playoffs", "Finals", "Toiletbowls", "Sackos", "Seasons"
+    ]
+    for c in int_cols:
+        if c not in result.columns:
+            result[c] = 0
+        result[c] = pd.to_numeric(result[c], errors="coerce").fillna(0).astype(int)
+
+    if "DraftPosition" in result.columns:
+        result["DraftPosition"] = pd.to_numeric(result["DraftPosition"], errors="coerce").round(2)
+
+    # Spaltenreihenfolge & Sortierung
+    cols = [
+        "ManagerName",
+        "PointsFor",
+        "PointsAgainst",
+        "Moves",
+        "Trades",
+        "Wins",
+        "Losses",
+        "Ties",
+        "Championships",
+        "Playoffs",
+        "Finals",
+        "Toiletbowls",
+        "Sackos",
+        "DraftPosition",
+        "Seasons",
+    ]
+    for c in cols:
+        if c not in result.columns:
+            result[c] = 0
+
+    result = result[cols].sort_values(by=["Championships", "Wins", "PointsFor"], ascending=[False, False, False])
+
+    # Export
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with tracing.open_write(output_file, newline="") as fh:
+        result.to_csv(fh, sep="\t", index=False)
+
+    print(f"Wrote {output_file} with {len(result)} rows.")
+
+
+if __name__ == "__main__":
+    main()
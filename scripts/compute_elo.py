@@ -1,10 +1,24 @@
 #!/usr/bin/env python3
-import csv, json, math, os, glob
+"""
+Rating-Historie aus den Wochen-CSVs. Das Modell ist austauschbar (scripts/ratings.py, NumPy-Batch je Woche):
+
+  python scripts/compute_elo.py [--model elo|glicko2|margin]     (oder RATING_MODEL=…)
+  python scripts/compute_elo.py --compare [output/teamgamecenter leagues/*/output/teamgamecenter …]
+
+elo schreibt wie bisher elo_ratings_history.tsv + elo_history.json; andere Modelle dieselbe Form nach
+<modell>_ratings_history.tsv bzw. <modell>_history.json. --compare rechnet alle Modelle über alle
+Saisons und vergleicht je Liga die Vorhersagen vor jedem Spiel (Log-Loss, Brier, Trefferquote);
+alle Ligen laufen dabei gemeinsam in einem Batch je Woche.
+"""
+import argparse, csv, json, math, os, glob, sys
 from collections import defaultdict
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # tracing.py liegt im Repo-Root
+import tracing, versions
+
 # ==== Pfade (an dein Repo angepasst) ====
-# Weekly Matchups liegen so wie bei dir: output/teamgamecenter/<year>/<week>.csv
-WEEKLY_DIR = "output/teamgamecenter"
+# Weekly Matchups liegen so wie bei dir: output/teamgamecenter/<year>/<week>.csv (GAMECENTER_DIR überschreibt)
+WEEKLY_DIR = os.getenv("GAMECENTER_DIR", "output/teamgamecenter")
 # Ausgaben:
 ELO_DIR = "output/elo-history"
 ELO_TSV = os.path.join(ELO_DIR, "elo_ratings_history.tsv")
@@ -17,6 +31,19 @@ MEAN_REGRESSION = 0.75  # am Seasonstart: R' = 0.75*R + 0.25*1500
 PLAYOFF_MULT = 1.10     # leichte Erhöhung in Playoffs
 MARGIN_C = 10.0         # für Margin-of-Victory (ln(1+pdiff/C))
 
+# ==== Weitere Modelle (scripts/ratings.py) ====
+RATING_MODEL = os.getenv("RATING_MODEL", "elo")
+MODELS = ("elo", "glicko2", "margin")
+GLICKO_RD = 350.0          # Start-Unsicherheit (Elo-Skala)
+GLICKO_VOL = 0.06          # Start-Volatilität
+GLICKO_TAU = 0.5           # Systemkonstante: wie schnell sich die Volatilität ändern darf
+GLICKO_SEASON_RD = 100.0   # Unsicherheit, die am Saisonstart dazukommt (quadratisch addiert) …
+GLICKO_MAX_RD = 350.0      # … höchstens bis zur Start-Unsicherheit
+MARGIN_ELO_PER_POINT = 8.0  # 8 Elo Differenz = 1 Punkt erwarteter Vorsprung
+MARGIN_K = 0.5             # Elo je Punkt Abweichung vom erwarteten Vorsprung
+MARGIN_CAP = 60.0          # Blowouts zählen höchstens mit 60 Punkten
+
+# Skalare Formel (Live-Vorschau in scrapeSleeperLive); ratings.Elo rechnet dieselbe vektorisiert je Woche
 def expected_score(r_a, r_b):
     return 1.0 / (1.0 + 10 ** (-(r_a - r_b) / 400.0))
 
@@ -76,15 +103,15 @@ def read_weekly_csv(path):
             seen.add(pair)
     return uniq
 
-def iter_year_weeks():
+def iter_year_weeks(weekly_dir=WEEKLY_DIR):
     years = []
-    for ydir in glob.glob(os.path.join(WEEKLY_DIR, "*")):
+    for ydir in glob.glob(os.path.join(weekly_dir, "*")):
         if os.path.isdir(ydir) and os.path.basename(ydir).isdigit():
             years.append(int(os.path.basename(ydir)))
     years.sort()
     for y in years:
         week_files = []
-        for f in glob.glob(os.path.join(WEEKLY_DIR, str(y), "*.csv")):
+        for f in glob.glob(os.path.join(weekly_dir, str(y), "*.csv")):
             base = os.path.splitext(os.path.basename(f))[0]
             if base.isdigit():
                 week_files.append((int(base), f))
@@ -93,83 +120,91 @@ def iter_year_weeks():
             continue
         yield y, week_files
 
-def main():
-    os.makedirs(ELO_DIR, exist_ok=True)
-    os.makedirs(os.path.dirname(ELO_JSON), exist_ok=True)
-
-    ratings = {}                 # aktuelle Elo pro Team
-    last_seen_in_prev_season = set()
-    out_rows = []                # für TSV/JSON
-
-    first_season = None
-    for season, week_files in iter_year_weeks():
-        if first_season is None:
-            first_season = season
-
-        # Season-Reset: Regression to mean
-        if season != first_season:
-            for t in list(ratings.keys()):
-                ratings[t] = MEAN_REGRESSION * ratings[t] + (1.0 - MEAN_REGRESSION) * BASE_RATING
-
-        # Erkennen wir Playoffs über Wochenzahl? 
-        # Faustregel: regulär 1–14, alles >14 ist Playoff
+def load_schedule(weekly_dir=WEEKLY_DIR):
+    """Alle Wochen einmal einlesen: [(season, week, games)] – jedes Modell läuft danach auf denselben Daten."""
+    schedule = []
+    for season, week_files in iter_year_weeks(weekly_dir):
         for week, fpath in week_files:
-            is_playoff = week > 14
-            games = read_weekly_csv(fpath)
-
-            # Stelle sicher, dass alle Teams ein Rating haben
-            teams_in_week = set()
-            for o,a,_,_ in games:
-                teams_in_week.add(o)
-                teams_in_week.add(a)
-            for t in teams_in_week:
-                ratings.setdefault(t, BASE_RATING)
-
-            # Elo Updates
-            for o,a,op,ap in games:
-                ra = ratings[o]
-                rb = ratings[a]
-
-                ea = expected_score(ra, rb)
-                eb = 1.0 - ea
-                if op == ap: 
-                    sa, sb = 0.5, 0.5
-                    pdiff = 0.0
-                else:
-                    sa = 1.0 if op > ap else 0.0
-                    sb = 1.0 - sa
-                    pdiff = abs(op - ap)
-
-                k = K_BASE * (PLAYOFF_MULT if is_playoff else 1.0) * margin_multiplier(pdiff)
-                ra_new = ra + k * (sa - ea)
-                rb_new = rb + k * (sb - eb)
-                ratings[o] = ra_new
-                ratings[a] = rb_new
-
-            # Snapshot nach Woche schreiben
-            for t in sorted(teams_in_week):
-                out_rows.append({
-                    "Season": season,
-                    "Week": week,
-                    "Team": t,
-                    "Elo": round(ratings[t], 2),
-                    "IsPlayoff": int(is_playoff)
-                })
+            with tracing.span("parse", "week_csv", season=season, week=week):
+                schedule.append((season, week, read_weekly_csv(fpath)))
+    return schedule
+
+def make_model(name):
+    import ratings   # NumPy erst hier: scrapeSleeperLive importiert nur Formel und Parameter
+    if name == "elo":
+        return ratings.Elo(BASE_RATING, K_BASE, MEAN_REGRESSION, PLAYOFF_MULT, MARGIN_C)
+    if name == "glicko2":
+        return ratings.Glicko2(BASE_RATING, GLICKO_RD, GLICKO_VOL, GLICKO_TAU, MEAN_REGRESSION,
+                               GLICKO_SEASON_RD, GLICKO_MAX_RD)
+    if name == "margin":
+        return ratings.Margin(BASE_RATING, MARGIN_K, MEAN_REGRESSION, PLAYOFF_MULT, MARGIN_ELO_PER_POINT, MARGIN_CAP)
+    raise SystemExit(f"Unbekanntes Rating-Modell: {name} (verfügbar: {', '.join(MODELS)})")
+
+def output_paths(model=None):
+    """(TSV, JSON) je Modell; elo behält die bisherigen Pfade der Website."""
+    model = model or RATING_MODEL
+    if model == "elo":
+        return ELO_TSV, ELO_JSON
+    return (os.path.join(ELO_DIR, f"{model}_ratings_history.tsv"),
+            os.path.join(os.path.dirname(ELO_JSON), f"{model}_history.json"))
+
+@tracing.traced("compute_elo.main")
+def main(model=None):
+    model = model or RATING_MODEL
+    tsv_path, json_path = output_paths(model)
+    engine = make_model(model)
+    os.makedirs(os.path.dirname(tsv_path), exist_ok=True)
+    os.makedirs(os.path.dirname(json_path), exist_ok=True)
+
+    schedule = load_schedule()
+    import ratings
+    with tracing.span("stage", f"ratings.{model}", weeks=len(schedule)):
+        (out_rows, _), = ratings.run(engine, [schedule])
 
     # TSV
-    with open(ELO_TSV, "w", newline="", encoding="utf-8") as f:
+    with tracing.open_write(tsv_path, newline="") as f:
         w = csv.writer(f, delimiter="\t")
         w.writerow(["Season","Week","Team","Elo","IsPlayoff"])
         for r in out_rows:
             w.writerow([r["Season"], r["Week"], r["Team"], f'{r["Elo"]:.2f}', r["IsPlayoff"]])
 
-    # JSON (für Frontend)
-    with open(ELO_JSON, "w", encoding="utf-8") as f:
+    # JSON (für Frontend), als neue Version mit Delta gegenüber der vorherigen
+    rel = os.path.relpath(json_path, "public/data").replace(os.sep, "/")
+    with versions.publishing("compute_elo", [rel]), tracing.open_write(json_path) as f:
         json.dump(out_rows, f, ensure_ascii=False)
 
-    print(f"✅ Elo TSV:   {ELO_TSV}")
-    print(f"✅ Elo JSON:  {ELO_JSON}")
+    print(f"✅ {model} TSV:   {tsv_path}")
+    print(f"✅ {model} JSON:  {json_path}")
     print(f"Teams insgesamt: {len({r['Team'] for r in out_rows})}")
 
+def compare(weekly_dirs=(WEEKLY_DIR,), models=MODELS):
+    """Alle Modelle über alle Ligen: Güte der Vorhersage vor jedem Spiel; jede Liga wird nur einmal eingelesen."""
+    import ratings
+    schedules = [load_schedule(d) for d in weekly_dirs]
+    results = []
+    print(f"{'Liga':<40} {'Modell':<8} {'Spiele':>6} {'LogLoss':>8} {'Brier':>7} {'Treffer':>8}")
+    for model in models:
+        with tracing.span("stage", f"ratings.{model}", leagues=len(schedules)):
+            scores = [sc for _, sc in ratings.run(make_model(model), schedules, history=False)]
+        for d, sc in zip(weekly_dirs, scores):
+            results.append({"league": d, "model": model, **sc})
+            if not sc["games"]:
+                print(f"{d:<40} {model:<8} {0:>6}")
+                continue
+            print(f"{d:<40} {model:<8} {sc['games']:>6} {sc['log_loss']:>8.4f} {sc['brier']:>7.4f} "
+                  f"{sc['accuracy']:>8.1%}")
+    return results
+
+def cli():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--model", choices=MODELS, default=None, help=f"Rating-Modell (Vorgabe: {RATING_MODEL})")
+    ap.add_argument("--compare", nargs="*", metavar="WEEKLY_DIR",
+                    help=f"Modelle vergleichen statt schreiben (Vorgabe: {WEEKLY_DIR})")
+    args = ap.parse_args()
+    if args.compare is not None:
+        compare(args.compare or [WEEKLY_DIR], [args.model] if args.model else MODELS)
+    else:
+        main(args.model)
+
 if __name__ == "__main__":
-    main()
+    cli()
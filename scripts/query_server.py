@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Lokaler, read-only Query-Server über public/data (neben der statischen Seite).
+
+Start:   python scripts/query_server.py [--port 8765] [--max-seasons 16]
+Bench:   python scripts/query_server.py --bench [--clients 16] [--requests 2000]
+
+Endpoints (alle GET, JSON, ETag + gzip):
+  /seasons
+  /season/<year>/matchups?manager=&week=&opponent=
+  /season/<year>/players?manager=&week=&player=<player_id oder Name>&starters=1
+  /season/<year>/standings?week=
+  /h2h?a=<manager>&b=<manager>[&season=]
+  /elo?team=&season=
+  /search?q=antonio br&k=10[&team=TEN][&season=2020]   (Type-ahead über den Suchindex, etl/search_index.py)
+  /player?id=572  bzw.  /player?name=A. Brown[&pos=WR][&team=TEN][&games=1]   (Karriere-Index, etl/careers.py;
+                  Namen löst der Spieler-Index auf, mehrdeutige Treffer stehen in "candidates")
+"""
+import argparse, gzip, hashlib, json, re, sys, threading, time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from urllib.request import Request, urlopen
+
+SEASONS_DIR = Path("public/data/processed/seasons")
+ELO_JSON = Path("public/data/league/elo_history.json")
+H2H_JSON = Path("public/data/processed/h2h.json")   # vorberechnet von etl/parse_weeks.py (etl/h2h.py)
+SEARCH_JSON = Path("public/data/processed/search_index.json")      # etl/search_index.py
+CAREERS_JSON = Path("public/data/processed/player_careers.json")   # + player_games.bin (etl/careers.py)
+PLAYERS_JSON = Path("public/data/processed/players_index.json")    # etl/player_ids.py
+MAX_SEASONS = 16         # LRU: so viele Saisons bleiben gleichzeitig im Speicher
+GZIP_MIN_BYTES = 512     # kleine Antworten lohnen keine Kompression
+
+def _norm(s: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", (s or "").lower())
+
+def _etl_path():
+    """Repo-Root und etl/ importierbar machen (für die vorberechneten Indizes der ETL)."""
+    root = Path(__file__).resolve().parent.parent
+    for d in (str(root), str(root / "etl")):
+        if d not in sys.path:
+            sys.path.insert(0, d)
+
+# ---------------- In-Memory-Strukturen ----------------
+class SeasonData:
+    """Eine Saison, einmal geladen und über Hash-Indizes abfragbar."""
+    def __init__(self, season: int, season_dir: Path):
+        self.season = season
+        load = lambda name: json.loads((season_dir / name).read_text(encoding="utf-8")) \
+            if (season_dir / name).exists() else []
+        self.matchups = load("matchups.json")
+        self.players = load("players_games.json")
+        self.weekly = load("weekly_standings.json")
+        self.teams = load("teams.json")
+
+        self.m_by_team = defaultdict(list)      # manager -> [matchup]
+        self.m_by_week = defaultdict(list)      # week -> [matchup]
+        self.m_by_pair = defaultdict(list)      # frozenset(a, b) -> [matchup]
+        for m in self.matchups:
+            ht, at = m["home_team"], m["away_team"]
+            self.m_by_team[_norm(ht)].append(m)
+            self.m_by_team[_norm(at)].append(m)
+            self.m_by_week[m["week"]].append(m)
+            self.m_by_pair[frozenset((_norm(ht), _norm(at)))].append(m)
+
+        self.p_by_manager = defaultdict(list)
+        self.p_by_week = defaultdict(list)
+        self.p_by_player = defaultdict(list)    # player_id -> [player-game]; Namen löst Store.resolve_player auf
+        for p in self.players:
+            self.p_by_manager[_norm(p["manager"])].append(p)
+            self.p_by_week[p["week"]].append(p)
+            if p.get("player_id") is not None:
+                self.p_by_player[p["player_id"]].append(p)
+
+        self.standings_by_week = {w["week"]: w["rows"] for w in self.weekly}
+
+class Store:
+    """Lädt Saisons lazy und verdrängt die am längsten ungenutzte (LRU)."""
+    def __init__(self, seasons_dir: Path = SEASONS_DIR, elo_json: Path = ELO_JSON, max_seasons: int = MAX_SEASONS,
+                 h2h_json: Path = H2H_JSON, careers_json: Path = CAREERS_JSON, search_json: Path = SEARCH_JSON,
+                 players_json: Path = PLAYERS_JSON):
+        self.seasons_dir = seasons_dir
+        self.elo_json = elo_json
+        self.h2h_json = h2h_json
+        self.careers_json = careers_json
+        self.search_json = search_json
+        self.players_json = players_json
+        self.max_seasons = max_seasons
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading = {}       # season -> Lock, damit parallele Misses nur einmal laden
+        self._elo = None
+        self._h2h = None
+        self._careers = None
+        self._search = None
+        self._players = None
+        self.hits = self.misses = 0
+
+    def available(self):
+        return sorted(int(d.name) for d in self.seasons_dir.glob("*") if d.is_dir() and d.name.isdigit())
+
+    def season(self, season: int) -> SeasonData:
+        with self._lock:
+            sd = self._cache.get(season)
+            if sd is not None:
+                self._cache.move_to_end(season)
+                self.hits += 1
+                return sd
+            load_lock = self._loading.setdefault(season, threading.Lock())
+        with load_lock:
+            with self._lock:
+                sd = self._cache.get(season)
+                if sd is not None:       # ein anderer Thread hat inzwischen geladen
+                    self.hits += 1
+                    return sd
+            d = self.seasons_dir / str(season)
+            if not d.is_dir():
+                raise KeyError(season)
+            sd = SeasonData(season, d)   # außerhalb des globalen Locks parsen
+            with self._lock:
+                self.misses += 1
+                self._cache[season] = sd
+                while len(self._cache) > self.max_seasons:
+                    self._cache.popitem(last=False)
+        return sd
+
+    def elo(self):
+        if self._elo is None:
+            rows = json.loads(self.elo_json.read_text(encoding="utf-8")) if self.elo_json.exists() else []
+            by_team = defaultdict(list)
+            for r in rows:
+                by_team[_norm(r["Team"])].append(r)
+            self._elo = (rows, by_team)
+        return self._elo
+
+    def h2h(self):
+        """H2H-Index (pairs, normalisierter Name -> Manager-Index) oder None, falls nicht vorhanden."""
+        if self._h2h is None:
+            data = json.loads(self.h2h_json.read_text(encoding="utf-8")) if self.h2h_json.exists() else {}
+            self._h2h = (data.get("pairs"), {_norm(m): i for i, m in enumerate(data.get("managers", []))})
+        return self._h2h if self._h2h[0] is not None else None
+
+    def careers(self):
+        """Karriere-Index (etl.careers.CareerStore, Spalten per mmap) oder None, falls nicht vorhanden."""
+        if self._careers is None:
+            if not self.careers_json.exists():
+                return None
+            _etl_path()
+            from careers import CareerStore
+            self._careers = CareerStore(self.careers_json)
+        return self._careers
+
+    def search(self):
+        """Suchindex (etl.search_index.SearchIndex) oder None, falls nicht vorhanden."""
+        if self._search is None:
+            if not self.search_json.exists():
+                return None
+            _etl_path()
+            from search_index import SearchIndex
+            self._search = SearchIndex.load(self.search_json)
+        return self._search
+
+    def players(self):
+        """Spieler-Index (etl.player_ids.PlayerIndex) oder None, falls nicht vorhanden."""
+        if self._players is None:
+            if not self.players_json.exists():
+                return None
+            _etl_path()
+            from player_ids import PlayerIndex
+            self._players = PlayerIndex.load(self.players_json)
+        return self._players
+
+    def resolve_player(self, name, pos=None, team=None, strict=False):
+        """
+        Name (Lang- oder Kurzform) -> passende player_ids, meistgespielte zuerst.
+        Gemeinsame Auflösung für /player und ?player= von /season/<y>/players;
+        strict: bei einem Langnamen mit exakten Treffern nur diese ("Antonio Brown" ohne A.J. Brown).
+        """
+        index = self.players()
+        if index is None:
+            raise LookupError("players_index.json")
+        careers = self.careers()
+        games = lambda pid: (careers.career(pid) or {}).get("games", 0) if careers is not None else 0
+        from player_ids import full_name
+        cands = index.candidates(name, pos, team)
+        # exakter Langname zuerst ("Antonio Brown"); die Kurzform ("A. Brown") meint alle gleich
+        exact = {pid for pid in cands if full_name(name) and _norm(index.players[pid]["name"]) == _norm(name)}
+        if strict and exact:
+            cands = list(exact)
+        return sorted(cands, key=lambda pid: (pid not in exact, -games(pid), pid))
+
+# ---------------- Abfragen ----------------
+def _int(q, name):
+    v = q.get(name, [None])[0]
+    return int(v) if v not in (None, "") else None
+
+def _str(q, name):
+    v = q.get(name, [None])[0]
+    return _norm(v) if v else None
+
+def q_matchups(store, season, q):
+    sd = store.season(season)
+    manager, week, opp = _str(q, "manager"), _int(q, "week"), _str(q, "opponent")
+    if manager and opp:
+        rows = sd.m_by_pair.get(frozenset((manager, opp)), [])
+    elif manager:
+        rows = sd.m_by_team.get(manager, [])
+    elif week is not None:
+        rows = sd.m_by_week.get(week, [])
+    else:
+        rows = sd.matchups
+    if week is not None and (manager or opp):
+        rows = [m for m in rows if m["week"] == week]
+    return rows
+
+def q_players(store, season, q):
+    sd = store.season(season)
+    manager, week, player = _str(q, "manager"), _int(q, "week"), q.get("player", [None])[0]
+    if player:
+        # player_id direkt, sonst Name wie bei /player (Kurzform "A. Brown" -> alle A. Browns der Saison)
+        ids = [int(player)] if player.isdigit() else store.resolve_player(player, strict=True)
+        rows = [p for pid in ids for p in sd.p_by_player.get(pid, ())]
+        if len(ids) > 1:
+            rows.sort(key=lambda p: (p["week"], p["manager"]))
+    elif manager:
+        rows = sd.p_by_manager.get(manager, [])
+    elif week is not None:
+        rows = sd.p_by_week.get(week, [])
+    else:
+        rows = sd.players
+    if week is not None and (player or manager):
+        rows = [p for p in rows if p["week"] == week]
+    if manager and player:
+        rows = [p for p in rows if _norm(p["manager"]) == manager]
+    if q.get("starters", ["0"])[0] in ("1", "true"):
+        rows = [p for p in rows if p["is_starter"]]
+    return rows
+
+def q_standings(store, season, q):
+    sd = store.season(season)
+    week = _int(q, "week")
+    if week is None:
+        return sd.teams
+    return sd.standings_by_week.get(week, [])
+
+def q_h2h(store, q):
+    a, b = _str(q, "a"), _str(q, "b")
+    if not a or not b:
+        raise ValueError("a und b sind Pflicht")
+    only = _int(q, "season")
+    games, summary = [], {"games": 0, "a_wins": 0, "b_wins": 0, "ties": 0, "a_pf": 0.0, "b_pf": 0.0}
+
+    def add(m, ap, bp):
+        summary["games"] += 1
+        summary["a_pf"] += ap; summary["b_pf"] += bp
+        if ap > bp: summary["a_wins"] += 1
+        elif bp > ap: summary["b_wins"] += 1
+        else: summary["ties"] += 1
+        games.append(m)
+
+    index = store.h2h()
+    if index is not None:
+        # Vorberechnete Paarung: nur die betroffenen Matchups per Zeiger laden, kein Scan aller Saisons
+        pairs, by_name = index
+        ia, ib = by_name.get(a), by_name.get(b)
+        pair = pairs.get(f"{min(ia, ib)}|{max(ia, ib)}") if None not in (ia, ib) and ia != ib else None
+        for season, _, i, _, lo_pts, hi_pts in (pair or {}).get("games", []):
+            if only and season != only:
+                continue
+            add(store.season(season).matchups[i], *((lo_pts, hi_pts) if ia < ib else (hi_pts, lo_pts)))
+    else:
+        for season in ([only] if only else store.available()):
+            for m in store.season(season).m_by_pair.get(frozenset((a, b)), []):
+                a_home = _norm(m["home_team"]) == a
+                add(m, (m["home_points"] if a_home else m["away_points"]) or 0.0,
+                    (m["away_points"] if a_home else m["home_points"]) or 0.0)
+    summary["a_pf"] = round(summary["a_pf"], 2); summary["b_pf"] = round(summary["b_pf"], 2)
+    return {"summary": summary, "games": games}
+
+def q_elo(store, q):
+    rows, by_team = store.elo()
+    team, season = _str(q, "team"), _int(q, "season")
+    out = by_team.get(team, []) if team else rows
+    if season is not None:
+        out = [r for r in out if r["Season"] == season]
+    return out
+
+def q_player(store, q):
+    careers = store.careers()
+    if careers is None:
+        raise LookupError("player_careers.json")
+    pid, others = _int(q, "id"), []
+    if pid is None:
+        name = q.get("name", [None])[0]
+        if not name:
+            raise ValueError("id oder name (+pos, team) ist Pflicht")
+        pos, team = ((q.get(k, [""])[0] or "").upper() or None for k in ("pos", "team"))
+        cands = store.resolve_player(name, pos, team)
+        if not cands:
+            raise KeyError(name)
+        pid, others = cands[0], cands[1:]
+    career = careers.career(pid)
+    if career is None:
+        raise KeyError(pid)
+    career["rostered_by"] = [{"manager": careers.managers[m], "games": g, "starts": s, "points": pts}
+                             for m, g, s, pts in career["rostered_by"]]
+    season, week, pts, m = career["best"]
+    career["best"] = {"season": season, "week": week, "points": pts, "manager": careers.managers[m]}
+    if _int(q, "games"):
+        career["games_list"] = careers.games(pid)
+    if others:
+        career["candidates"] = [dict(zip(("id", "name", "pos"), (c["id"], c["name"], c["pos"])))
+                                for c in (careers.career(o) for o in others) if c]
+    return career
+
+def q_search(store, q):
+    index = store.search()
+    if index is None:
+        raise LookupError("search_index.json")
+    return index.lookup(q.get("q", [""])[0], _int(q, "k") or 10,
+                        team=q.get("team", [None])[0] or None, season=_int(q, "season"))
+
+_SEASON_RE = re.compile(r"^/season/(\d{4})/(matchups|players|standings)$")
+
+def dispatch(store, path, q):
+    if path == "/seasons":
+        return store.available()
+    if path == "/h2h":
+        return q_h2h(store, q)
+    if path == "/elo":
+        return q_elo(store, q)
+    if path == "/search":
+        return q_search(store, q)
+    if path == "/player":
+        return q_player(store, q)
+    m = _SEASON_RE.match(path)
+    if m:
+        season, what = int(m.group(1)), m.group(2)
+        return {"matchups": q_matchups, "players": q_players, "standings": q_standings}[what](store, season, q)
+    raise LookupError(path)
+
+# ---------------- HTTP ----------------
+def make_handler(store):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):  # kein Log pro Request
+            pass
+
+        def _send(self, status, body: bytes, etag=None):
+            gz = len(body) >= GZIP_MIN_BYTES and "gzip" in (self.headers.get("Accept-Encoding") or "")
+            if gz:
+                body = gzip.compress(body, compresslevel=5)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            if etag:
+                self.send_header("ETag", etag)
+            if gz:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            u = urlparse(self.path)
+            try:
+                data = dispatch(store, u.path.rstrip("/") or "/", parse_qs(u.query))
+            except (KeyError, LookupError):
+                return self._send(404, b'{"error":"not found"}')
+            except ValueError as e:
+                return self._send(400, json.dumps({"error": str(e)}).encode("utf-8"))
+            body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self._send(200, body, etag)
+    return Handler
+
+def serve(host, port, store):
+    httpd = ThreadingHTTPServer((host, port), make_handler(store))
+    httpd.daemon_threads = True
+    return httpd
+
+# ---------------- Benchmark ----------------
+def bench(store, clients=16, n_requests=2000):
+    """Startet den Server auf einem freien Port und misst Requests/s unter parallelen Clients."""
+    httpd = serve("127.0.0.1", 0, store)
+    port = httpd.server_address[1]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    seasons = store.available()
+    if not seasons:
+        raise SystemExit(f"Keine Saisons unter {store.seasons_dir}")
+    managers = sorted({t["team"] for t in store.season(seasons[-1]).teams}) or ["Benni"]
+    paths = []
+    for i in range(n_requests):
+        s = seasons[i % len(seasons)]
+        m = managers[i % len(managers)]
+        o = managers[(i + 1) % len(managers)]
+        paths.append([f"/season/{s}/players?manager={m}&week={1 + i % 14}",
+                      f"/season/{s}/matchups?week={1 + i % 14}",
+                      f"/h2h?a={m}&b={o}",
+                      f"/elo?team={m}&season={s}"][i % 4])
+
+    def fetch(p):
+        req = Request(f"http://127.0.0.1:{port}{p}", headers={"Accept-Encoding": "gzip"})
+        t0 = time.perf_counter()
+        with urlopen(req) as r:
+            r.read()
+        return time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as ex:
+        lat = sorted(ex.map(fetch, paths))
+    wall = time.perf_counter() - t0
+    httpd.shutdown()
+    pct = lambda p: lat[min(len(lat) - 1, int(p * len(lat)))] * 1000
+    print(f"{len(lat)} Requests, {clients} Clients: {len(lat)/wall:,.0f} req/s | "
+          f"p50 {pct(0.50):.1f} ms, p95 {pct(0.95):.1f} ms, p99 {pct(0.99):.1f} ms | "
+          f"LRU hits={store.hits} misses={store.misses}")
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--max-seasons", type=int, default=MAX_SEASONS)
+    ap.add_argument("--bench", action="store_true", help="Durchsatz unter parallelen Clients messen und beenden")
+    ap.add_argument("--clients", type=int, default=16)
+    ap.add_argument("--requests", type=int, default=2000)
+    args = ap.parse_args()
+
+    store = Store(max_seasons=args.max_seasons)
+    if args.bench:
+        bench(store, args.clients, args.requests)
+        return
+    httpd = serve(args.host, args.port, store)
+    print(f"✓ Query-Server auf http://{args.host}:{args.port} (max {args.max_seasons} Saisons im Speicher)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
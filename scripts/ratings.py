@@ -0,0 +1,261 @@
+# ratings.py
+# Rating-Modelle für compute_elo.py mit gemeinsamer Schnittstelle. Ratings liegen je Team-Index in
+# NumPy-Arrays; die Spiele einer Woche werden als ein Batch angewendet (Index-Arrays a/b + Punkte).
+# Innerhalb einer Woche spielt jedes Team höchstens einmal, daher ist der Batch identisch zur
+# sequentiellen Schleife; doppelte Teams (kaputte Daten) werden aufsummiert statt überschrieben.
+# Mehrere Ligen laufen gemeinsam (run): Schritt i nimmt die i-te Woche jeder Liga in denselben Batch –
+# Teams sind je Liga getrennt indiziert, Saisonwechsel und Playoffs gelten je Liga.
+#   Elo      klassisch mit Margin-of-Victory-Faktor und Playoff-Multiplikator (die bisherige compute_elo-Formel)
+#   Glicko2  Rating + Rating Deviation + Volatilität (Glickman), eine Woche = eine Rating-Periode
+#   Margin   Rating als erwarteter Punkteabstand: Update proportional zur Abweichung vom erwarteten Margin
+# Alle Modelle geben Ratings auf der Elo-Skala (1500 = Durchschnitt) aus, so bleibt die Historie gleich.
+import math
+
+import numpy as np
+
+GLICKO_SCALE = 400.0 / math.log(10)   # 173.7178: Elo-Skala <-> Glicko-2-Skala
+PLAYOFF_WEEK = 14                     # Faustregel: regulär 1–14, alles danach Playoffs
+
+def _clamp(x, lo, hi):
+    return np.minimum(np.maximum(x, lo), hi)   # bei wenigen Spielen deutlich billiger als np.clip
+
+class RatingModel:
+    """
+    Schnittstelle:
+      grow(n)            neue Teams anlegen (Startwerte)
+      new_season(teams)  Regression vor jeder weiteren Saison, nur für diese Team-Indizes
+      expected(a, b)     P(a gewinnt) je Spiel
+      update(a, b, pa, pb, playoff, active)
+                         eine Woche anwenden (playoff je Spiel, active = Teams der beteiligten Ligen);
+                         Rückgabe: Erwartung vor dem Update (für den Modellvergleich)
+      values()           Ratings auf der Elo-Skala
+    """
+    name = ""
+
+    def __init__(self, base, regression):
+        self.base, self.regression = base, regression
+        self.r = np.empty(0)
+
+    def grow(self, n):
+        if n > len(self.r):
+            self.r = np.concatenate([self.r, np.full(n - len(self.r), self.base)])
+
+    def new_season(self, teams):
+        self.r[teams] = self.regression * self.r[teams] + (1.0 - self.regression) * self.base
+
+    def expected(self, a, b):
+        return 1.0 / (1.0 + np.power(10.0, -(self.r[a] - self.r[b]) / 400.0))
+
+    def update(self, a, b, pa, pb, playoff, active):
+        raise NotImplementedError
+
+    def values(self):
+        return self.r
+
+    @staticmethod
+    def outcome(pa, pb):
+        """1 Sieg, 0.5 Unentschieden, 0 Niederlage (aus Sicht von a)."""
+        return (np.sign(pa - pb) + 1.0) * 0.5
+
+    def _apply(self, a, b, da, db):
+        """Deltas je Spiel auf die Teams verteilen (bincount statt Zuweisung: mehrfach vorkommende Teams summieren)."""
+        n = len(self.r)
+        self.r = self.r + (np.bincount(a, da, n) + np.bincount(b, db, n))
+
+class Elo(RatingModel):
+    name = "elo"
+
+    def __init__(self, base, k, regression, playoff_mult, margin_c):
+        super().__init__(base, regression)
+        self.k, self.playoff_mult, self.margin_c = k, playoff_mult, margin_c
+
+    def update(self, a, b, pa, pb, playoff, active):
+        ea = self.expected(a, b)
+        sa = self.outcome(pa, pb)
+        mult = _clamp(np.log(1 + np.abs(pa - pb) / self.margin_c + 1e-9) / math.log(2), 0.5, 2.0)
+        k = self.k * np.where(playoff, self.playoff_mult, 1.0) * mult
+        self._apply(a, b, k * (sa - ea), k * ((1.0 - sa) - (1.0 - ea)))
+        return ea
+
+class Margin(RatingModel):
+    """
+    Rating-Differenz / elo_per_point = erwarteter Punkteabstand; je Punkt Abweichung davon wandert
+    das Rating um k (Ergebnisse über cap Punkte werden gekappt).
+    """
+    name = "margin"
+
+    def __init__(self, base, k, regression, playoff_mult, elo_per_point, cap):
+        super().__init__(base, regression)
+        self.k, self.playoff_mult = k, playoff_mult
+        self.elo_per_point, self.cap = elo_per_point, cap
+
+    def update(self, a, b, pa, pb, playoff, active):
+        ea = self.expected(a, b)
+        predicted = (self.r[a] - self.r[b]) / self.elo_per_point
+        surprise = _clamp(pa - pb, -self.cap, self.cap) - predicted
+        d = self.k * np.where(playoff, self.playoff_mult, 1.0) * surprise
+        self._apply(a, b, d, -d)
+        return ea
+
+class Glicko2(RatingModel):
+    """
+    Glicko-2 (Glickman 2012); Teams einer beteiligten Liga ohne Spiel in der Woche werden nur unsicherer
+    (phi wächst). Playoff-Spiele zählen wie alle anderen – die Gewichtung steckt hier in der Unsicherheit.
+    """
+    name = "glicko2"
+    EPS = 1e-6
+
+    def __init__(self, base, rd, vol, tau, regression, season_rd, max_rd):
+        super().__init__(base, regression)
+        self.phi0, self.vol0, self.tau = rd / GLICKO_SCALE, vol, tau
+        self.season_phi, self.max_phi = season_rd / GLICKO_SCALE, max_rd / GLICKO_SCALE
+        self.mu, self.phi, self.sigma = np.empty(0), np.empty(0), np.empty(0)
+
+    def grow(self, n):
+        extra = n - len(self.mu)
+        if extra > 0:
+            self.mu = np.concatenate([self.mu, np.full(extra, (self.base - 1500.0) / GLICKO_SCALE)])
+            self.phi = np.concatenate([self.phi, np.full(extra, self.phi0)])
+            self.sigma = np.concatenate([self.sigma, np.full(extra, self.vol0)])
+
+    def new_season(self, teams):
+        self.mu[teams] = self.regression * self.mu[teams]
+        self.phi[teams] = np.minimum(np.sqrt(self.phi[teams] ** 2 + self.season_phi ** 2), self.max_phi)
+
+    @staticmethod
+    def _g(phi):
+        return 1.0 / np.sqrt(1.0 + 3.0 * phi ** 2 / math.pi ** 2)
+
+    def expected(self, a, b):
+        g = self._g(np.sqrt(self.phi[a] ** 2 + self.phi[b] ** 2))
+        return 1.0 / (1.0 + np.exp(-g * (self.mu[a] - self.mu[b])))
+
+    def _volatility(self, phi, sigma, v, delta):
+        """Neue Volatilität je Team: Illinois-Verfahren aus dem Paper, vektorisiert über Masken."""
+        tau2 = self.tau ** 2
+        a = np.log(sigma ** 2)
+        def f(x):
+            ex = np.exp(x)
+            return ex * (delta ** 2 - phi ** 2 - v - ex) / (2.0 * (phi ** 2 + v + ex) ** 2) - (x - a) / tau2
+        big = delta ** 2 > phi ** 2 + v
+        B = np.where(big, np.log(np.where(big, delta ** 2 - phi ** 2 - v, 1.0)), a - self.tau)
+        todo = ~big & (f(B) < 0)
+        while todo.any():
+            B = np.where(todo, B - self.tau, B)
+            todo &= f(B) < 0
+        A = a
+        fa, fb = f(A), f(B)
+        for _ in range(100):   # konvergierte Einträge bleiben stehen (Division durch 0 dort egal)
+            open_ = np.abs(B - A) > self.EPS
+            if not open_.any():
+                break
+            with np.errstate(divide="ignore", invalid="ignore"):
+                C = A + (A - B) * fa / (fb - fa)
+                fc = f(C)
+            swap = fc * fb <= 0
+            A = np.where(open_, np.where(swap, B, A), A)
+            fa = np.where(open_, np.where(swap, fb, fa / 2.0), fa)
+            B = np.where(open_, C, B)
+            fb = np.where(open_, fc, fb)
+        return np.exp(A / 2.0)
+
+    def update(self, a, b, pa, pb, playoff, active):
+        n = len(self.mu)
+        ea = self.expected(a, b)
+        sa = self.outcome(pa, pb)
+        me, opp = np.concatenate([a, b]), np.concatenate([b, a])
+        score = np.concatenate([sa, 1.0 - sa])
+        g = self._g(self.phi[opp])
+        e = 1.0 / (1.0 + np.exp(-g * (self.mu[me] - self.mu[opp])))
+        played = np.bincount(me, minlength=n) > 0
+        info = np.bincount(me, g ** 2 * e * (1.0 - e), n)
+        gain = np.bincount(me, g * (score - e), n)
+
+        mu, phi, sigma = self.mu[played], self.phi[played], self.sigma[played]
+        v = 1.0 / info[played]
+        sigma_new = self._volatility(phi, sigma, v, v * gain[played])
+        phi_star = np.sqrt(phi ** 2 + sigma_new ** 2)
+        phi_new = 1.0 / np.sqrt(1.0 / phi_star ** 2 + 1.0 / v)
+
+        self.phi[active] = np.sqrt(self.phi[active] ** 2 + self.sigma[active] ** 2)   # Teams ohne Spiel
+        self.mu[played] = mu + phi_new ** 2 * gain[played]
+        self.phi[played] = phi_new
+        self.sigma[played] = sigma_new
+        return ea
+
+    def values(self):
+        return 1500.0 + GLICKO_SCALE * self.mu
+
+def run(model, schedules, history=True):
+    """
+    schedules: je Liga [(season, week, games)] mit games = [(team, gegner, punkte, gegnerpunkte)].
+    Rückgabe je Liga: (Zeilen Season/Week/Team/Elo/IsPlayoff wie elo_history.json – leer bei
+    history=False –, Kennzahlen der Vorhersagen vor jedem Spiel).
+    """
+    index = {}                                  # (liga, team) -> Index in den Arrays des Modells
+    members = [[] for _ in schedules]           # Team-Indizes je Liga (für die Saison-Regression)
+    prev_season = [None] * len(schedules)
+    rows = [[] for _ in schedules]
+    probs = [[] for _ in schedules]
+    points = [[] for _ in schedules]
+    for step in range(max((len(s) for s in schedules), default=0)):
+        regress, weeks = [], []
+        for li, schedule in enumerate(schedules):
+            if step >= len(schedule):
+                continue
+            season, week, games = schedule[step]
+            if prev_season[li] is not None and season != prev_season[li]:
+                regress.extend(members[li])   # Saisonstart: Regression zur Mitte
+            prev_season[li] = season
+            if not games:
+                continue
+            teams = sorted({t for g in games for t in g[:2]})
+            for t in teams:
+                if (li, t) not in index:
+                    index[li, t] = len(index)
+                    members[li].append(index[li, t])
+            weeks.append((li, season, week, games, teams))
+        if regress:
+            model.new_season(np.array(regress))
+        if not weeks:
+            continue
+
+        ia, ib, pa, pb, playoff, active = [], [], [], [], [], []
+        for li, _, week, games, _ in weeks:
+            home, away, home_pts, away_pts = zip(*games)
+            ia += [index[li, t] for t in home]
+            ib += [index[li, t] for t in away]
+            pa += home_pts; pb += away_pts
+            playoff += [week > PLAYOFF_WEEK] * len(games)
+            active += members[li]
+        model.grow(len(index))
+        pa, pb = np.array(pa, dtype=float), np.array(pb, dtype=float)
+        ea = model.update(np.array(ia), np.array(ib), pa, pb, np.array(playoff), np.array(active))
+
+        lo = 0
+        for li, _, _, games, _ in weeks:
+            hi = lo + len(games)
+            probs[li].append(ea[lo:hi])
+            points[li].append((pa[lo:hi], pb[lo:hi]))
+            lo = hi
+        if history:
+            # Snapshot nach der Woche: ein Gather für alle Ligen, gerundet wie bisher (Python-round auf floats)
+            order = [index[li, t] for li, _, _, _, teams in weeks for t in teams]
+            values = iter(model.values()[order].tolist())
+            for li, season, week, _, teams in weeks:
+                is_playoff = int(week > PLAYOFF_WEEK)
+                rows[li].extend({"Season": season, "Week": week, "Team": t, "Elo": round(v, 2),
+                                 "IsPlayoff": is_playoff} for t, v in zip(teams, values))
+    return [(rows[li], _scores(probs[li], points[li])) for li in range(len(schedules))]
+
+def _scores(probs, points):
+    """Güte der Vorhersagen vor jedem Spiel: Log-Loss, Brier-Score, Trefferquote (ohne Unentschieden)."""
+    if not probs:
+        return {"games": 0, "log_loss": None, "brier": None, "accuracy": None}
+    p = np.clip(np.concatenate(probs), 1e-12, 1 - 1e-12)
+    s = RatingModel.outcome(np.concatenate([a for a, _ in points]), np.concatenate([b for _, b in points]))
+    decided = s != 0.5
+    return {"games": int(len(p)),
+            "log_loss": float(-np.mean(s * np.log(p) + (1 - s) * np.log(1 - p))),
+            "brier": float(np.mean((p - s) ** 2)),
+            "accuracy": float(np.mean((p[decided] > 0.5) == (s[decided] == 1.0))) if decided.any() else None}
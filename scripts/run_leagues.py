@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Multi-Liga-Runner: scrape -> ETL -> Elo -> Aggregate für viele Ligen parallel.
+
+  python scripts/run_leagues.py leagues.json [--root leagues] [--jobs 4] [--skip-scrape] [--only etl,elo]
+
+leagues.json:
+  {"leagues": [
+     {"name": "nfl-main", "platform": "nfl", "league_id": "3082897", "start": 2015, "end": 2025},
+     {"name": "sleeper-main", "platform": "sleeper", "league_ids": ["1180...", "1049..."]}
+  ]}
+
+Jede Liga bekommt ein eigenes Arbeitsverzeichnis <root>/<name>/ (output/, data/, public/ liegen darin),
+d. h. alle Ausgaben sind pro Liga getrennt. Die Stufen laufen je Liga nacheinander als Subprozess;
+über alle Ligen hinweg laufen höchstens --jobs Subprozesse gleichzeitig (globales Budget).
+Die Sleeper-Spielerdatenbank wird einmal in <root>/_shared/ geladen und von allen Ligen geteilt.
+Mit TRACE=1 schreibt jede Stufe ihren Trace nach <root>/<name>/traces/, der Runner selbst nach traces/.
+"""
+import argparse, json, os, subprocess, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.request import urlopen
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+import tracing  # noqa: E402
+from sleeper_api import BASE, PLAYERS_FILE, PLAYERS_TTL  # noqa: E402  BASE: SLEEPER_API_BASE, z. B. lokaler Stub
+
+STAGES = ("scrape", "etl", "elo", "aggregate")
+
+def league_stages(lg):
+    """Liste von (stage, label, script, env) für eine Liga."""
+    out = []
+    if lg["platform"] == "nfl":
+        env = {"NFL_LEAGUE_ID": str(lg["league_id"]),
+               "LEAGUE_START_YEAR": str(lg.get("start", 2015)), "LEAGUE_END_YEAR": str(lg.get("end", 2025))}
+        out += [("scrape", "nfl-standings", "scrapeStandings.py", env),
+                ("scrape", "nfl-gamecenter", "scrapeGamecenter.py", env)]
+        # scrapeStandings/scrapeGamecenter schreiben je NFL.com-Liga nach output/<id>-history-*/ (utils.setup_output_folders)
+        standings_dir = lg.get("standings_dir", f"output/{lg['league_id']}-history-standings")
+        gamecenter_dir = f"output/{lg['league_id']}-history-teamgamecenter"
+    elif lg["platform"] == "sleeper":
+        ids = lg.get("league_ids") or [lg["league_id"]]
+        for lid in ids:
+            env = {"SLEEPER_LEAGUE_ID": str(lid)}
+            out += [("scrape", f"sleeper-gamecenter-{lid}", "scrapeSleeperGamecenter.py", env),
+                    ("scrape", f"sleeper-standings-{lid}", "scrapeSleeperStandings.py", env),
+                    ("scrape", f"sleeper-draft-{lid}", "scrapeSleeperDraft.py", env)]
+        # scrapeSleeperStandings schreibt output/<season>/standings_*.tsv, scrapeSleeperGamecenter output/teamgamecenter/
+        standings_dir = lg.get("standings_dir", "output")
+        gamecenter_dir = "output/teamgamecenter"
+    else:
+        raise ValueError(f"Unbekannte Plattform: {lg['platform']}")
+    dirs = {"GAMECENTER_DIR": gamecenter_dir, "STANDINGS_DIR": standings_dir}
+    out += [("etl", "parse_weeks", "etl/parse_weeks.py", dirs),
+            ("etl", "draft_value", "etl/draft_value.py", {}),
+            ("etl", "build_json", "etl/build_json.py", {}),
+            ("elo", "compute_elo", "scripts/compute_elo.py", dirs),
+            ("aggregate", "aggregate_standings", "scripts/aggregate_standings.py", dirs),
+            ("aggregate", "aggregate_playoffs", "scripts/aggregate_playoffs.py", dirs)]
+    return out
+
+def has_standings(d: Path):
+    """Regular-Season-TSVs im NFL.com- (YYYY.tsv) oder Sleeper-Layout (YYYY/standings_regular_1_14.tsv)?"""
+    return any(d.glob("[0-9][0-9][0-9][0-9].tsv")) or any(d.glob("[0-9][0-9][0-9][0-9]/standings_regular_1_14.tsv"))
+
+def warm_players_cache(shared: Path):
+    """Lädt /players/nfl einmal für alle Sleeper-Ligen (statt einmal pro Liga und Skript)."""
+    cache = shared / PLAYERS_FILE.name
+    if cache.exists() and time.time() - cache.stat().st_mtime < PLAYERS_TTL:
+        return
+    shared.mkdir(parents=True, exist_ok=True)
+    with urlopen(f"{BASE}/players/nfl", timeout=120) as r:
+        body = r.read()
+    tmp = cache.with_suffix(".tmp")
+    tmp.write_bytes(body)
+    tmp.replace(cache)
+
+class Budget:
+    """Globales Limit gleichzeitiger Subprozesse über alle Ligen."""
+    def __init__(self, n):
+        self.sem = threading.Semaphore(max(1, n))
+
+    def run(self, cmd, cwd, env, log_path):
+        with self.sem:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            t0 = time.perf_counter()
+            with tracing.span("subprocess", log_path.stem, cwd=str(cwd)) as s, \
+                    log_path.open("w", encoding="utf-8") as log:
+                rc = subprocess.call(cmd, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT)
+                s.set(rc=rc)
+            return rc, time.perf_counter() - t0
+
+def run_league(lg, root: Path, shared: Path, budget: Budget, only):
+    wd = root / lg["name"]
+    wd.mkdir(parents=True, exist_ok=True)
+    results = []
+    for stage, label, script, extra in league_stages(lg):
+        if stage not in only:
+            continue
+        if stage == "aggregate" and not has_standings(wd / extra["STANDINGS_DIR"]):
+            results.append((label, None, 0.0))   # keine Standings-TSVs -> nichts zu aggregieren
+            continue
+        env = dict(os.environ, SLEEPER_CACHE_DIR=str(shared.resolve()), PYTHONUNBUFFERED="1", **extra)
+        if tracing.TRACE:
+            env["TRACE"] = "traces"   # Trace je Stufe nach <root>/<name>/traces/
+        rc, secs = budget.run([sys.executable, str(REPO / script)], wd, env, wd / "logs" / f"{label}.log")
+        results.append((label, rc, secs))
+        if rc != 0 and stage in ("scrape", "etl"):
+            break   # nachfolgende Stufen hätten keine (aktuellen) Eingaben
+    return lg["name"], results
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("config", type=Path)
+    ap.add_argument("--root", type=Path, default=Path("leagues"))
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 4, help="globales Budget paralleler Subprozesse")
+    ap.add_argument("--skip-scrape", action="store_true")
+    ap.add_argument("--only", default=",".join(STAGES), help=f"Kommaliste aus {', '.join(STAGES)}")
+    args = ap.parse_args()
+
+    leagues = json.loads(args.config.read_text(encoding="utf-8"))["leagues"]
+    names = [lg["name"] for lg in leagues]
+    if len(set(names)) != len(names):
+        raise SystemExit("Liga-Namen müssen eindeutig sein (sie bilden die Ausgabe-Namespaces).")
+    only = {s.strip() for s in args.only.split(",") if s.strip()}
+    if args.skip_scrape:
+        only.discard("scrape")
+
+    shared = args.root / "_shared"
+    if "scrape" in only and any(lg["platform"] == "sleeper" for lg in leagues):
+        warm_players_cache(shared)
+
+    budget = Budget(args.jobs)
+    t0 = time.perf_counter()
+    failed = 0
+    with ThreadPoolExecutor(max_workers=len(leagues) or 1) as ex:
+        futures = [ex.submit(run_league, lg, args.root, shared, budget, only) for lg in leagues]
+        for fut in futures:
+            name, results = fut.result()
+            for label, rc, secs in results:
+                mark = "–" if rc is None else ("✓" if rc == 0 else "✗")
+                failed += bool(rc)
+                print(f"{mark} {name:<20} {label:<34} {secs:7.2f}s" + ("" if rc in (0, None) else f"  (rc={rc}, siehe logs/{label}.log)"))
+    print(f"Fertig: {len(leagues)} Ligen in {time.perf_counter() - t0:.1f}s, {failed} Fehler")
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,84 @@
 # sleeper_api.py
+import json, os, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import requests
 
-BASE = "https://api.sleeper.app/v1"
+import tracing
 
-def get_league(league_id):           return requests.get(f"{BASE}/league/{league_id}").json()
-def get_league_users(league_id):     return requests.get(f"{BASE}/league/{league_id}/users").json()
-def get_league_rosters(league_id):   return requests.get(f"{BASE}/league/{league_id}/rosters").json()
-def get_matchups(league_id, week):   return requests.get(f"{BASE}/league/{league_id}/matchups/{week}").json()
-def get_winners_bracket(league_id):  return requests.get(f"{BASE}/league/{league_id}/winners_bracket").json()
-def get_losers_bracket(league_id):   return requests.get(f"{BASE}/league/{league_id}/losers_bracket").json()
-def get_user_leagues(user_id, season): return requests.get(f"{BASE}/user/{user_id}/leagues/nfl/{season}").json()
+BASE = os.getenv("SLEEPER_API_BASE", "https://api.sleeper.app/v1").rstrip("/")  # z. B. lokaler Stub (bench/sleeper_stub.py)
+RETRIES = 5
+PLAYERS_TTL = 7*24*3600   # Spieler-DB höchstens wöchentlich neu laden
+DATA_DIR = Path(os.getenv("SLEEPER_CACHE_DIR", "data"))   # Spieler-DB-Cache, ligaübergreifend teilbar
+PLAYERS_FILE = DATA_DIR / "sleeper_players.json"
+
+# Antwort-Cache je Prozess: URL -> JSON. Ein Lauf holt jede URL höchstens einmal.
+_CACHE = {}
+_LOCK = threading.Lock()
+_SESSION = threading.local()
+_PLAYERS = {}   # data_dir -> geparste Spieler-DB (einmal pro Prozess)
+
+def _session():
+    s = getattr(_SESSION, "s", None)
+    if s is None:
+        s = _SESSION.s = requests.Session()   # Keep-Alive je Thread
+    return s
+
+def fetch_json(url, cache=True):
+    """GET mit Retry bei 429 (Retry-After) und 5xx; cache=False für Live-Abfragen."""
+    with tracing.http_span(url) as sp:
+        if cache:
+            with _LOCK:
+                if url in _CACHE:
+                    sp.set(cache=True)
+                    return _CACHE[url]
+        for attempt in range(RETRIES):
+            r = _session().get(url, timeout=30)
+            sp.set(status=r.status_code, bytes=len(r.content), attempts=attempt + 1)
+            if r.status_code == 429 or r.status_code >= 500:
+                if attempt + 1 < RETRIES:
+                    wait = r.headers.get("Retry-After")
+                    time.sleep(float(wait) if wait and wait.isdigit() else 0.5 * 2 ** attempt)
+                    continue
+            r.raise_for_status()
+            data = r.json()
+            if cache:
+                with _LOCK:
+                    _CACHE[url] = data
+            return data
+
+def prefetch(urls, workers=16):
+    """Holt alle URLs parallel in den Cache; Rückgabe: {url: json}."""
+    urls = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls) or 1))) as ex:
+        return dict(zip(urls, ex.map(fetch_json, urls)))
+
+def get_players_cached(data_dir=DATA_DIR):
+    """Sleeper-Spieler-DB: Datei-Cache (TTL 7 Tage) + einmal pro Prozess geparst, von allen Skripten geteilt."""
+    data_dir = Path(data_dir)
+    key = str(data_dir.resolve())
+    with _LOCK:
+        if key in _PLAYERS:
+            return _PLAYERS[key]
+    data_dir.mkdir(parents=True, exist_ok=True)
+    cache = data_dir / PLAYERS_FILE.name
+    if cache.exists() and time.time() - cache.stat().st_mtime < PLAYERS_TTL:
+        with tracing.span("parse", "sleeper_players.json", path=str(cache)):
+            players = json.loads(cache.read_text(encoding="utf-8"))
+    else:
+        players = fetch_json(f"{BASE}/players/nfl", cache=False)  # groß – nur hier halten
+        tracing.write_text(cache, json.dumps(players), touch=True)   # mtime = Abrufzeit (TTL)
+    with _LOCK:
+        _PLAYERS[key] = players
+    return players
+
+def get_league(league_id):           return fetch_json(f"{BASE}/league/{league_id}")
+def get_league_users(league_id):     return fetch_json(f"{BASE}/league/{league_id}/users")
+def get_league_rosters(league_id):   return fetch_json(f"{BASE}/league/{league_id}/rosters")
+def get_matchups(league_id, week):   return fetch_json(f"{BASE}/league/{league_id}/matchups/{week}")
+def get_transactions(league_id, week): return fetch_json(f"{BASE}/league/{league_id}/transactions/{week}")
+def get_drafts(league_id):           return fetch_json(f"{BASE}/league/{league_id}/drafts")
+def get_draft_picks(draft_id):       return fetch_json(f"{BASE}/draft/{draft_id}/picks")
+def get_winners_bracket(league_id):  return fetch_json(f"{BASE}/league/{league_id}/winners_bracket")
+def get_losers_bracket(league_id):   return fetch_json(f"{BASE}/league/{league_id}/losers_bracket")
+def get_user_leagues(user_id, season): return fetch_json(f"{BASE}/user/{user_id}/leagues/nfl/{season}")
@@ -0,0 +1,300 @@
+# tracing.py
+# Spans & Metriken für Scraper, ETL und scripts/ – opt-in über die Umgebung:
+#   TRACE=1                  -> traces/<skript>-<zeit>-<pid>.json (Chrome-Trace-Format) + Summary-Tabelle
+#   TRACE=traces/etl/        -> Verzeichnis;  TRACE=run.json -> genau diese Datei
+#   PROFILE=build_season,..  -> passende Stages zusätzlich profilieren ("all" = alle, Skriptname = ganzer Lauf)
+#   PROFILE_MODE=cprofile    -> <trace>.<stage>.<n>.prof (+ .txt Top-Liste)
+#   PROFILE_MODE=sample      -> eingebauter Sampling-Profiler, <trace>.<stage>.<n>.folded (+ .txt); PROFILE_INTERVAL_MS=5
+# Trace in ui.perfetto.dev / chrome://tracing öffnen; .prof mit snakeviz/pstats, .folded mit speedscope/flamegraph.pl.
+# Ohne TRACE/PROFILE sind alle Aufrufe No-ops (kein Overhead in den Hot Loops).
+import atexit, cProfile, io, json, os, pstats, re, sys, threading, time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import outputs
+
+TRACE = os.getenv("TRACE", "").strip()
+PROFILE = {s.strip() for s in os.getenv("PROFILE", "").split(",") if s.strip()}
+PROFILE_MODE = os.getenv("PROFILE_MODE", "cprofile").strip().lower()
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000.0
+ENABLED = bool(TRACE or PROFILE)
+
+PROG = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] not in ("", "-c") else "python"
+CAT_ORDER = ("run", "subprocess", "stage", "http", "parse", "write")
+
+_T0 = time.perf_counter()
+_EVENTS = []                 # Chrome "X"-Events (list.append ist threadsicher)
+_THREADS = {}                # tid -> Threadname
+_PROFILE_LOCK = threading.Lock()
+_PROFILE_ACTIVE = False      # cProfile/Sampler nicht verschachteln
+_PROFILE_SEQ = Counter()
+_OUTPUTS = []                # geschriebene Profil-Dateien
+
+# -------------------------- Spans -------------------------- #
+class Span:
+    __slots__ = ("args",)
+    def __init__(self, args):
+        self.args = args
+    def set(self, **kw):
+        self.args.update(kw)
+
+class _NullSpan:
+    __slots__ = ()
+    def set(self, **kw):
+        pass
+
+_NULL = _NullSpan()
+
+def _record(cat, name, t0, t1, args):
+    t = threading.current_thread()
+    _THREADS.setdefault(t.ident, t.name)
+    _EVENTS.append({"name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": t.ident,
+                    "ts": round((t0 - _T0) * 1e6, 1), "dur": round((t1 - t0) * 1e6, 1), "args": args})
+
+@contextmanager
+def span(cat, name, **args):
+    """Misst einen Abschnitt. cat: stage | http | parse | write (frei wählbar); s.set(...) ergänzt Attribute."""
+    if not ENABLED:
+        yield _NULL
+        return
+    s = Span(args)
+    t0 = time.perf_counter()
+    try:
+        yield s
+    except BaseException as e:
+        s.args["error"] = type(e).__name__
+        raise
+    finally:
+        _record(cat, name, t0, time.perf_counter(), s.args)
+
+@contextmanager
+def stage(name, **args):
+    """Span der Kategorie "stage"; wird zusätzlich profiliert, wenn PROFILE passt."""
+    if not ENABLED:
+        yield _NULL
+        return
+    prof = _start_profiler(name) if _profile_wanted(name) else None
+    s = _NULL
+    try:
+        with span("stage", name, **args) as s:
+            yield s
+    finally:
+        if prof is not None:
+            s.set(profile=str(_stop_profiler(prof, name)))
+
+def traced(name=None, cat="stage"):
+    """Decorator-Variante von stage()/span() für ganze Funktionen (z. B. main)."""
+    def deco(fn):
+        label = name or f"{fn.__module__}.{fn.__name__}".replace("__main__.", f"{PROG}.")
+        @wraps(fn)
+        def wrapper(*a, **kw):
+            if not ENABLED:
+                return fn(*a, **kw)
+            ctx = stage(label) if cat == "stage" else span(cat, label)
+            with ctx:
+                return fn(*a, **kw)
+        return wrapper
+    return deco
+
+# -------------------------- HTTP / Dateien -------------------------- #
+_NUM = re.compile(r"^\d+$")
+
+def url_class(url):
+    """Gruppiert URLs für die Summary: IDs -> {id}, kleine Zahlen -> {n}, Query nur mit Schlüsseln."""
+    u = urlsplit(url)
+    parts = ["{id}" if _NUM.match(p) and len(p) >= 5 else "{n}" if _NUM.match(p) else p
+             for p in u.path.split("/")]
+    path = "/".join(parts)
+    if path.startswith("/v1/"):
+        path = path[3:]
+    keys = sorted({kv.split("=", 1)[0] for kv in u.query.split("&") if kv})
+    return f"{u.hostname or ''}{path}" + (f"?{','.join(keys)}" if keys else "")
+
+def http_span(url, **args):
+    """span("http", ...) mit URL-Klasse als Name; Aufrufer setzt status/bytes/cache."""
+    return span("http", url_class(url), url=url, **args)
+
+def file_class(path):
+    """Gruppiert Dateinamen für die Summary: 2015.tsv -> {n}.tsv, playoffs-2015.tsv -> playoffs-{n}.tsv."""
+    return re.sub(r"\d+", "{n}", Path(path).name)
+
+def write_bytes(path, data: bytes, touch=False):
+    """outputs.write_bytes mit write-Span (Bytes, changed): atomar, nur bei geändertem Inhalt."""
+    path = Path(path)
+    with span("write", file_class(path), path=str(path), bytes=len(data)) as s:
+        changed = outputs.write_bytes(path, data, touch)
+        s.set(changed=changed)
+    return changed
+
+def write_text(path, text, encoding="utf-8", touch=False):
+    """write_bytes für Text."""
+    return write_bytes(path, text.encode(encoding), touch)
+
+@contextmanager
+def open_write(path, newline=None, encoding="utf-8", mode="w", touch=False):
+    """outputs.open_write mit write-Span ("w" oder "a"); Bytes = Dateigröße beim Schließen."""
+    path = Path(path)
+    with span("write", file_class(path), path=str(path)) as s:
+        w = outputs.open_write(path, newline, encoding, mode, touch)
+        with w as f:
+            yield f
+        if ENABLED:
+            s.set(bytes=path.stat().st_size, changed=w.changed)
+
+# -------------------------- Profiler -------------------------- #
+def _profile_wanted(name):
+    if not PROFILE:
+        return False
+    short = name.rsplit(".", 1)[-1]
+    return "all" in PROFILE or name in PROFILE or short in PROFILE or name.split(".", 1)[0] in PROFILE
+
+class _Sampler:
+    """Minimaler Sampling-Profiler: sampelt den startenden Thread alle PROFILE_INTERVAL Sekunden."""
+    def __init__(self, interval):
+        self.interval = interval
+        self.stacks = Counter()
+        self.tid = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="tracing-sampler", daemon=True)
+
+    def enable(self):
+        self._thread.start()
+
+    def disable(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            f = sys._current_frames().get(self.tid)
+            stack = []
+            while f is not None:
+                c = f.f_code
+                stack.append(f"{c.co_name} ({Path(c.co_filename).name}:{c.co_firstlineno})")
+                f = f.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def dump(self, base):
+        folded = base.with_suffix(".folded")
+        folded.write_text("".join(f"{k} {v}\n" for k, v in self.stacks.most_common()), encoding="utf-8")
+        total = sum(self.stacks.values()) or 1
+        self_cnt, incl = Counter(), Counter()
+        for k, v in self.stacks.items():
+            frames = k.split(";")
+            self_cnt[frames[-1]] += v
+            for fr in set(frames):
+                incl[fr] += v
+        lines = [f"{total} Samples à {self.interval * 1000:.1f} ms", "", "self%   incl%   Funktion"]
+        for fr, v in self_cnt.most_common(30):
+            lines.append(f"{100 * v / total:5.1f}   {100 * incl[fr] / total:5.1f}   {fr}")
+        base.with_suffix(".txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return folded
+
+def _start_profiler(name):
+    global _PROFILE_ACTIVE
+    with _PROFILE_LOCK:
+        if _PROFILE_ACTIVE:
+            return None
+        _PROFILE_ACTIVE = True
+    prof = _Sampler(PROFILE_INTERVAL) if PROFILE_MODE == "sample" else cProfile.Profile()
+    prof.enable()
+    return prof
+
+def _stop_profiler(prof, name):
+    global _PROFILE_ACTIVE
+    prof.disable()
+    with _PROFILE_LOCK:
+        _PROFILE_ACTIVE = False
+        _PROFILE_SEQ[name] += 1
+        n = _PROFILE_SEQ[name]
+    base = _trace_path().with_suffix("")
+    base = base.with_name(f"{base.name}.{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}.{n}.x")
+    base.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(prof, _Sampler):
+        out = prof.dump(base)
+    else:
+        out = base.with_suffix(".prof")
+        prof.dump_stats(str(out))
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).strip_dirs().sort_stats("cumulative").print_stats(30)
+        base.with_suffix(".txt").write_text(buf.getvalue(), encoding="utf-8")
+    _OUTPUTS.append(out)
+    return out
+
+# -------------------------- Ausgabe -------------------------- #
+_PATH = None
+
+def _trace_path():
+    global _PATH
+    if _PATH is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{PROG}-{stamp}-{os.getpid()}.json"
+        if TRACE.endswith(".json"):
+            _PATH = Path(TRACE)
+        elif TRACE and TRACE.lower() not in ("1", "true", "yes", "on"):
+            _PATH = Path(TRACE) / name
+        else:
+            _PATH = Path("traces") / name
+    return _PATH
+
+def summary():
+    """[(cat, name, n, total_ms, mean_ms, p95_ms, max_ms, bytes, cache_hits, retries, errors)], Kategorien in CAT_ORDER."""
+    groups = defaultdict(list)
+    for e in _EVENTS:
+        groups[(e["cat"], e["name"])].append(e)
+    rows = []
+    for (cat, name), evs in groups.items():
+        durs = sorted(e["dur"] / 1000.0 for e in evs)
+        a = [e["args"] for e in evs]
+        rows.append((cat, name, len(evs), sum(durs), sum(durs) / len(durs),
+                     durs[min(len(durs) - 1, int(0.95 * len(durs)))], durs[-1],
+                     sum(x.get("bytes") or 0 for x in a),
+                     sum(1 for x in a if x.get("cache")),
+                     sum((x.get("attempts") or 1) - 1 for x in a),
+                     sum(1 for x in a if x.get("error") or (x.get("status") or 0) >= 400)))
+    order = {c: i for i, c in enumerate(CAT_ORDER)}
+    rows.sort(key=lambda r: (order.get(r[0], len(order)), -r[3]))
+    return rows
+
+def print_summary(rows, limit=15, file=None):
+    file = file or sys.stdout
+    print(f"{'cat':<6} {'name':<44} {'n':>6} {'total ms':>10} {'mean':>8} {'p95':>8} {'max':>8} {'KB':>9} {'cache':>6} {'retry':>6} {'err':>4}", file=file)
+    shown = Counter()
+    for cat, name, n, tot, mean, p95, mx, nbytes, hits, retries, errs in rows:
+        shown[cat] += 1
+        if shown[cat] > limit:
+            continue
+        print(f"{cat:<6} {name[:44]:<44} {n:>6} {tot:>10.1f} {mean:>8.2f} {p95:>8.2f} {mx:>8.2f} "
+              f"{(f'{nbytes / 1024:.1f}' if nbytes else ''):>9} {hits or '':>6} {retries or '':>6} {errs or '':>4}", file=file)
+    for cat, k in shown.items():
+        if k > limit:
+            print(f"{cat:<6} … {k - limit} weitere", file=file)
+
+def _flush():
+    _record("run", PROG, _T0, time.perf_counter(), {"argv": sys.argv[1:]})
+    if _RUN_PROFILER is not None:
+        _stop_profiler(_RUN_PROFILER, PROG)
+    path = _trace_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = summary()
+    meta = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": n}}
+            for tid, n in _THREADS.items()]
+    doc = {"traceEvents": meta + _EVENTS, "displayTimeUnit": "ms",
+           "otherData": {"prog": PROG, "argv": sys.argv[1:], "profiles": [str(p) for p in _OUTPUTS],
+                         "summary": [dict(zip(("cat", "name", "n", "total_ms", "mean_ms", "p95_ms", "max_ms",
+                                               "bytes", "cache_hits", "retries", "errors"), r)) for r in rows]}}
+    path.write_text(json.dumps(doc, ensure_ascii=False, default=str), encoding="utf-8")
+    print(f"── Trace {path} ({len(_EVENTS)} Spans)")
+    print_summary(rows)
+    for p in _OUTPUTS:
+        print(f"── Profil {p}")
+
+_RUN_PROFILER = None
+if ENABLED:
+    if _profile_wanted(PROG):
+        _RUN_PROFILER = _start_profiler(PROG)
+    atexit.register(_flush)
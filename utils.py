@@ -4,13 +4,22 @@ from urllib.request import urlopen
 import re
 import requests
 from cookieString import cookies
+import tracing
+
+#loads a page with the league cookies and parses it as soup
+#request and html parsing are traced separately (see tracing.py)
+def get_soup(url) :
+	with tracing.http_span(url) as sp:
+		page = requests.get(url, cookies=cookies)
+		sp.set(status=page.status_code, bytes=len(page.content))
+		page.close()
+	with tracing.span('parse', tracing.url_class(url), url=url):
+		return bs(page.text, 'html.parser')
 
 #gets the total number of players in a given season
 def get_number_of_owners(leagueID, season) :
 	owners_url = 'https://fantasy.nfl.com/league/' + leagueID + '/history/' + season + '/owners'
-	owners_page = requests.get(owners_url, cookies=cookies)
-	owners_html = owners_page.text
-	owners_soup = bs(owners_html, 'html.parser')
+	owners_soup = get_soup(owners_url)
 	number_of_owners = len(owners_soup.find_all('tr', class_ = re.compile('team-')))
 	return number_of_owners
 
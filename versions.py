@@ -0,0 +1,141 @@
+# versions.py
+# Versionierte Deltas für public/data – Clients mit Version N-1 laden nur die geänderten Zeilen statt ganzer Dateien.
+#   public/data/versions/index.json      {"version", "min_base", "files": {pfad: sha}, "deltas": [{version, file, bytes}]}
+#   public/data/versions/deltas/<N>.json {"version": N, "base": N-1, "files": {pfad: Patch}}
+# Patch je Zeilen-Array (TRACKED): {"length": L, "rows": [[i, zeile], ...], "sha": ...}  -> arr.length = L; arr[i] = zeile
+#   {"refetch": true, "sha": ...}  Datei komplett neu laden (Patch wäre größer als die Datei)
+#   {"deleted": true}              Datei entfernt
+# Client: index.json holen; eigene Version < min_base -> alles neu laden; sonst Deltas (eigene+1 .. version) anwenden
+# und für nicht versionierte Dateien nur die laden, deren sha sich geändert hat.
+# Kompaktierung: nach DELTA_COMPACT_EVERY Deltas (oder wenn sie zusammen größer als die Dateien sind) werden die
+# älteren Deltas gelöscht – die aktuellen Dateien sind der Snapshot, nur das neueste Delta bleibt.
+import hashlib, json, os, threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+
+import tracing
+
+PUBLIC_DIR = Path("public/data")
+VERSIONS_DIR = PUBLIC_DIR / "versions"
+INDEX_FILE = VERSIONS_DIR / "index.json"
+# Zeilen-Arrays, die zwischen Versionen als Patch ausgeliefert werden (Pfade relativ zu PUBLIC_DIR)
+TRACKED = ("processed/seasons/*/matchups.json", "processed/seasons/*/players_games.json",
+           "processed/seasons/*/weekly_standings.json", "league/elo_history.json")
+COMPACT_EVERY = int(os.getenv("DELTA_COMPACT_EVERY", "20"))
+_LOCK = threading.Lock()   # parallele Schritte (pipeline.py) veröffentlichen nacheinander
+
+def _sha(data: bytes):
+    return hashlib.sha1(data).hexdigest()[:16]
+
+def _file_sha(path: Path):
+    h = hashlib.sha1()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+def _rel(path: Path):
+    return path.relative_to(PUBLIC_DIR).as_posix()
+
+def is_tracked(rel: str):
+    return any(fnmatch(rel, pat) for pat in TRACKED)
+
+UNVERSIONED = ("versions/", "bundle/", "manifest.json")   # bundle/ + manifest.json: etl/bundle.py (Hash-Dateinamen)
+
+def _files():
+    """Alle veröffentlichten Dateien außer UNVERSIONED (relativer Pfad -> Path)."""
+    if not PUBLIC_DIR.exists():
+        return {}
+    return {_rel(p): p for p in sorted(PUBLIC_DIR.rglob("*"))
+            if p.is_file() and not _rel(p).startswith(UNVERSIONED)}
+
+def load_index():
+    if INDEX_FILE.exists():
+        try:
+            return json.loads(INDEX_FILE.read_text(encoding="utf-8"))
+        except ValueError:
+            pass
+    return {"version": 0, "min_base": 0, "files": {}, "deltas": []}
+
+def diff_rows(old, new):
+    """Positionsweiser Patch zweier Zeilen-Arrays (angehängte Wochen landen am Ende -> kleine Patches)."""
+    return {"length": len(new), "rows": [[i, row] for i, row in enumerate(new) if i >= len(old) or old[i] != row]}
+
+def make_patch(old_bytes, new_bytes):
+    if new_bytes is None:
+        return {"deleted": True}
+    sha = _sha(new_bytes)
+    old = json.loads(old_bytes) if old_bytes is not None else []
+    new = json.loads(new_bytes)
+    if not isinstance(old, list) or not isinstance(new, list):
+        return {"refetch": True, "sha": sha}
+    patch = diff_rows(old, new)
+    patch["sha"] = sha
+    if len(json.dumps(patch, ensure_ascii=False).encode("utf-8")) >= len(new_bytes):
+        return {"refetch": True, "sha": sha}
+    return patch
+
+def publish_version(old_tracked, label=""):
+    """
+    Vergleicht den aktuellen Stand von PUBLIC_DIR mit dem Index und schreibt ggf. Version N+1.
+    old_tracked: {rel: bytes} der versionierten Dateien *vor* dem Schreiben (Basis der Zeilen-Patches).
+    """
+    index = load_index()
+    paths = _files()
+    shas = {rel: _file_sha(p) for rel, p in paths.items()}   # nur Hashes im Speicher, Inhalte bei Bedarf
+    if shas == index["files"]:
+        return index["version"]
+
+    version = index["version"] + 1
+    patches = {}
+    for rel in sorted(set(shas) | set(index["files"])):
+        if not is_tracked(rel) or shas.get(rel) == index["files"].get(rel):
+            continue
+        old, known = old_tracked.get(rel), index["files"].get(rel)
+        if known is not None and (old is None or _sha(old) != known):
+            # Basis stimmt nicht mit Version N-1 überein (außerhalb von publishing() geändert)
+            patches[rel] = {"refetch": True, "sha": shas[rel]} if rel in shas else {"deleted": True}
+            continue
+        with tracing.span("parse", "delta", file=rel):
+            patches[rel] = make_patch(old if known is not None else None,
+                                      paths[rel].read_bytes() if rel in paths else None)
+
+    deltas, min_base = index["deltas"], index["min_base"]
+    tracked_bytes = sum(p.stat().st_size for rel, p in paths.items() if is_tracked(rel))
+    if len(deltas) >= COMPACT_EVERY or sum(d["bytes"] for d in deltas) > tracked_bytes:
+        # Kompaktierung: die aktuellen Dateien sind der Snapshot, ältere Deltas werden überflüssig
+        for d in deltas:
+            (VERSIONS_DIR / d["file"]).unlink(missing_ok=True)
+        deltas, min_base = [], version - 1
+    if index["version"] == 0:
+        min_base = version   # erste Version: es gibt noch keine Basis für ein Delta
+    else:
+        payload = json.dumps({"version": version, "base": version - 1, "label": label, "files": patches},
+                             ensure_ascii=False, separators=(",", ":"))
+        name = f"deltas/{version}.json"
+        (VERSIONS_DIR / "deltas").mkdir(parents=True, exist_ok=True)
+        tracing.write_text(VERSIONS_DIR / name, payload)
+        deltas.append({"version": version, "file": name, "bytes": len(payload.encode("utf-8"))})
+
+    VERSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    index = {"version": version, "min_base": min_base,
+             "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+             "files": shas, "deltas": deltas}
+    tracing.write_text(INDEX_FILE, json.dumps(index, ensure_ascii=False, indent=1))
+    return version
+
+@contextmanager
+def publishing(label="", patterns=TRACKED):
+    """
+    Klammer um einen Veröffentlichungs-Schritt (build_json, compute_elo):
+    merkt sich die versionierten Dateien vorher (nur die zu patterns passenden, die der Schritt schreibt)
+    und schreibt danach die neue Version.
+    """
+    with _LOCK:
+        old = {rel: p.read_bytes() for rel, p in _files().items()
+               if is_tracked(rel) and any(fnmatch(rel, pat) for pat in patterns)}
+        yield
+        with tracing.span("write", "versions", label=label) as sp:
+            sp.set(version=publish_version(old, label))